@@ -3,34 +3,50 @@
 ###############################################################################
 from flask import (
     Flask, request, render_template, send_from_directory,
-    redirect, session, url_for
+    redirect, session, url_for, jsonify, Response, stream_with_context, g,
+    send_file
 )
-import os, json, random, zipfile, re
+import os, random
 import requests
-import base64
+from werkzeug.utils import secure_filename
 
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
 from dotenv import load_dotenv
 load_dotenv()
 from urllib.parse import urlencode
 
 
-from resume_parser      import extract_text_from_pdf, parse_resume_text
-from resume_precleaner  import standardize_resume_text               # your cleaner
+from resume_parser      import parse_resume_text
+from portfolio_pipeline import generate_portfolio, portfolio_entries
+from job_queue          import JobQueue, DONE
+from workspace          import WorkspaceManager
+from parse_cache        import ParseCache
+from user_store         import UserStore
+from template_registry  import configure_flask, dev_mode, get_environment, warm_up
+from asset_cache        import AssetCache, asset_response
+from render_cache       import RenderCache
+from precompress        import precompress_tree
+from image_pipeline     import ImageCache
+from metrics            import REGISTRY as metrics, instrument_flask, register_cache
+from zip_stream         import iter_zip
+from github_push        import GitHubPusher, GitHubError
+from job_feed           import JobFeed
+from session_store      import SessionStore, new_sid, valid_sid
+from resume_analyzer.scorer import score_resume, parse_resume
+from resume_analyzer.matcher import JobMatcher
+from resume_analyzer.comparator import Comparator
 
 # ─────────────────────────────  CONFIG  ─────────────────────────────
 app = Flask(__name__)
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "fallback_secret")
+configure_flask(app)      # template auto-reload only in dev, bytecode cache otherwise
+instrument_flask(app)     # per-route latency / status counters, served at /metrics (METRICS_DIR)
 
 UPLOAD_FOLDER    = "uploads"
-GENERATED_FOLDER = "generated_portfolio"
-ZIP_FOLDER       = "zips"
+WORKSPACE_FOLDER = "workspaces"          # per-generation output trees
 TEMPLATES_FOLDER = "templates"
-USER_FILE        = "users.json"
+USER_FILE        = "users.json"            # legacy store, imported once
+USER_DB          = "users.sqlite3"
 
 from flask_mail import Mail, Message
 
@@ -43,20 +59,88 @@ app.config['MAIL_PASSWORD'] = 'rwwj didl cjyd yhin'           # use App Password
 mail = Mail(app)
 
 
-for folder in (UPLOAD_FOLDER, GENERATED_FOLDER, ZIP_FOLDER):
+for folder in (UPLOAD_FOLDER, WORKSPACE_FOLDER):
     os.makedirs(folder, exist_ok=True)
 
-env = Environment(loader=FileSystemLoader('templates'))
+workspaces = WorkspaceManager(
+    WORKSPACE_FOLDER,
+    max_age=float(os.getenv("WORKSPACE_MAX_AGE_HOURS", "24")) * 3600,
+    max_bytes=int(os.getenv("WORKSPACE_QUOTA_MB", "512")) * 1024 * 1024,
+)
+
+env = get_environment()
 env.globals.update(url_for=url_for)
+if not dev_mode():
+    # Compile every theme page now so the first request (and every worker
+    # forked from a --preload master) starts warm.
+    warm_up(env)
+    warm_up(app.jinja_env)
+    # theme CSS/JS get their .gz / .br siblings once per deploy, not per response
+    for theme_dir in os.listdir(TEMPLATES_FOLDER):
+        if theme_dir.startswith("template_"):
+            precompress_tree(os.path.join(TEMPLATES_FOLDER, theme_dir, "static"))
+
+# Parsed résumés keyed on PDF bytes, shared by all workers (PARSE_CACHE_MB)
+parse_cache = ParseCache(
+    os.path.join("cache", "parse_cache.sqlite3"),
+    max_bytes=int(os.getenv("PARSE_CACHE_MB", "64")) * 1024 * 1024,
+)
+
+# Theme CSS / static files held in memory, revalidated by mtime (ASSET_CACHE_MB)
+assets = AssetCache(max_bytes=int(os.getenv("ASSET_CACHE_MB", "32")) * 1024 * 1024)
+
+# Rendered portfolio pages keyed on (template, data fingerprint) (RENDER_CACHE_MB)
+page_cache = RenderCache(max_bytes=int(os.getenv("RENDER_CACHE_MB", "64")) * 1024 * 1024)
+
+# Resized / re-encoded profile photos keyed on upload bytes (PHOTO_CACHE_MB)
+image_cache = ImageCache(os.path.join("cache", "images"),
+                         max_bytes=int(os.getenv("PHOTO_CACHE_MB", "256")) * 1024 * 1024)
+
+register_cache("parse", parse_cache, shared=True)
+register_cache("assets", assets)
+register_cache("pages", page_cache)
+register_cache("photos", image_cache, shared=True)
+
+# Background generation jobs (JOB_WORKERS threads, JOB_CPU_WORKERS processes)
+jobs = JobQueue()
+
+# RemoteOK listings cached in SQLite, refreshed in the background (JOB_FEED_TTL seconds)
+job_feed = JobFeed(os.path.join("cache", "job_feed.sqlite3"), ttl=float(os.getenv("JOB_FEED_TTL", "900")))
+# TF-IDF index of the listings for résumé matching, re-synced on every refresh
+job_matcher = JobMatcher(os.path.join("cache", "job_index"))
+job_feed.on_refresh(job_matcher.sync)
+job_feed.start()
+JOBS_PER_PAGE = 20
+MAX_COMPARE = int(os.getenv("MAX_COMPARE", "500"))
+
+# Per-session data (parsed résumé) kept server-side; the cookie only holds a sid
+session_data = SessionStore(
+    os.path.join("cache", "sessions.sqlite3"),
+    ttl=float(os.getenv("SESSION_DATA_TTL_HOURS", "168")) * 3600,
+)
 GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
 GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
 
+def session_id(create=False):
+    """This browser session's server-side data key (made on first write)."""
+    sid = session.get("sid")
+    if not valid_sid(sid):
+        sid = None
+        if create:
+            sid = session["sid"] = new_sid()
+    return sid
+
+def load_parsed_data():
+    """The session's parsed résumé, read from session_data at most once per request."""
+    if "parsed_data" not in g:
+        legacy = session.pop("parsed_data", None)   # cookies issued before the server-side store
+        if legacy:
+            session_data.set(session_id(create=True), "parsed_data", legacy)
+        g.parsed_data = legacy or session_data.get(session_id(), "parsed_data")
+    return g.parsed_data
+
 def get_parsed_data():
-    json_path = "parsed_data.json"
-    if os.path.exists(json_path):
-        with open(json_path, "r") as f:
-            return json.load(f)
-    data = session.get("parsed_data")
+    data = load_parsed_data()
     if data:
         return data
     # fallback — redirect to home with a message
@@ -66,15 +150,7 @@ def get_parsed_data():
 
 
 # ─────────────────────────────  HELPERS  ────────────────────────────
-def load_users():
-    if not os.path.exists(USER_FILE):
-        return {}
-    with open(USER_FILE, "r") as fh:
-        return json.load(fh)
-
-def save_users(users):
-    with open(USER_FILE, "w") as fh:
-        json.dump(users, fh, indent=2)
+users = UserStore(USER_DB, legacy_json=USER_FILE)
 
 def current_theme(default="template_01"):
     return session.get("theme", default)
@@ -85,56 +161,40 @@ def save_clean_text(text: str, name="cleaned_resume.txt") -> str:
         fh.write(text)
     return path
 
-# Regex for hyperlinks in cleaner + PDF builder
-URL_RX = re.compile(r"(https?://[^\s]+|www\.[^\s]+)", re.I)
-
-def create_cleaned_resume_pdf(text: str, pdf_path: str) -> None:
-    """Write cleaned text to PDF and embed clickable hyperlinks."""
-    c = canvas.Canvas(pdf_path, pagesize=A4)
-    width, height = A4
-    y = height - 40
-    c.setFont("Helvetica", 10)
-
-    for raw in text.splitlines():
-        if y < 40:
-            c.showPage()
-            y = height - 40
-            c.setFont("Helvetica", 10)
-
-        urls = list(URL_RX.finditer(raw))
-        if not urls:                   # simple line (no link)
-            c.drawString(40, y, raw)
-        else:
-            x = 40
-            cursor = 0
-            for m in urls:
-                before = raw[cursor:m.start()]
-                url    = m.group(0)
-                after  = ""            # only draw first link per line for simplicity
-                # draw part before link
-                c.drawString(x, y, before)
-                x += c.stringWidth(before, "Helvetica", 10)
-                # draw the link (blue, underlined)
-                c.setFillColor(colors.blue)
-                c.drawString(x, y, url)
-                link_w = c.stringWidth(url, "Helvetica", 10)
-                c.linkURL(url if url.startswith("http") else f"https://{url}",
-                          (x, y-1, x+link_w, y+9))
-                c.line(x, y-1, x+link_w, y-1)
-                c.setFillColor(colors.black)
-                x += link_w
-                cursor = m.end()
-            # any remainder of line (after last link)
-            if cursor < len(raw):
-                c.drawString(x, y, raw[cursor:])
-        y -= 14
-    c.save()
-
 def load_template_css(theme) -> str:
-    css_path = os.path.join(TEMPLATES_FOLDER, theme, "style.css")
-    if os.path.exists(css_path):
-        return open(css_path, encoding="utf-8").read()
-    return ""
+    return assets.text(os.path.join(TEMPLATES_FOLDER, theme, "style.css"))
+
+def current_workspace():
+    """The workspace of this session's latest generation, or None."""
+    return workspaces.get(session.get("workspace_id"))
+
+def _wants_async() -> bool:
+    """Clients opt in to background generation with ?async=1 or an Accept: JSON header."""
+    if request.values.get("async") in ("1", "true", "yes"):
+        return True
+    return request.accept_mimetypes.best == "application/json"
+
+def _generation_job(job, ws, resume_path, theme, photo_path):
+    # url_for in the theme templates needs a request context
+    with app.test_request_context(), metrics.stages("generate", then=job.set_stage) as on_stage:
+        result = generate_portfolio(resume_path, theme, env=env, css=load_template_css(theme),
+                                    photo_path=photo_path, image_cache=image_cache,
+                                    cache=parse_cache,
+                                    render_cache=page_cache,
+                                    run_cpu=job.run_cpu, on_stage=on_stage,
+                                    **ws.folders())
+    result["workspace_id"] = ws.id
+    return result
+
+def _bind_generation(result):
+    """Make a finished generation the current portfolio of this session."""
+    session["theme"] = result["theme"]
+    session_data.set(session_id(create=True), "parsed_data", result["data"])
+    g.parsed_data = result["data"]
+    session["workspace_id"] = result["workspace_id"]
+    if session.get("user"):
+        users.add_resume(session["user"], {"filename": result["resume"], "template": result["theme"],
+                                           "workspace": result["workspace_id"]})
 
 def render_page(page, **ctx):
     theme = current_theme()
@@ -142,8 +202,14 @@ def render_page(page, **ctx):
     ctx.setdefault("year", datetime.now().year)
     tpl = f"{theme}/{page}.html"
     if os.path.exists(os.path.join(TEMPLATES_FOLDER, tpl)):
-        return render_template(tpl, **ctx)
-    return render_template(f"{page}.html", **ctx)
+        return render_cached(tpl, **ctx)
+    return render_cached(f"{page}.html", **ctx)
+
+def render_cached(template_name, **ctx):
+    """render_template through page_cache, keyed on the template and the whole context."""
+    if not isinstance(ctx.get("data", {}), dict):     # no résumé yet – nothing worth caching
+        return render_template(template_name, **ctx)
+    return page_cache.render(template_name, ctx, lambda: render_template(template_name, **ctx))
 
 # ───────────────────────  AUTH / BASIC ROUTES  ──────────────────────
 @app.route("/")
@@ -167,56 +233,35 @@ def generate():
         theme = random.choice(themes) if themes else "template_01"
     session["theme"] = theme
 
-    resume_path = os.path.join(UPLOAD_FOLDER, resume_file.filename)
+    ws = workspaces.create()
+    resume_path = os.path.join(ws.upload_dir, secure_filename(resume_file.filename) or "resume.pdf")
     resume_file.save(resume_path)
 
-    photo_filename = None
+    # the raw upload stays out of the site; image_pipeline writes the sized variants
+    photo_path = None
     if photo_file and photo_file.filename:
-        photo_filename = "profile.jpg"
-        photo_path = os.path.join(GENERATED_FOLDER, photo_filename)
+        photo_path = os.path.join(ws.upload_dir, "photo_upload")
         photo_file.save(photo_path)
 
-    raw_text = extract_text_from_pdf(resume_path)
-    cleaned_text = standardize_resume_text(raw_text)
-    data = parse_resume_text(cleaned_text)
-    if not data:
-        return "❌ Resume parsing failed.", 400
-    data["photo"] = photo_filename
-    session["parsed_data"] = data
-
-    # Save cleaned resume files
-    with open(os.path.join(UPLOAD_FOLDER, "cleaned_resume.txt"), "w", encoding="utf-8") as fh:
-        fh.write(cleaned_text)
-    create_cleaned_resume_pdf(cleaned_text, os.path.join(UPLOAD_FOLDER, "cleaned_resume.pdf"))
-
-    # Jinja context
-    ctx = {
-        "data": data,
-        "template": theme,
-        "year": datetime.now().year,
-        "css": load_template_css(theme),
-        "is_static": True  # Flag for navbar.html
-    }
-
-    # List of portfolio pages
-    pages = ["home", "skills", "projects", "experience", "education", "certificates", "languages"]
-
-    # Generate all pages
-    for page in pages:
-        rendered = env.get_template(f"{theme}/{page}.html").render(**ctx)
-        with open(os.path.join(GENERATED_FOLDER, f"{page}.html"), "w", encoding="utf-8") as f:
-            f.write(rendered)
-
-    session["latest_portfolio_folder"] = GENERATED_FOLDER
-
-    # Create ZIP of generated portfolio
-    zip_path = os.path.join(ZIP_FOLDER, "portfolio.zip")
-    with zipfile.ZipFile(zip_path, "w") as z:
-        for page in pages:
-            z.write(os.path.join(GENERATED_FOLDER, f"{page}.html"), arcname=f"{page}.html")
-        if photo_filename:
-            z.write(os.path.join(GENERATED_FOLDER, photo_filename), arcname=photo_filename)
-        return f"""
+    if _wants_async():
+        job = jobs.submit(_generation_job, ws, resume_path, theme, photo_path)
+        session["job_ids"] = (session.get("job_ids") or [])[-9:] + [job.id]
+        return jsonify({"job_id": job.id, "status": job.status,
+                        "status_url": url_for("job_status", job_id=job.id)}), 202
+
+    try:
+        with metrics.stages("generate") as on_stage:
+            result = generate_portfolio(resume_path, theme, env=env, css=load_template_css(theme),
+                                        photo_path=photo_path, image_cache=image_cache,
+                                        cache=parse_cache,
+                                        render_cache=page_cache, on_stage=on_stage,
+                                        **ws.folders())
+    except ValueError as e:
+        return f"❌ {e}", 400
+    result["workspace_id"] = ws.id
+    _bind_generation(result)
+
+    return f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -361,25 +406,70 @@ def generate():
 </html>
 """
 
+# ───────────────────────────  JOB ROUTES  ───────────────────────────
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None or job_id not in (session.get("job_ids") or []):
+        return jsonify({"error": "Job not found."}), 404
+
+    payload = job.to_dict()
+    if job.status == DONE:
+        if session.get("bound_job") != job.id:
+            _bind_generation(job.result)
+            session["bound_job"] = job.id
+        payload["results"] = {
+            "portfolio": url_for("serve_portfolio", filename="home.html"),
+            "zip": url_for("download", filename="portfolio.zip"),
+            "cleaned_txt": url_for("download_cleaned"),
+            "cleaned_pdf": url_for("download_cleaned_pdf"),
+            "push_to_github": url_for("push_to_github"),
+        }
+    return jsonify(payload)
+
+@app.route("/cache/stats")
+def cache_stats():
+    return jsonify({"parse_cache": parse_cache.stats(), "assets": assets.stats(),
+                    "pages": page_cache.stats(), "photos": image_cache.stats(),
+                    "sessions": session_data.stats()})
+
 # ─────────────────────────  DOWNLOAD ROUTES  ─────────────────────────
+@app.route("/download/<path:filename>")
+def download(filename):
+    ws = current_workspace()
+    if ws is None or filename != "portfolio.zip" or not os.path.isdir(ws.site_dir):
+        return "Portfolio ZIP not found.", 404
+    # Streamed while it is built: no staging copy, no archive on disk
+    return Response(stream_with_context(iter_zip(portfolio_entries(ws.site_dir))),
+                    mimetype="application/zip",
+                    headers={"Content-Disposition": "attachment; filename=portfolio.zip"})
+
 @app.route("/download_cleaned")
 def download_cleaned():
-    path = os.path.join(UPLOAD_FOLDER, "cleaned_resume.txt")
-    if not os.path.exists(path):
+    ws = current_workspace()
+    if ws is None or not os.path.exists(ws.cleaned_txt):
         return "Cleaned file not found.", 404
-    return send_from_directory(UPLOAD_FOLDER, "cleaned_resume.txt", as_attachment=True)
+    return send_from_directory(ws.upload_dir, "cleaned_resume.txt", as_attachment=True)
 
 @app.route("/download_cleaned_pdf")
 def download_cleaned_pdf():
-    path = os.path.join(UPLOAD_FOLDER, "cleaned_resume.pdf")
-    if not os.path.exists(path):
+    ws = current_workspace()
+    if ws is None or not os.path.exists(ws.cleaned_pdf):
         return "Cleaned PDF not found.", 404
-    return send_from_directory(UPLOAD_FOLDER, "cleaned_resume.pdf", as_attachment=True)
+    return send_from_directory(ws.upload_dir, "cleaned_resume.pdf", as_attachment=True)
 
 # ─────────────────────  STATIC / PREVIEW ROUTES  ─────────────────────
 @app.route("/portfolio/<path:filename>")
 def serve_portfolio(filename):
-    return send_from_directory(GENERATED_FOLDER, filename)
+    ws = current_workspace()
+    if ws is None:
+        return "No portfolio generated yet.", 404
+    # Same URL, different workspace per session → always revalidate (cheap 304s)
+    resp = asset_response(assets, ws.site_dir, filename, cache_control="private, no-cache",
+                          precompressed=True)
+    if not isinstance(resp, tuple):
+        resp.vary.add("Cookie")
+    return resp
 from flask import request, redirect, flash
 from flask_mail import Message
 
@@ -412,7 +502,8 @@ def send_request():
 
 @app.route("/static_tpl/<theme>/<path:filename>")
 def serve_theme_static(theme, filename):
-    return send_from_directory(os.path.join(TEMPLATES_FOLDER, theme, "static"), filename)
+    return asset_response(assets, os.path.join(TEMPLATES_FOLDER, theme, "static"), filename,
+                          cache_control="public, max-age=3600", precompressed=True)
 from flask import Flask, render_template, request, redirect, url_for, flash, session
 # ... other imports ...
 
@@ -430,8 +521,7 @@ def login():
             return redirect(url_for('admin_dashboard.html'))
 
         # Case 2: Registered user login
-        users = load_users()
-        if username_or_email in users and users[username_or_email]["password"] == password:
+        if users.check_password(username_or_email, password):
             flash("Login Successful ✅", "success")
             session['user'] = username_or_email
             session['is_admin'] = False
@@ -446,29 +536,59 @@ def login():
 
 @app.route('/jobs')
 def job_board():
-    import requests
-    from bs4 import BeautifulSoup
-
-    # Example: RemoteOK scraping
-    url = "https://remoteok.com/remote-dev-jobs"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    q = request.args.get("q", "").strip()
+    page = request.args.get("page", 1, type=int) or 1
+    with metrics.timer("job_feed_query_seconds", searched=bool(q)):
+        pages = max(1, -(-job_feed.total(q) // JOBS_PER_PAGE))
+        page = min(max(page, 1), pages)       # ?page=999 → the last page, not an empty one
+        listings, total = job_feed.query(q, page=page, per_page=JOBS_PER_PAGE)
+    return render_template('job_board.html', jobs=listings, q=q,
+                           page=page, pages=pages, total=total)
 
-    jobs = []
-    for div in soup.find_all('tr', class_='job'):
-        title = div.find('h2')
-        company = div.find('h3')
-        link = div.get('data-href')
-        if title and company:
-            jobs.append({
-                'title': title.text.strip(),
-                'company': company.text.strip(),
-                'link': 'https://remoteok.com' + link if link else '#'
-            })
 
-    return render_template('job_board.html', jobs=jobs)
 
+@app.route('/jobs/matches')
+def job_matches():
+    """The listings closest to this session's parsed résumé, best first."""
+    data = load_parsed_data()
+    if not data:
+        return jsonify({"error": "Generate a portfolio first."}), 404
+    if not len(job_matcher) and job_feed.count():
+        job_matcher.sync(job_feed.all())     # index not built yet on this deployment
+    k = min(request.args.get("k", 10, type=int) or 10, 100)
+    return jsonify({"matches": job_matcher.match(data, k)})
+
+
+@app.route('/compare', methods=['POST'])
+def compare_resumes():
+    """Rank a stack of uploaded résumés against a requirement and each other."""
+    files = [f for f in request.files.getlist("resumes") if f and f.filename]
+    if not files:
+        return jsonify({"error": "Upload one or more résumés as 'resumes'."}), 400
+    if len(files) > MAX_COMPARE:
+        return jsonify({"error": f"At most {MAX_COMPARE} résumés per request."}), 413
+
+    ws = workspaces.create()
+    names, parsed, failed = [], [], []
+    for i, f in enumerate(files):
+        path = os.path.join(ws.upload_dir, f"{i:04d}_{secure_filename(f.filename) or 'resume.pdf'}")
+        f.save(path)
+        try:
+            parsed.append(parse_resume(path, parse_cache))
+            names.append(f.filename)
+        except ValueError as e:         # ExtractionError et al.: report it, rank the rest
+            failed.append({"file": f.filename, "error": str(e)})
+
+    k = min(request.values.get("k", 10, type=int) or 10, 100)
+    requirement = request.values.get("requirement", "").strip()
+    if not parsed:
+        return jsonify({"ranking": [], "similar_pairs": [], "failed": failed})
+    comparator = Comparator(parsed, names)
+    return jsonify({
+        "ranking": comparator.against(requirement, k) if requirement else [],
+        "similar_pairs": comparator.top_pairs(k),
+        "failed": failed,
+    })
 
 
 @app.route('/resume-analyzer', methods=['GET', 'POST'])
@@ -478,16 +598,37 @@ def resume_analyzer():
         resume_path = os.path.join("uploads", file.filename)
         file.save(resume_path)
 
-        score, data = score_resume(resume_path)
-
-        improved_path = resume_path.replace(".pdf", "_improved.docx")
-        improve_resume(resume_path, improved_path, data)
+        try:
+            score, data = score_resume(resume_path, request.form.get("mode"), cache=parse_cache)
+        except ValueError as e:
+            return f"❌ {e}", 400
+        if not isinstance(data, dict):
+            return f"❌ {data}", 400
 
+        # the DOCX is built on download, from the server-side copy of the data
+        session_data.set(session_id(create=True), "analysis", data)
         return render_template("analyze_result.html",
                                original_score=score,
                                resume_path=resume_path,
-                               improved_path=improved_path)
+                               improved_path=url_for("download_improved"))
     return render_template("resume_upload.html")
+
+@app.route('/resume-analyzer/improved.docx')
+def download_improved():
+    from io import BytesIO
+    from resume_analyzer.improver import improve_resume
+
+    sid = session_id()
+    data = session_data.get(sid, "analysis")
+    if not data:
+        return redirect(url_for("resume_analyzer"))
+    buf = BytesIO()
+    # sections unchanged since this session's last download are reused as-is
+    state = improve_resume(None, buf, data, previous=session_data.get(sid, "improver_sections"))
+    session_data.set(sid, "improver_sections", state)
+    buf.seek(0)
+    return send_file(buf, as_attachment=True, download_name="improved_resume.docx",
+                     mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
 @app.route('/resume-builder')
 def resume_builder():
     return render_template('resume_builder.html')  # or your actual filename
@@ -524,17 +665,15 @@ def register():
     if request.method == "POST":
         email = request.form["email"]
         password = request.form["password"]
-        users = load_users()
-        if email in users:
+        if not users.create(email, password=password):
             return "❌ User already exists.", 400
-        users[email] = {"password": password}
-        save_users(users)
         return redirect(url_for("login"))
     return render_template("register.html")
 
 
 @app.route("/logout")
 def logout():
+    session_data.delete(session_id())
     session.clear()
     return redirect(url_for("index"))
 @app.route("/github/login")
@@ -603,15 +742,7 @@ def github_callback():
     session["github_name"] = user_info.get("name") or user_info.get("login")
 
     # ✅ Auto-register GitHub users if not present
-    users = load_users()
-    if email not in users:
-        users[email] = {
-            "name": session["github_name"],
-            "password": None,
-            "role": "user",
-            "resumes": []
-        }
-        save_users(users)
+    users.create(email, name=session["github_name"], password=None, role="user")
 
     # ✅ FINAL RETURN — don't forget this
     return redirect(url_for("dashboard"))
@@ -624,55 +755,27 @@ def github_callback():
 def push_to_github():
     token = session.get("github_token")
     username = session.get("github_username")
-    folder = session.get("latest_portfolio_folder")
+    ws = current_workspace()
+    folder = ws.site_dir if ws else None
 
     if not token or not folder or not os.path.exists(folder):
         return "❌ You're not logged in with GitHub or no portfolio found."
 
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github+json"
-    }
-
     # Unique repo name with timestamp
     repo_name = f"portfolio-{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
-    # Step 1: Create the repository
-    create_repo = requests.post(
-        "https://api.github.com/user/repos",
-        headers=headers,
-        json={
-            "name": repo_name,
-            "description": "Portfolio created by AutoPortfolio",
-            "private": False
-        }
-    )
-
-    if create_repo.status_code != 201:
-        return f"❌ Repo creation failed: {create_repo.json()}"
-
-    # Step 2: Push each file in the generated portfolio folder
-    for root, _, files in os.walk(folder):
-        for file in files:
-            local_path = os.path.join(root, file)
-            rel_path = os.path.relpath(local_path, folder)
-            with open(local_path, "rb") as f:
-                content = base64.b64encode(f.read()).decode()
-
-            upload = requests.put(
-                f"https://api.github.com/repos/{username}/{repo_name}/contents/{rel_path}",
-                headers=headers,
-                json={
-                    "message": f"Add {rel_path}",
-                    "content": content
-                }
-            )
-
-            if upload.status_code not in [200, 201]:
-                return f"❌ Failed to push {rel_path}: {upload.json()}"
+    # One repo, one commit: blobs uploaded in parallel, then tree + commit + ref
+    try:
+        with metrics.stages("github_push") as on_stage, GitHubPusher(token) as pusher:
+            pushed = pusher.publish(repo_name, portfolio_entries(folder),
+                                    description="Portfolio created by AutoPortfolio",
+                                    message="Add portfolio", on_stage=on_stage)
+    except GitHubError as e:
+        return f"❌ Push to GitHub failed: {e} {e.body or ''}"
+    username, repo_name = pushed["owner"], pushed["name"]
 
     # ✅ Return success page with repo link
-        return f"""
+    return f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -793,6 +896,7 @@ def project_bank():
 
 @app.route("/github/full_logout")
 def github_full_logout():
+    session_data.delete(session_id())
     session.clear()
     return redirect("https://github.com/logout")
 
@@ -802,246 +906,250 @@ def github_full_logout():
 @app.route('/')
 def home():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/home.html', data=data)
+    return render_cached(f'{current_theme()}/home.html', data=data)
 
 @app.route('/skills')
 def skills():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/skills.html', data=data)
+    return render_cached(f'{current_theme()}/skills.html', data=data)
 
 @app.route('/projects')
 def projects():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/projects.html', data=data)
+    return render_cached(f'{current_theme()}/projects.html', data=data)
 
 @app.route('/experience')
 def experience():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/experience.html', data=data)
+    return render_cached(f'{current_theme()}/experience.html', data=data)
 
 @app.route('/education')
 def education():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/education.html', data=data)
+    return render_cached(f'{current_theme()}/education.html', data=data)
 
 @app.route('/certificates')
 def certificates():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/certificates.html', data=data)
+    return render_cached(f'{current_theme()}/certificates.html', data=data)
 
 @app.route('/languages')
 def languages():
     data = get_parsed_data()
-    return render_template(f'{current_theme()}/languages.html', data=data)
+    return render_cached(f'{current_theme()}/languages.html', data=data)
 
 
 
 @app.route('/')
 def home_04():
     data = get_parsed_data()
-    return render_template('template_04/home.html', data=data)
+    return render_cached('template_04/home.html', data=data)
 
 @app.route('/skills')
 def skills_04():
     if current_theme() != "template_04":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_04/skills.html', data=data)
+    return render_cached('template_04/skills.html', data=data)
 
 @app.route('/projects')
 def projects_04():
     if current_theme() != "template_04":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_04/projects.html', data=data)
+    return render_cached('template_04/projects.html', data=data)
 
 @app.route('/experience')
 def experience_04():
     if current_theme() != "template_04":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_04/experience.html', data=data)
+    return render_cached('template_04/experience.html', data=data)
 
 @app.route('/education')
 def education_04():
     if current_theme() != "template_04":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_04/education.html', data=data)
+    return render_cached('template_04/education.html', data=data)
 
 @app.route('/certificates')
 def certificates_04():
     if current_theme() != "template_04":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_04/certificates.html', data=data)
+    return render_cached('template_04/certificates.html', data=data)
 
 @app.route('/languages')
 def languages_04():
     if current_theme() != "template_04":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_04/languages.html', data=data)
+    return render_cached('template_04/languages.html', data=data)
 @app.route('/')
 def home_03():
     data = get_parsed_data()
-    return render_template('template_03/home.html', data=data)
+    return render_cached('template_03/home.html', data=data)
 
 @app.route('/skills')
 def skills_03():
     if current_theme() != "template_03":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_03/skills.html', data=data)
+    return render_cached('template_03/skills.html', data=data)
 
 @app.route('/projects')
 def projects_03():
     if current_theme() != "template_03":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_03/projects.html', data=data)
+    return render_cached('template_03/projects.html', data=data)
 
 @app.route('/experience')
 def experience_03():
     if current_theme() != "template_03":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_03/experience.html', data=data)
+    return render_cached('template_03/experience.html', data=data)
 
 @app.route('/education')
 def education_03():
     if current_theme() != "template_03":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_03/education.html', data=data)
+    return render_cached('template_03/education.html', data=data)
 
 @app.route('/certificates')
 def certificates_03():
     if current_theme() != "template_03":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_03/certificates.html', data=data)
+    return render_cached('template_03/certificates.html', data=data)
 
 @app.route('/languages')
 def languages_03():
     if current_theme() != "template_03":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_03/languages.html', data=data)
+    return render_cached('template_03/languages.html', data=data)
 
 @app.route('/')
 def home_02():
     data = get_parsed_data()
-    return render_template('template_02/home.html', data=data)
+    return render_cached('template_02/home.html', data=data)
 
 @app.route('/skills')
 def skills_02():
     if current_theme() != "template_02":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_02/skills.html', data=data)
+    return render_cached('template_02/skills.html', data=data)
 
 @app.route('/projects')
 def projects_02():
     if current_theme() != "template_02":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_02/projects.html', data=data)
+    return render_cached('template_02/projects.html', data=data)
 
 @app.route('/experience')
 def experience_02():
     if current_theme() != "template_02":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_02/experience.html', data=data)
+    return render_cached('template_02/experience.html', data=data)
 
 @app.route('/education')
 def education_02():
     if current_theme() != "template_02":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_02/education.html', data=data)
+    return render_cached('template_02/education.html', data=data)
 
 @app.route('/certificates')
 def certificates_02():
     if current_theme() != "template_02":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_02/certificates.html', data=data)
+    return render_cached('template_02/certificates.html', data=data)
 
 @app.route('/languages')
 def languages_02():
     if current_theme() != "template_02":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_02/languages.html', data=data)
+    return render_cached('template_02/languages.html', data=data)
 
 
 @app.route('/')
 def home_01():
     data = get_parsed_data()
-    return render_template('template_01/home.html', data=data)
+    return render_cached('template_01/home.html', data=data)
 
 @app.route('/skills')
 def skills_01():
     if current_theme() != "template_01":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_01/skills.html', data=data)
+    return render_cached('template_01/skills.html', data=data)
 
 @app.route('/projects')
 def projects_01():
     if current_theme() != "template_01":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_01/projects.html', data=data)
+    return render_cached('template_01/projects.html', data=data)
 
 @app.route('/experience')
 def experience_01():
     if current_theme() != "template_01":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_01/experience.html', data=data)
+    return render_cached('template_01/experience.html', data=data)
 
 @app.route('/education')
 def education_01():
     if current_theme() != "template_01":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_01/education.html', data=data)
+    return render_cached('template_01/education.html', data=data)
 
 @app.route('/certificates')
 def certificates_01():
     if current_theme() != "template_01":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_01/certificates.html', data=data)
+    return render_cached('template_01/certificates.html', data=data)
 
 @app.route('/languages')
 def languages_01():
     if current_theme() != "template_01":
         return redirect(url_for("home"))
     data = get_parsed_data()
-    return render_template('template_01/languages.html', data=data)
+    return render_cached('template_01/languages.html', data=data)
 
 
 
 
 def render_galaxy(section):
-    data = session.get("parsed_data")
+    data = load_parsed_data()
+
+    ws = current_workspace()
+    if ws is None:
+        return redirect("/")
 
     if not data:
-        path = os.path.join(UPLOAD_FOLDER, "cleaned_resume.txt")
+        path = ws.cleaned_txt
         if not os.path.exists(path):
             return redirect("/")
         with open(path, encoding="utf-8") as fh:
             cleaned_text = fh.read()
         data = parse_resume_text(cleaned_text)
 
-    photo_path = os.path.join(GENERATED_FOLDER, "profile.jpg")
+    photo_path = os.path.join(ws.site_dir, "profile.jpg")
     data["photo"] = "profile.jpg" if os.path.exists(photo_path) else None
 
-    return render_template(f"template_05/{section}.html", data=data)
+    return render_cached(f"template_05/{section}.html", data=data)
 
 if __name__ == "__main__":
     app.run(debug=True)
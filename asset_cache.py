@@ -0,0 +1,154 @@
+# asset_cache.py  – in-process cache for theme CSS and static files
+# -------------------------------------------------------------------
+# Files are read once, hashed, and kept in memory until their mtime/size
+# changes (checked with one stat() per access).  The hash doubles as a
+# strong ETag so the static routes can answer If-None-Match with 304
+# instead of re-sending the bytes.  Files above ``max_entry_bytes`` are
+# hashed but streamed from disk rather than held in memory.
+#
+# With ``precompressed=True`` the response is taken from a .br / .gz
+# sibling written by precompress.py when the client accepts it (and the
+# sibling is not older than the file).  Responses support byte ranges.
+
+import hashlib
+import mimetypes
+import os
+import stat
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from flask import Response, request, send_file
+from werkzeug.security import safe_join
+
+from precompress import COMPRESSIBLE, SIBLING_SUFFIXES, is_sibling, negotiate
+
+__all__ = ["Asset", "AssetCache", "asset_response"]
+
+
+@dataclass(frozen=True)
+class Asset:
+    path: str
+    etag: str            # unquoted content hash
+    mtime: float
+    size: int
+    mimetype: str
+    data: Optional[bytes] = None   # None → too big to keep, stream from path
+
+    @property
+    def stamp(self):
+        return self.mtime, self.size
+
+
+def _digest(path: str, keep: bool) -> tuple[str, bytes | None]:
+    h = hashlib.blake2b(digest_size=16)
+    chunks = []
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            h.update(chunk)
+            if keep:
+                chunks.append(chunk)
+    return h.hexdigest(), b"".join(chunks) if keep else None
+
+
+class AssetCache:
+    def __init__(self, *, max_bytes: int = 32 * 1024 * 1024, max_entry_bytes: int = 2 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[str, Asset]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, path: str) -> Asset | None:
+        """The current contents of ``path`` (None if it is not a file)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        stamp = (st.st_mtime, st.st_size)
+
+        with self._lock:
+            asset = self._entries.get(path)
+            if asset is not None and asset.stamp == stamp:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return asset
+            self.misses += 1
+
+        keep = st.st_size <= self.max_entry_bytes
+        etag, data = _digest(path, keep)
+        asset = Asset(path, etag, st.st_mtime, st.st_size,
+                      mimetypes.guess_type(path)[0] or "application/octet-stream", data)
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None and old.data is not None:
+                self._bytes -= len(old.data)
+            self._entries[path] = asset
+            if data is not None:
+                self._bytes += len(data)
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                if evicted.data is not None:
+                    self._bytes -= len(evicted.data)
+        return asset
+
+    def text(self, path: str, encoding: str = "utf-8") -> str:
+        """File contents as text, or "" if the file does not exist."""
+        asset = self.get(path)
+        if asset is None:
+            return ""
+        if asset.data is None:
+            with open(path, encoding=encoding) as fh:
+                return fh.read()
+        return asset.data.decode(encoding)
+
+    def stats(self) -> Dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+
+def _encoded_variant(cache: AssetCache, path: str, asset: Asset) -> tuple[str | None, Asset]:
+    """The best precompressed sibling of ``asset`` for this request, or (None, asset)."""
+    offered = {}
+    for encoding, suffix in SIBLING_SUFFIXES.items():
+        sibling = cache.get(path + suffix)
+        if sibling is not None and sibling.mtime >= asset.mtime:
+            offered[encoding] = sibling
+    encoding = negotiate(request.headers.get("Accept-Encoding"), offered) if offered else None
+    return encoding, offered.get(encoding, asset)
+
+
+def asset_response(cache: AssetCache, directory: str, filename: str, *,
+                   cache_control: str = "public, max-age=3600",
+                   precompressed: bool = False) -> Response | tuple:
+    """Serve ``directory/filename`` with a strong ETag, honouring If-None-Match (304),
+    Range (206) and, with ``precompressed``, Accept-Encoding."""
+    path = safe_join(directory, filename)
+    asset = cache.get(path) if path else None
+    if asset is None:
+        return "Not found.", 404
+
+    negotiable = (precompressed and not is_sibling(filename)
+                  and os.path.splitext(filename)[1].lower() in COMPRESSIBLE)
+    encoding, body = _encoded_variant(cache, path, asset) if negotiable else (None, asset)
+
+    if body.data is None:
+        resp = send_file(body.path, mimetype=asset.mimetype, etag=body.etag, conditional=True)
+    else:
+        resp = Response(body.data, mimetype=asset.mimetype)
+        resp.set_etag(body.etag)
+        resp.last_modified = asset.mtime
+        # 304 on If-None-Match / If-Modified-Since, 206 on Range
+        resp = resp.make_conditional(request, accept_ranges=True, complete_length=len(body.data))
+    if encoding:
+        resp.headers["Content-Encoding"] = encoding
+    if negotiable:
+        resp.vary.add("Accept-Encoding")
+    resp.headers["Cache-Control"] = cache_control
+    return resp
@@ -0,0 +1,231 @@
+# asset_optimizer.py  – shrink a static portfolio export
+# -------------------------------------------------------------------
+# The theme pages each carry a large inline <style> block that is
+# mostly the same on all seven pages, plus unminified HTML.  After the
+# export is rendered, optimize_site() rewrites the pages in place:
+#
+#   purge   : style rules whose selectors match nothing in any rendered
+#             page (or any class/id named in a page's scripts) are dropped
+#   dedupe  : the leading run of rules every page shares goes into one
+#             assets/site-<hash>.css, linked from each page, so browsers
+#             download it once and cache it by its content hash
+#   inline  : what is left is page-specific and stays inline after the
+#             link, in its original order (the cascade is unchanged)
+#   minify  : CSS and HTML whitespace and comments are collapsed
+#             (<pre>, <textarea>, <script> contents are left alone)
+#
+# Pages that use Google Fonts also get a preconnect hint for the font host.
+
+import hashlib
+import os
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+__all__ = ["minify_css", "minify_html", "used_names", "purge_css", "optimize_pages", "optimize_site"]
+
+STYLE_RX   = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+SCRIPT_RX  = re.compile(r"<script[^>]*>(.*?)</script>", re.S | re.I)
+STRING_RX  = re.compile(r"\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'")
+COMMENT_RX = re.compile(r"/\*.*?\*/", re.S)
+
+CLASS_ATTR_RX = re.compile(r"""\bclass\s*=\s*("[^"]*"|'[^']*')""", re.I)
+ID_ATTR_RX    = re.compile(r"""\bid\s*=\s*("[^"]*"|'[^']*')""", re.I)
+TAG_RX        = re.compile(r"<([a-zA-Z][a-zA-Z0-9-]*)")
+WORD_RX       = re.compile(r"[A-Za-z_][\w-]*")
+
+# selector parts that say nothing about which elements exist
+PSEUDO_RX = re.compile(r"::?[a-zA-Z-]+(\([^)]*\))?")
+ATTR_SEL_RX = re.compile(r"\[[^\]]*\]")
+SEL_CLASS_RX = re.compile(r"\.([\w-]+)")
+SEL_ID_RX = re.compile(r"#([\w-]+)")
+SEL_TAG_RX = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+
+# at-rules whose blocks hold style rules (purged recursively); others are kept whole
+NESTED_AT_RULES = ("@media", "@supports", "@layer", "@container")
+
+GOOGLE_FONTS_HREF = "https://fonts.googleapis.com"
+PRECONNECT = '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+
+# -------- CSS --------------------------------------------------------------
+
+def _protect(text: str) -> Tuple[str, List[str]]:
+    """Swap string literals for placeholders so whitespace rules can't touch them."""
+    strings: List[str] = []
+
+    def _stash(m):
+        strings.append(m.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+    return STRING_RX.sub(_stash, text), strings
+
+def _restore(text: str, strings: List[str]) -> str:
+    return re.sub(r"\x00(\d+)\x00", lambda m: strings[int(m.group(1))], text)
+
+def minify_css(css: str) -> str:
+    css, strings = _protect(COMMENT_RX.sub("", css))
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r";}", "}", css)
+    # "a: b" → "a:b" inside declaration blocks only (selectors keep " :hover")
+    css = re.sub(r"\{([^{}]*)\}", lambda m: "{" + re.sub(r"\s*:\s*", ":", m.group(1)) + "}", css)
+    return _restore(css.strip(), strings)
+
+def _split_rules(css: str) -> List[Tuple[str, str]]:
+    """Top-level ``(prelude, block)`` pairs of minified CSS; statements get block ''."""
+    rules, depth, start, prelude_end = [], 0, 0, None
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                prelude_end = i
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((css[start:prelude_end].strip(), css[prelude_end + 1:i]))
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            rules.append((css[start:i + 1].strip(), ""))
+            start = i + 1
+    return [r for r in rules if r[0]]
+
+def used_names(html_pages: Iterable[str]) -> Dict[str, Set[str]]:
+    """Classes, ids and tags present in the pages (script words count as both)."""
+    classes: Set[str] = set()
+    ids: Set[str] = set()
+    tags: Set[str] = {"html", "body"}
+    for html in html_pages:
+        for m in CLASS_ATTR_RX.finditer(html):
+            classes.update(m.group(1)[1:-1].split())
+        for m in ID_ATTR_RX.finditer(html):
+            ids.add(m.group(1)[1:-1].strip())
+        tags.update(t.lower() for t in TAG_RX.findall(STYLE_RX.sub("", html)))
+        for script in SCRIPT_RX.findall(html):       # classList.add("open"), getElementById("nav")…
+            words = set(WORD_RX.findall(script))
+            classes |= words
+            ids |= words
+    return {"classes": classes, "ids": ids, "tags": tags}
+
+def _selector_used(selector: str, used: Dict[str, Set[str]]) -> bool:
+    sel, _ = _protect(selector)
+    sel = ATTR_SEL_RX.sub("", PSEUDO_RX.sub("", sel))
+    return (all(c in used["classes"] for c in SEL_CLASS_RX.findall(sel))
+            and all(i in used["ids"] for i in SEL_ID_RX.findall(sel))
+            and all(t.lower() in used["tags"] for t in SEL_TAG_RX.findall(sel)))
+
+def purge_css(css: str, used: Dict[str, Set[str]]) -> Tuple[List[str], int]:
+    """Minified top-level rules still needed by ``used``, and how many were dropped."""
+    kept, dropped = [], 0
+    for prelude, block in _split_rules(minify_css(css)):
+        if prelude.startswith("@"):
+            if not block:
+                kept.append(prelude)
+            elif prelude.lower().startswith(NESTED_AT_RULES):
+                inner, n = purge_css(block, used)
+                dropped += n
+                if inner:
+                    kept.append(f"{prelude}{{{''.join(inner)}}}")
+            else:
+                kept.append(f"{prelude}{{{block}}}")      # @keyframes, @font-face, …
+            continue
+        selectors = [s for s in prelude.split(",") if _selector_used(s, used)]
+        if selectors:
+            kept.append(f"{','.join(selectors)}{{{block}}}")
+        else:
+            dropped += 1
+    return kept, dropped
+
+# -------- HTML -------------------------------------------------------------
+
+_RAW_BLOCK_RX = re.compile(r"<(pre|textarea|script)\b.*?</\1>", re.S | re.I)
+
+def minify_html(html: str) -> str:
+    blocks: List[str] = []
+
+    def _stash(m):
+        blocks.append(m.group(0))
+        return f"\x01{len(blocks) - 1}\x01"
+
+    html = _RAW_BLOCK_RX.sub(_stash, html)
+    html = re.sub(r"<!--(?!\[if).*?-->", "", html, flags=re.S)
+    html = re.sub(r"\s+", lambda m: "\n" if "\n" in m.group(0) else " ", html).strip()
+    return re.sub(r"\x01(\d+)\x01", lambda m: blocks[int(m.group(1))], html)
+
+# -------- Site -------------------------------------------------------------
+
+def _common_prefix(lists: List[List[str]]) -> List[str]:
+    prefix = []
+    for items in zip(*lists):
+        if any(item != items[0] for item in items[1:]):
+            break
+        prefix.append(items[0])
+    return prefix
+
+def optimize_pages(pages: Dict[str, str], *, asset_dir: str = "assets") -> Tuple[Dict[str, str], Dict[str, str], Dict[str, int]]:
+    """Optimise ``{filename: html}``; returns (pages, extra files, stats)."""
+    used = used_names(pages.values())
+    rules: Dict[str, List[str]] = {}
+    dropped = 0
+    for name, html in pages.items():
+        rules[name], n = purge_css("\n".join(STYLE_RX.findall(html)), used)
+        dropped += n
+
+    styled = [r for r in rules.values() if r]
+    shared = _common_prefix(styled) if len(styled) > 1 else []
+    files: Dict[str, str] = {}
+    link = ""
+    if shared:
+        css = "".join(shared)
+        digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:10]
+        href = f"{asset_dir}/site-{digest}.css"
+        files[href] = css
+        link = f'<link rel="stylesheet" href="{href}">'
+
+    out: Dict[str, str] = {}
+    for name, html in pages.items():
+        own = rules[name][len(shared):] if rules[name] else []
+        replacement = (link if rules[name] and shared else "") + (f"<style>{''.join(own)}</style>" if own else "")
+        first = True
+
+        def _swap(m):
+            nonlocal first
+            if first:
+                first = False
+                return replacement
+            return ""
+        html = STYLE_RX.sub(_swap, html)
+        if GOOGLE_FONTS_HREF in html and PRECONNECT not in html:
+            html = html.replace(f'<link href="{GOOGLE_FONTS_HREF}', f'{PRECONNECT}<link href="{GOOGLE_FONTS_HREF}', 1)
+        out[name] = minify_html(html)
+
+    stats = {
+        "html_bytes_before": sum(len(h.encode("utf-8")) for h in pages.values()),
+        "html_bytes_after": sum(len(h.encode("utf-8")) for h in out.values()),
+        "shared_css_bytes": sum(len(c.encode("utf-8")) for c in files.values()),
+        "purged_rules": dropped,
+    }
+    return out, files, stats
+
+def optimize_site(site_dir: str, pages: Iterable[str] | None = None) -> Dict[str, int]:
+    """Rewrite the exported ``*.html`` pages under ``site_dir`` in place."""
+    names = list(pages) if pages is not None else sorted(
+        f for f in os.listdir(site_dir) if f.endswith(".html"))
+    originals = {}
+    for name in names:
+        with open(os.path.join(site_dir, name), encoding="utf-8") as fh:
+            originals[name] = fh.read()
+
+    optimized, files, stats = optimize_pages(originals)
+    asset_dir = os.path.join(site_dir, "assets")
+    if os.path.isdir(asset_dir):               # hashed CSS from an earlier generation
+        keep = {os.path.basename(rel) for rel in files}
+        for name in os.listdir(asset_dir):
+            if name.startswith("site-") and name.split(".css")[0] + ".css" not in keep:
+                os.remove(os.path.join(asset_dir, name))
+    for rel, content in files.items():
+        path = os.path.join(site_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(content)
+    for name, html in optimized.items():
+        with open(os.path.join(site_dir, name), "w", encoding="utf-8") as fh:
+            fh.write(html)
+    return stats
@@ -0,0 +1,175 @@
+# batch_ingest.py  – bulk résumé ingestion without the Flask app
+# -------------------------------------------------------------------
+# Usage:
+#   python batch_ingest.py cohort/            -o cohort.jsonl
+#   python batch_ingest.py cohort.zip -j 8    -o cohort.jsonl
+#
+# Every PDF goes through extraction → cleaning → parsing in a process
+# pool and one JSON object per résumé is written as soon as it is done.
+# At most ``workers * 4`` files are in flight, and members of a ZIP are
+# read by the worker that parses them, so memory stays flat however big
+# the cohort is.  A summary with throughput, per-stage timings and the
+# failures goes to stderr at the end.  --score adds the rule-based
+# analyzer score (resume_analyzer/rule_scorer.py) to every record.
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from typing import Any, Dict, Iterator, Tuple
+
+from pdf_extract     import iter_pdf_pages
+from resume_pipeline import clean_and_parse
+from resume_analyzer.rule_scorer import score_parsed
+
+__all__ = ["iter_sources", "ingest_one", "run"]
+
+STAGES = ("extract", "parse", "score")
+
+# -------- Input discovery --------------------------------------------------
+
+def iter_sources(path: str) -> Iterator[Tuple[str, str | None]]:
+    """Yield ``(pdf_path, zip_member)`` pairs for a directory or a ZIP file."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for name in sorted(zf.namelist()):
+                if name.lower().endswith(".pdf") and not name.startswith("__MACOSX/"):
+                    yield path, name
+        return
+    for root, _, files in os.walk(path):
+        for name in sorted(files):
+            if name.lower().endswith(".pdf"):
+                yield os.path.join(root, name), None
+
+# -------- Worker -----------------------------------------------------------
+
+def ingest_one(source: str, member: str | None = None, score: bool = False) -> Dict[str, Any]:
+    """Extract and parse one résumé; never raises (errors are reported)."""
+    record: Dict[str, Any] = {"source": member or source, "timings": {}}
+    tmp = None
+    try:
+        if member is not None:
+            with zipfile.ZipFile(source) as zf, \
+                    tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as fh:
+                fh.write(zf.read(member))
+                tmp = pdf_path = fh.name
+        else:
+            pdf_path = source
+
+        t0 = time.perf_counter()
+        pages = list(iter_pdf_pages(pdf_path))
+        t1 = time.perf_counter()
+        cleaned_text, data = clean_and_parse(pages)
+        t2 = time.perf_counter()
+
+        record["timings"] = {"extract": t1 - t0, "parse": t2 - t1}
+        record["cleaned_text"] = cleaned_text
+        record["data"] = data
+        if score:
+            record["score"], record["score_breakdown"] = score_parsed(data)
+            record["timings"]["score"] = time.perf_counter() - t2
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if tmp:
+            os.unlink(tmp)
+    return record
+
+# -------- Driver -----------------------------------------------------------
+
+def run(path: str, out, *, workers: int | None = None, include_text: bool = False,
+        max_inflight: int | None = None, score: bool = False) -> Dict[str, Any]:
+    """Ingest everything under ``path`` and write JSON Lines to ``out``."""
+    workers = workers or os.cpu_count() or 1
+    max_inflight = max_inflight or workers * 4
+    timings: Dict[str, list] = {stage: [] for stage in STAGES}
+    failures = []
+    done = 0
+    started = time.perf_counter()
+
+    def _write(record):
+        nonlocal done
+        done += 1
+        if "error" in record:
+            failures.append({"source": record["source"], "error": record["error"]})
+        else:
+            for stage, seconds in record["timings"].items():
+                timings[stage].append(seconds)
+            if not include_text:
+                record.pop("cleaned_text", None)
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for source, member in iter_sources(path):
+            if len(pending) >= max_inflight:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    _write(fut.result())
+            pending.add(pool.submit(ingest_one, source, member, score))
+        for fut in as_completed(pending):
+            _write(fut.result())
+
+    elapsed = time.perf_counter() - started
+    return {
+        "files": done,
+        "ok": done - len(failures),
+        "failed": len(failures),
+        "seconds": elapsed,
+        "files_per_second": done / elapsed if elapsed else 0.0,
+        "stages": {
+            stage: {
+                "mean_ms": statistics.mean(values) * 1e3,
+                "p95_ms": sorted(values)[int(len(values) * 0.95) - 1] * 1e3
+                          if len(values) >= 20 else max(values) * 1e3,
+                "total_s": sum(values),
+            }
+            for stage, values in timings.items() if values
+        },
+        "failures": failures,
+    }
+
+def _print_report(report: Dict[str, Any]) -> None:
+    err = sys.stderr
+    print(f"✅ {report['ok']}/{report['files']} résumés in {report['seconds']:.1f}s "
+          f"({report['files_per_second']:.1f} files/s)", file=err)
+    for stage, stats in report["stages"].items():
+        print(f"   {stage:8} mean {stats['mean_ms']:8.1f} ms   p95 {stats['p95_ms']:8.1f} ms   "
+              f"total {stats['total_s']:.1f}s", file=err)
+    for failure in report["failures"]:
+        print(f"❌ {failure['source']}: {failure['error']}", file=err)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parse a directory or ZIP of PDF résumés to JSON Lines.")
+    ap.add_argument("path", help="directory of PDFs or a .zip archive")
+    ap.add_argument("-o", "--output", default="-", help="JSON Lines output file (default: stdout)")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument("--include-text", action="store_true", help="also store the cleaned résumé text")
+    ap.add_argument("--score", action="store_true", help="add the rule-based analyzer score")
+    ap.add_argument("--report", help="write the summary report as JSON to this file")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        ap.error(f"{args.path} does not exist")
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        report = run(args.path, out, workers=args.workers, include_text=args.include_text,
+                     score=args.score)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    _print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    return 1 if report["failed"] and not report["ok"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# bench_comparator.py  – comparing a stack of N parsed résumés
+# -------------------------------------------------------------------
+# Usage:  python benchmarks/bench_comparator.py [-n 10000] [--block 256]
+#
+# Synthetic résumés drawn from shared skill / role / project pools, so
+# candidates overlap the way a real applicant pool does.  Reports build
+# time, ranking against one requirement, the streamed per-candidate
+# top-k and the global top-k pairs, with the peak traced memory of each
+# step next to what a dense N × N float32 matrix would need.
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from resume_analyzer.comparator import Comparator  # noqa: E402
+
+SKILLS = ("Python Java Go Rust TypeScript React Vue Django Flask FastAPI SQL PostgreSQL MongoDB Redis "
+          "Docker Kubernetes AWS GCP Azure Terraform Spark Kafka Airflow Pandas NumPy PyTorch "
+          "TensorFlow Figma Linux Git GraphQL").split()
+ROLES = ("Backend Developer", "Frontend Engineer", "Data Engineer", "ML Engineer", "DevOps Engineer",
+         "Software Engineer Intern", "Full Stack Developer", "Data Analyst")
+VERBS = "built designed led migrated optimized shipped automated scaled".split()
+THINGS = ("payment APIs", "data pipelines", "dashboards", "recommendation models", "CI pipelines",
+          "mobile apps", "search services", "ETL jobs", "design systems", "monitoring")
+
+
+def synthetic(rng: random.Random) -> dict:
+    def line():
+        return f"{rng.choice(VERBS)} {rng.choice(THINGS)} using {rng.choice(SKILLS)} and {rng.choice(SKILLS)}"
+    return {
+        "summary": line(),
+        "skills": rng.sample(SKILLS, rng.randint(4, 12)),
+        "experience": [{"title": rng.choice(ROLES), "company": f"Company {rng.randint(1, 500)}",
+                        "description": "\n".join(line() for _ in range(rng.randint(1, 4)))}
+                       for _ in range(rng.randint(1, 3))],
+        "projects": [{"title": rng.choice(THINGS).title(), "description": line()}
+                     for _ in range(rng.randint(0, 3))],
+        "education": [{"degree": rng.choice(("B.Tech CSE", "M.Tech", "BSc Physics", "MBA")),
+                       "institution": f"University {rng.randint(1, 50)}"}],
+    }
+
+
+def _timed(label: str, fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:<22} {seconds:8.2f} s   peak {peak / 2**20:8.1f} MiB")
+    return result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=10_000)
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--block", type=int, default=256)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    resumes = [synthetic(rng) for _ in range(args.n)]
+    print(f"N = {args.n}, k = {args.k}, block = {args.block} "
+          f"(dense N×N float32 would be {args.n * args.n * 4 / 2**20:.0f} MiB per section)")
+
+    comparator = _timed("build", lambda: Comparator(resumes))
+    _timed("against requirement", lambda: comparator.against("Python Flask AWS backend APIs", args.k))
+    _timed("top-k per candidate", lambda: sum(1 for _ in comparator.iter_similar(args.k, block=args.block)))
+    pairs = _timed("top-k pairs", lambda: comparator.top_pairs(args.k, block=args.block))
+    if pairs:
+        print(f"  best pair {pairs[0]['a']['index']} ↔ {pairs[0]['b']['index']}  score {pairs[0]['score']}")
+
+
+if __name__ == "__main__":
+    main()
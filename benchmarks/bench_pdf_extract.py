@@ -0,0 +1,90 @@
+# bench_pdf_extract.py  – latency + peak RSS per PDF extraction backend
+# -------------------------------------------------------------------
+# Usage:  python benchmarks/bench_pdf_extract.py [pdf_dir] [--repeat N]
+#
+# Without a directory a small synthetic corpus is rendered with
+# reportlab.  Each backend runs in a fresh process so peak RSS is not
+# polluted by the other backend's imports.
+
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_extract import BACKENDS, available_backends, extract_pdf_text  # noqa: E402
+
+
+def _synthetic_corpus(folder: str, count: int = 20) -> list[str]:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    paths = []
+    for n in range(count):
+        path = os.path.join(folder, f"resume_{n:03d}.pdf")
+        c = canvas.Canvas(path, pagesize=A4)
+        for page in range(1 + n % 3):
+            y = 800
+            for section in ("SUMMARY", "SKILLS", "EXPERIENCE", "PROJECTS", "EDUCATION"):
+                c.drawString(40, y, f"{section}:")
+                y -= 14
+                for i in range(8):
+                    c.drawString(50, y, f"- {section.title()} line {i} of candidate {n}, "
+                                        f"page {page} https://github.com/user{n}")
+                    y -= 14
+            c.showPage()
+        c.save()
+        paths.append(path)
+    return paths
+
+
+def _run(backend: str, paths: list[str], repeat: int, out) -> None:
+    timings = []
+    for _ in range(repeat):
+        for path in paths:
+            t0 = time.perf_counter()
+            extract_pdf_text(path, backends=[backend])
+            timings.append(time.perf_counter() - t0)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    out.send((timings, peak_kb))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pdf_dir", nargs="?")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pdf_dir:
+            paths = sorted(os.path.join(args.pdf_dir, f) for f in os.listdir(args.pdf_dir)
+                           if f.lower().endswith(".pdf"))
+        else:
+            paths = _synthetic_corpus(tmp)
+
+        print(f"{len(paths)} PDFs x {args.repeat} runs")
+        print(f"{'backend':10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'peak RSS MB':>12}")
+        installed = available_backends()
+        ctx = mp.get_context("spawn")
+        for backend in BACKENDS:
+            if backend not in installed:
+                print(f"{backend:10} not installed")
+                continue
+            recv, send = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_run, args=(backend, paths, args.repeat, send))
+            proc.start()
+            timings, peak_kb = recv.recv()
+            proc.join()
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            print(f"{backend:10} {statistics.mean(timings) * 1e3:9.2f} "
+                  f"{statistics.median(timings) * 1e3:9.2f} {p95 * 1e3:9.2f} {peak_kb / 1024:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
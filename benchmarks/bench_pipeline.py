@@ -0,0 +1,74 @@
+# bench_pipeline.py  – two-pass clean+parse vs the fused single pass
+# -------------------------------------------------------------------
+# Usage:  python benchmarks/bench_pipeline.py [--resumes N]
+#
+# Reports wall time and tracemalloc peak memory for
+# parse_resume_text(standardize_resume_text(text)) against
+# resume_pipeline.clean_and_parse(text) on synthetic résumés.
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_parser     import parse_resume_text        # noqa: E402
+from resume_precleaner import standardize_resume_text  # noqa: E402
+from resume_pipeline   import clean_and_parse          # noqa: E402
+
+HEADINGS = ["Summary", "Skills", "Work Experience", "Projects", "Education",
+            "Certifications", "Languages"]
+WORDS = ("python flask react docker aws led team built api pipeline reduced latency "
+         "developer intern university 2021 2023 https://github.com/user").split()
+
+
+def _resume(rnd: random.Random) -> str:
+    lines = ["Jane Doe", "Software Engineer", "jane@example.com | +1 555 010 2030"]
+    for heading in HEADINGS:
+        lines.append(heading)
+        lines.extend("• " + " ".join(rnd.choices(WORDS, k=rnd.randint(4, 16)))
+                     for _ in range(rnd.randint(3, 12)))
+    return "\n".join(lines)
+
+
+def _two_pass(text: str):
+    cleaned = standardize_resume_text(text)
+    return cleaned, parse_resume_text(cleaned)
+
+
+def _measure(fn, texts):
+    t0 = time.perf_counter()
+    for text in texts:
+        fn(text)
+    elapsed = time.perf_counter() - t0
+
+    big = "\n".join(texts[:200])
+    tracemalloc.start()
+    fn(big)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--resumes", type=int, default=2000)
+    args = ap.parse_args()
+
+    rnd = random.Random(11)
+    texts = [_resume(rnd) for _ in range(args.resumes)]
+    for text in texts[:50]:
+        assert clean_and_parse(text) == _two_pass(text)
+
+    print(f"{args.resumes} synthetic résumés")
+    for label, fn in (("two-pass", _two_pass), ("fused", clean_and_parse)):
+        elapsed, peak = _measure(fn, texts)
+        print(f"{label:9} {elapsed / args.resumes * 1e6:9.1f} µs/résumé  "
+              f"peak {peak / 1024:8.1f} KiB on a 200-résumé document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# bench_resume_pdf.py  – cleaned-résumé PDF rendering, legacy vs PdfLayout
+# -------------------------------------------------------------------
+# Usage:  python benchmarks/bench_resume_pdf.py [--resumes N]
+#
+#   legacy : the previous create_cleaned_resume_pdf (stringWidth per
+#            segment, URL_RX per line, no wrapping), copied below
+#   layout : resume_pdf.PdfLayout.render_many into in-memory buffers
+#
+# Both write to BytesIO so disk speed does not enter the comparison.
+# Pages differ (the legacy renderer never wraps), so résumés/s is the
+# like-for-like figure and pages/s is reported alongside.
+
+import argparse
+import io
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from reportlab.lib import colors  # noqa: E402
+from reportlab.lib.pagesizes import A4  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from resume_pdf import URL_RX, PdfLayout  # noqa: E402
+from resume_pipeline import clean_and_parse  # noqa: E402
+
+HEADINGS = ["Summary", "Skills", "Work Experience", "Projects", "Education", "Certifications"]
+WORDS = ("python flask react docker aws led team built api pipeline reduced latency "
+         "developer intern university 2021 2023 https://github.com/user/portfolio").split()
+PAGE_RX = re.compile(rb"/Type /Page\b(?!s)")
+
+
+def legacy_create_cleaned_resume_pdf(text: str, pdf_path) -> None:
+    c = canvas.Canvas(pdf_path, pagesize=A4)
+    width, height = A4
+    y = height - 40
+    c.setFont("Helvetica", 10)
+    for raw in text.splitlines():
+        if y < 40:
+            c.showPage()
+            y = height - 40
+            c.setFont("Helvetica", 10)
+        urls = list(URL_RX.finditer(raw))
+        if not urls:
+            c.drawString(40, y, raw)
+        else:
+            x = 40
+            cursor = 0
+            for m in urls:
+                before = raw[cursor:m.start()]
+                url = m.group(0)
+                c.drawString(x, y, before)
+                x += c.stringWidth(before, "Helvetica", 10)
+                c.setFillColor(colors.blue)
+                c.drawString(x, y, url)
+                link_w = c.stringWidth(url, "Helvetica", 10)
+                c.linkURL(url if url.startswith("http") else f"https://{url}",
+                          (x, y-1, x+link_w, y+9))
+                c.line(x, y-1, x+link_w, y-1)
+                c.setFillColor(colors.black)
+                x += link_w
+                cursor = m.end()
+            if cursor < len(raw):
+                c.drawString(x, y, raw[cursor:])
+        y -= 14
+    c.save()
+
+
+def _resume(rnd: random.Random) -> str:
+    lines = ["Jane Doe", "Software Engineer", "jane@example.com | +1 555 010 2030"]
+    for heading in HEADINGS:
+        lines.append(heading)
+        lines.extend("• " + " ".join(rnd.choices(WORDS, k=rnd.randint(6, 40)))
+                     for _ in range(rnd.randint(3, 10)))
+    return clean_and_parse("\n".join(lines))[0]
+
+
+def _run(label: str, texts, render) -> None:
+    buffers = [io.BytesIO() for _ in texts]
+    t0 = time.perf_counter()
+    render(texts, buffers)
+    elapsed = time.perf_counter() - t0
+    pages = sum(len(PAGE_RX.findall(b.getvalue())) for b in buffers)
+    print(f"  {label:<7} {len(texts) / elapsed:8.1f} résumés/s   {pages / elapsed:8.1f} pages/s"
+          f"   ({pages} pages)")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--resumes", type=int, default=300)
+    args = ap.parse_args()
+
+    rnd = random.Random(3)
+    texts = [_resume(rnd) for _ in range(args.resumes)]
+    layout = PdfLayout()
+
+    print(f"{len(texts)} cleaned résumés")
+    _run("legacy", texts, lambda ts, bs: [legacy_create_cleaned_resume_pdf(t, b) for t, b in zip(ts, bs)])
+    _run("layout", texts, lambda ts, bs: layout.render_many(zip(ts, bs)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# bench_scoring.py  – résumé analyzer throughput, before vs after
+# -------------------------------------------------------------------
+# Usage:  python benchmarks/bench_scoring.py samples/ [-j 4]
+#
+#   before  : ResumeParser(path) per résumé, models loaded on every call
+#   warm    : ScoringService.score_file, models loaded once, no cache
+#   batch   : ScoringService.score_many over a process pool, no cache
+#   cached  : score_many again with the hash cache populated
+#
+# "before" runs first, in this process, before load_models() patches
+# pyresparser.
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from parse_cache import ParseCache  # noqa: E402
+from resume_analyzer.scoring_service import ScoringService, load_models, points_for  # noqa: E402
+
+
+def _report(label: str, n: int, seconds: float) -> None:
+    print(f"  {label:<8} {n / seconds:8.2f} résumés/s   ({seconds * 1e3 / n:8.1f} ms each)")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("folder")
+    ap.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    paths = sorted(os.path.join(args.folder, f) for f in os.listdir(args.folder)
+                   if f.lower().endswith(".pdf"))
+    if not paths:
+        sys.exit(f"no PDFs in {args.folder}")
+    print(f"{len(paths)} résumés, {args.workers} workers")
+
+    from pyresparser import ResumeParser
+    t0 = time.perf_counter()
+    for path in paths:
+        points_for(ResumeParser(path).get_extracted_data())
+    _report("before", len(paths), time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    load_models()
+    print(f"  (model load {time.perf_counter() - t0:.2f} s, once per process)")
+
+    with ScoringService(workers=1) as service:
+        t0 = time.perf_counter()
+        for path in paths:
+            service.score_file(path)
+        _report("warm", len(paths), time.perf_counter() - t0)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            ScoringService(ParseCache(os.path.join(tmp, "scores.sqlite3"), version="bench"),
+                           workers=args.workers) as service:
+        t0 = time.perf_counter()
+        service.score_many(paths)
+        _report("batch", len(paths), time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        service.score_many(paths)
+        _report("cached", len(paths), time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    main()
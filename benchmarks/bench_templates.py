@@ -0,0 +1,80 @@
+# bench_templates.py  – first-request render latency, cold vs warm
+# -------------------------------------------------------------------
+# Usage:  python benchmarks/bench_templates.py [--theme template_02]
+#
+#   cold     : new Environment per request (old html_generator / app.generate)
+#   bytecode : fresh process-like Environment loading the on-disk bytecode cache
+#   warm     : shared registry after warm_up() – what a request sees at startup
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader  # noqa: E402
+
+import template_registry  # noqa: E402
+from portfolio_pipeline import PAGES  # noqa: E402
+
+SAMPLE = {
+    "name": "Jane Doe", "title": "Software Engineer", "email": "jane@example.com",
+    "phone": "+1 555 010 2030", "summary": "Builds things.",
+    "skills": ["Python", "Flask", "React"], "links": ["https://github.com/jane"],
+    "projects": [{"title": "Portfolio", "description": "Static site generator", "link": "#"}],
+    "experience": [{"title": "Engineer", "company": "Acme", "duration": "2021 - 2024",
+                    "location": "Remote", "description": "APIs"}],
+    "education": [{"degree": "B.Tech", "institution": "XYZ", "year": "2021"}],
+    "certificates": [{"title": "AWS CCP"}], "languages": ["English"], "photo": None, "misc": [],
+}
+
+
+def _render_all(env: Environment, theme: str) -> float:
+    ctx = {"data": SAMPLE, "template": theme, "year": 2026, "css": "", "is_static": True}
+    t0 = time.perf_counter()
+    for page in PAGES:
+        env.get_template(f"{theme}/{page}.html").render(**ctx)
+    return time.perf_counter() - t0
+
+
+def _env(**kwargs) -> Environment:
+    env = Environment(loader=FileSystemLoader("templates"), **kwargs)
+    env.globals.update(url_for=lambda endpoint, **kw: f"/{endpoint}")
+    return env
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--theme", default="template_02")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    cold = min(_render_all(_env(), args.theme) for _ in range(args.repeat))
+
+    tmp = tempfile.mkdtemp()
+    try:
+        _render_all(_env(bytecode_cache=FileSystemBytecodeCache(tmp)), args.theme)  # populate
+        bytecode = min(_render_all(_env(bytecode_cache=FileSystemBytecodeCache(tmp)), args.theme)
+                       for _ in range(args.repeat))
+    finally:
+        shutil.rmtree(tmp)
+
+    env = _env(auto_reload=False, cache_size=-1)
+    t0 = time.perf_counter()
+    template_registry.warm_up(env, [f"{args.theme}/{p}.html" for p in PAGES])
+    warm_cost = time.perf_counter() - t0
+    warm = min(_render_all(env, args.theme) for _ in range(args.repeat))
+
+    print(f"first request, 7 pages of {args.theme}")
+    print(f"  cold environment   {cold * 1e3:8.2f} ms")
+    print(f"  bytecode cache     {bytecode * 1e3:8.2f} ms")
+    print(f"  warmed registry    {warm * 1e3:8.2f} ms   (startup warm-up {warm_cost * 1e3:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
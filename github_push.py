@@ -0,0 +1,221 @@
+# github_push.py  – push a generated portfolio as ONE commit
+# -------------------------------------------------------------------
+# The contents API needs one sequential PUT (and one commit) per file,
+# so a portfolio push was N round trips and a failure half-way left a
+# half-populated repo.  This uses the Git Data API instead:
+#
+#   blobs   – uploaded concurrently (bounded thread pool)
+#   tree    – one request listing every blob on top of the base tree
+#   commit  – one commit, whatever the number of files
+#   ref     – moved last, so the branch only ever sees a complete site
+#
+# All calls share one pooled requests.Session and retry with backoff on
+# rate limits (429 / 403 + X-RateLimit-Remaining: 0), 5xx and dropped
+# connections.  Point GITHUB_API_URL at a local fake server for tests.
+
+import base64
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+__all__ = ["GitHubError", "GitHubPusher"]
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+Entry = Tuple[str, Union[bytes, str, Path]]
+
+
+class GitHubError(Exception):
+    def __init__(self, message: str, status: int | None = None, body: Any = None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date); None if unusable."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+def _no_stage(name: str) -> None:
+    pass
+
+def _read(data: Union[bytes, str, Path]) -> bytes:
+    if isinstance(data, Path):
+        return data.read_bytes()
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+class GitHubPusher:
+    def __init__(self, token: str, *, api_url: str = GITHUB_API_URL, max_workers: int = 8,
+                 max_retries: int = 5, backoff: float = 0.5, max_sleep: float = 60.0,
+                 timeout: float = 30.0):
+        self.api_url = api_url.rstrip("/")
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_sleep = max_sleep
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+
+    # -------- HTTP ----------------------------------------------------
+
+    def _delay(self, attempt: int, resp: requests.Response | None) -> float | None:
+        """Seconds to wait before retrying, or None if the response is final."""
+        if resp is not None:
+            status = resp.status_code
+            rate_limited = status == 429 or (
+                status == 403 and (resp.headers.get("X-RateLimit-Remaining") == "0"
+                                   or "rate limit" in resp.text.lower()))
+            if not rate_limited and status < 500:
+                return None
+            retry_after = _retry_after(resp.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_sleep)
+            if resp.headers.get("X-RateLimit-Reset") and resp.headers.get("X-RateLimit-Remaining") == "0":
+                return min(max(float(resp.headers["X-RateLimit-Reset"]) - time.time(), 1.0), self.max_sleep)
+        return min(self.backoff * 2 ** attempt + random.uniform(0, self.backoff), self.max_sleep)
+
+    def request(self, method: str, path: str, *, expected=(200, 201),
+                retry_on=(), on_retry: Callable[[], None] | None = None, **kwargs) -> Dict[str, Any]:
+        """Call the API, retrying transient failures; returns the JSON body.
+
+        ``retry_on`` adds statuses worth retrying for this call only (e.g.
+        404/409 while a freshly created repo is still initialising).
+        ``on_retry`` is called before every retry, so non-idempotent calls
+        can tell that an earlier attempt may already have taken effect.
+        """
+        url = f"{self.api_url}/{path.lstrip('/')}"
+        for attempt in range(self.max_retries + 1):
+            try:
+                resp = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise GitHubError(f"{method} {path} failed: {e}") from e
+                if on_retry is not None:
+                    on_retry()
+                time.sleep(self._delay(attempt, None))
+                continue
+
+            if resp.status_code in expected:
+                return resp.json() if resp.content else {}
+
+            delay = self._delay(attempt, resp)
+            if delay is None and resp.status_code in retry_on:
+                delay = self._delay(attempt, None)
+            if delay is None or attempt == self.max_retries:
+                try:
+                    body = resp.json()
+                except ValueError:
+                    body = resp.text
+                raise GitHubError(f"{method} {path} → {resp.status_code}", resp.status_code, body)
+            if on_retry is not None:
+                on_retry()
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    # -------- Git Data API --------------------------------------------
+
+    def create_repo(self, name: str, *, description: str = "", private: bool = False) -> Dict[str, Any]:
+        # auto_init gives the repo a first commit/branch to build on
+        retried = []
+        try:
+            return self.request("POST", "/user/repos", expected=(201,), on_retry=lambda: retried.append(1),
+                                json={"name": name, "description": description,
+                                      "private": private, "auto_init": True})
+        except GitHubError as e:
+            # POST is not idempotent: a timed-out / 5xx attempt may have created the
+            # repo, and the retry then gets 422 "name already exists" – use that repo
+            if e.status != 422 or not retried:
+                raise
+            owner = self.request("GET", "/user", expected=(200,))["login"]
+            try:
+                return self.request("GET", f"/repos/{owner}/{name}", expected=(200,))
+            except GitHubError:
+                raise e from None
+
+    def _create_blob(self, owner: str, repo: str, data: Union[bytes, str, Path]) -> str:
+        blob = self.request("POST", f"/repos/{owner}/{repo}/git/blobs", expected=(201,), json={
+            "content": base64.b64encode(_read(data)).decode(), "encoding": "base64",
+        })
+        return blob["sha"]
+
+    def push_files(self, owner: str, repo: str, entries: Iterable[Entry], *,
+                   branch: str = "main", message: str = "Add portfolio",
+                   on_stage: Callable[[str], None] = _no_stage) -> str:
+        """Commit ``entries`` on top of ``branch`` in one commit; returns its sha."""
+        entries = list(entries)
+        ref = self.request("GET", f"/repos/{owner}/{repo}/git/ref/heads/{branch}",
+                           expected=(200,), retry_on=(404, 409))
+        parent = ref["object"]["sha"]
+        base_tree = self.request("GET", f"/repos/{owner}/{repo}/git/commits/{parent}",
+                                 expected=(200,))["tree"]["sha"]
+
+        on_stage("blobs")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            shas = list(pool.map(lambda e: self._create_blob(owner, repo, e[1]), entries))
+
+        on_stage("commit")
+        tree = self.request("POST", f"/repos/{owner}/{repo}/git/trees", expected=(201,), json={
+            "base_tree": base_tree,
+            "tree": [{"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                     for (path, _), sha in zip(entries, shas)],
+        })
+        commit = self.request("POST", f"/repos/{owner}/{repo}/git/commits", expected=(201,), json={
+            "message": message, "tree": tree["sha"], "parents": [parent],
+        })
+        self.request("PATCH", f"/repos/{owner}/{repo}/git/refs/heads/{branch}", expected=(200,),
+                     json={"sha": commit["sha"]})
+        return commit["sha"]
+
+    def publish(self, repo_name: str, entries: Iterable[Entry], *,
+                description: str = "", message: str = "Add portfolio",
+                on_stage: Callable[[str], None] = _no_stage) -> Dict[str, Any]:
+        """Create ``repo_name`` and push ``entries`` to it as a single commit.
+
+        ``on_stage`` is told when each step (create_repo, blobs, commit) starts.
+        """
+        on_stage("create_repo")
+        repo = self.create_repo(repo_name, description=description)
+        owner = repo["owner"]["login"]
+        sha = self.push_files(owner, repo["name"], entries,
+                              branch=repo.get("default_branch") or "main", message=message,
+                              on_stage=on_stage)
+        return {"html_url": repo["html_url"], "owner": owner, "name": repo["name"], "commit": sha}
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
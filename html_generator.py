@@ -1,12 +1,12 @@
-from jinja2 import Environment, FileSystemLoader
 import os
 from datetime import datetime
 
+from template_registry import get_environment
+
 def generate_portfolio_html(data, output_path='portfolio.html', template_name='portfolio_template/index.html'):
     try:
-        # Setup Jinja2 Environment
-        env = Environment(loader=FileSystemLoader('templates'))
-        template = env.get_template(template_name)
+        # Shared, precompiled Jinja2 Environment
+        template = get_environment().get_template(template_name)
         
         # Add current date to data
         data['now'] = datetime.now().strftime('%B %d, %Y')
@@ -0,0 +1,214 @@
+# image_pipeline.py  – uploaded profile photo → sized, re-encoded variants
+# -------------------------------------------------------------------
+# The uploaded photo used to be copied into the site byte-for-byte, so
+# a 6 MB phone picture went into every page load, ZIP and GitHub push.
+# process_photo() now
+#
+#   validates  : size cap, decodable, one of ALLOWED_FORMATS, pixel cap
+#   orients    : applies the EXIF rotation, then drops all metadata
+#   resizes    : to each of WIDTHS not wider than the original
+#   encodes    : progressive JPEG + WebP at JPEG_QUALITY / WEBP_QUALITY
+#
+# and writes profile-<w>.jpg / profile-<w>.webp into the site, the
+# largest JPEG under the old name profile.jpg (the plain <img src>
+# fallback).  The returned fields go into the template data:
+#
+#   photo              "profile.jpg"
+#   photo_srcset       "profile-160.jpg 160w, profile-320.jpg 320w, profile.jpg 640w"
+#   photo_webp_srcset  the same for WebP (for a <picture> <source>)
+#   photo_width/height size of the fallback
+#
+# Variants are cached on disk under the SHA-256 of the upload bytes (+
+# IMAGE_PIPELINE_VERSION), so re-generating with the same photo only
+# copies files.  The cache is pruned least-recently-used past max_bytes.
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Any, Dict, List, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+__all__ = ["IMAGE_PIPELINE_VERSION", "WIDTHS", "PhotoError", "ImageCache", "process_photo"]
+
+IMAGE_PIPELINE_VERSION = "img-2"      # img-1 cache entries carry a duplicate 640 variant
+
+WIDTHS = (160, 320, 640)
+JPEG_QUALITY = int(os.getenv("PHOTO_JPEG_QUALITY", "82"))
+WEBP_QUALITY = int(os.getenv("PHOTO_WEBP_QUALITY", "80"))
+MAX_UPLOAD_BYTES = int(os.getenv("PHOTO_MAX_MB", "15")) * 1024 * 1024
+MAX_PIXELS = 40_000_000
+ALLOWED_FORMATS = {"JPEG", "MPO", "PNG", "WEBP", "GIF", "BMP", "TIFF"}
+
+BASENAME = "profile"
+MANIFEST = "manifest.json"
+PRUNE_GRACE = 60.0          # seconds: entries used this recently may still be being copied
+
+
+class PhotoError(ValueError):
+    """The upload is not a usable photo (generate() turns ValueError into a 400)."""
+
+
+# -------- Encoding ---------------------------------------------------------
+
+def _open(path: str) -> Image.Image:
+    if os.path.getsize(path) > MAX_UPLOAD_BYTES:
+        raise PhotoError(f"Photo is larger than {MAX_UPLOAD_BYTES // (1024 * 1024)} MB.")
+    try:
+        img = Image.open(path)
+        if img.format not in ALLOWED_FORMATS:
+            raise PhotoError(f"Unsupported photo format: {img.format or 'unknown'}.")
+        if img.width * img.height > MAX_PIXELS:
+            raise PhotoError("Photo dimensions are too large.")
+        # JPEG can decode at 1/2, 1/4, 1/8 scale: ask for no more than the widest
+        # variant on either side (either side may become the width after rotation)
+        if img.format in ("JPEG", "MPO"):
+            img.draft("RGB", (max(WIDTHS), max(WIDTHS)))
+        img = ImageOps.exif_transpose(img)
+        img.load()
+    except PhotoError:
+        raise
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as e:
+        raise PhotoError("Photo could not be read as an image.") from e
+    return img
+
+def _flatten(img: Image.Image) -> Tuple[Image.Image, Image.Image]:
+    """(RGB for JPEG, RGB or RGBA for WebP) – transparency goes onto white for JPEG."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        rgba = img.convert("RGBA")
+        flat = Image.new("RGB", rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        return flat, rgba
+    rgb = img.convert("RGB")
+    return rgb, rgb
+
+def _targets(width: int) -> List[int]:
+    """Distinct variant widths for a ``width``-px source, ascending, never upscaled."""
+    cap = min(width, max(WIDTHS))
+    return [w for w in WIDTHS if w < cap] + [cap]
+
+def _encode(src_path: str, out_dir: str) -> Dict[str, Any]:
+    """Write every variant of ``src_path`` into ``out_dir``; returns the manifest."""
+    jpeg_src, webp_src = _flatten(_open(src_path))
+    variants = []
+    for w in _targets(jpeg_src.width):
+        h = max(1, round(jpeg_src.height * w / jpeg_src.width))
+        for fmt, ext, src, opts in (
+                ("JPEG", "jpg", jpeg_src, {"quality": JPEG_QUALITY, "optimize": True, "progressive": True}),
+                ("WEBP", "webp", webp_src, {"quality": WEBP_QUALITY, "method": 4})):
+            sized = src if w == src.width else src.resize((w, h), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            name = f"{BASENAME}-{w}.{ext}"
+            sized.save(os.path.join(out_dir, name), fmt, **opts)
+            variants.append({"name": name, "format": ext, "width": w, "height": h})
+    widths = [v["width"] for v in variants if v["format"] == "jpg"]
+    if len(widths) != len(set(widths)):     # srcset with repeated w descriptors is invalid
+        raise AssertionError(f"duplicate photo variant widths: {widths}")
+    return {"version": IMAGE_PIPELINE_VERSION, "variants": variants}
+
+# -------- Cache ------------------------------------------------------------
+
+class ImageCache:
+    def __init__(self, directory: str = "cache/images", *, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, src_path: str) -> str:
+        h = hashlib.sha256(f"{IMAGE_PIPELINE_VERSION}:{WIDTHS}:{JPEG_QUALITY}:{WEBP_QUALITY}:".encode())
+        with open(src_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 16), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def variants(self, src_path: str) -> Tuple[str, Dict[str, Any]]:
+        """(directory, manifest) of the variants of ``src_path``, encoding them on a miss."""
+        entry = os.path.join(self.directory, self.key(src_path))
+        try:
+            with open(os.path.join(entry, MANIFEST), encoding="utf-8") as fh:
+                manifest = json.load(fh)
+            os.utime(entry)                                  # LRU touch
+            return entry, manifest
+        except (FileNotFoundError, ValueError):
+            pass
+
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            manifest = _encode(src_path, tmp)
+            with open(os.path.join(tmp, MANIFEST), "w", encoding="utf-8") as fh:
+                json.dump(manifest, fh)
+            try:
+                os.replace(tmp, entry)
+            except OSError:                                  # another worker got there first
+                shutil.rmtree(tmp, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self.prune()
+        return entry, manifest
+
+    def prune(self) -> int:
+        """Drop least-recently-used entries past ``max_bytes``; returns how many.
+
+        Entries touched in the last PRUNE_GRACE seconds are left alone: another
+        worker may be between variants() and copying the files out.
+        """
+        entries = []
+        cutoff = time.time() - PRUNE_GRACE
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".tmp") or not os.path.isdir(path):
+                continue
+            size = sum(f.stat().st_size for f in os.scandir(path))
+            entries.append((os.stat(path).st_mtime, size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes or mtime > cutoff:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        entries = [e for e in os.scandir(self.directory) if e.is_dir() and not e.name.endswith(".tmp")]
+        size = sum(f.stat().st_size for e in entries for f in os.scandir(e.path))
+        return {"entries": len(entries), "bytes": size, "max_bytes": self.max_bytes}
+
+# -------- Pipeline ---------------------------------------------------------
+
+def _srcset(variants: List[Dict[str, Any]], fmt: str) -> str:
+    return ", ".join(f"{v['site_name']} {v['width']}w" for v in variants if v["format"] == fmt)
+
+def process_photo(src_path: str, site_dir: str, cache_dir: str = "cache/images",
+                  max_cache_bytes: int = 256 * 1024 * 1024) -> Dict[str, Any]:
+    """Validate, resize and re-encode the photo into ``site_dir``; returns template fields.
+
+    Top-level with plain arguments so it can run in the CPU process pool.
+    Raises PhotoError for anything that is not a usable image.
+    """
+    cache = ImageCache(cache_dir, max_bytes=max_cache_bytes)
+    for attempt in range(2):
+        entry, manifest = cache.variants(src_path)
+        variants = [dict(v, site_name=v["name"]) for v in manifest["variants"]]
+        largest = max((v for v in variants if v["format"] == "jpg"), key=lambda v: v["width"])
+        largest["site_name"] = f"{BASENAME}.jpg"
+        try:
+            for v in variants:
+                shutil.copyfile(os.path.join(entry, v["name"]), os.path.join(site_dir, v["site_name"]))
+            break
+        except FileNotFoundError:
+            if attempt:                         # pruned twice in a row: give up loudly
+                raise
+            # pruned by another worker under us: variants() re-encodes on the next pass
+    return {
+        "photo": f"{BASENAME}.jpg",
+        "photo_srcset": _srcset(variants, "jpg"),
+        "photo_webp_srcset": _srcset(variants, "webp"),
+        "photo_width": largest["width"],
+        "photo_height": largest["height"],
+    }
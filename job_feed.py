@@ -0,0 +1,244 @@
+# job_feed.py  – cached, background-refreshed job board feed
+# -------------------------------------------------------------------
+# /jobs used to scrape remoteok.com on every page view.  The feed now
+# lives in a small SQLite store that a background thread refreshes on a
+# schedule; page views only read from it.
+#
+#   fresh   (age < ttl)   : served from the store
+#   stale   (age >= ttl)  : served from the store, refresh kicked off in
+#                           the background (stale-while-revalidate)
+#   empty   (first boot)  : an empty page, refresh kicked off in the
+#                           background – page views never scrape
+#
+# A failed refresh is retried after RETRY_MIN seconds, doubling per
+# consecutive failure up to the ttl, so an outage at the source costs
+# one background fetch per back-off step rather than one per view.
+#
+# Several gunicorn workers share the store; a refresh lease in the meta
+# table makes sure only one of them scrapes per interval.  Set
+# JOB_FEED_FIXTURE to a saved HTML page to run entirely offline.
+# Callbacks registered with on_refresh() get the new listings after each
+# successful refresh (the résumé matcher re-indexes from there).
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__ = ["parse_jobs", "JobFeed"]
+
+REMOTEOK_URL = "https://remoteok.com/remote-dev-jobs"
+RETRY_MIN = 30.0
+
+
+def parse_jobs(html: bytes | str) -> List[Dict[str, str]]:
+    """Extract ``{title, company, link}`` rows from a RemoteOK listing page."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    jobs = []
+    for div in soup.find_all('tr', class_='job'):
+        title = div.find('h2')
+        company = div.find('h3')
+        link = div.get('data-href')
+        if title and company:
+            jobs.append({
+                'title': title.text.strip(),
+                'company': company.text.strip(),
+                'link': 'https://remoteok.com' + link if link else '#'
+            })
+    return jobs
+
+
+def _fetch_remote(url: str) -> bytes:
+    import requests
+    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+    response.raise_for_status()
+    return response.content
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    position INTEGER PRIMARY KEY,
+    title    TEXT NOT NULL,
+    company  TEXT NOT NULL,
+    link     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value REAL
+);
+INSERT OR IGNORE INTO meta VALUES ('refreshed_at', 0), ('lease_until', 0),
+                                  ('last_attempt', 0), ('failures', 0);
+"""
+
+
+class JobFeed:
+    def __init__(self, path: str = "cache/job_feed.sqlite3", *, url: str = REMOTEOK_URL,
+                 ttl: float = 900, interval: float | None = None,
+                 fixture: str | None = None, fetch: Callable[[], bytes] | None = None):
+        self.path = path
+        self.url = url
+        self.ttl = ttl
+        self.interval = interval or ttl
+        self.fixture = fixture if fixture is not None else os.getenv("JOB_FEED_FIXTURE")
+        self._fetch = fetch or self._default_fetch
+        self._local = threading.local()
+        self._refreshing = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.last_error: Optional[str] = None
+        self._listeners: List[Callable[[List[Dict[str, str]]], Any]] = []
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _default_fetch(self) -> bytes:
+        if self.fixture:
+            with open(self.fixture, "rb") as fh:
+                return fh.read()
+        return _fetch_remote(self.url)
+
+    # -------- refreshing ----------------------------------------------
+
+    def age(self) -> float:
+        refreshed = self._conn().execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()[0]
+        return time.time() - refreshed
+
+    def _meta(self, key: str) -> float:
+        return self._conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()[0]
+
+    def _backing_off(self) -> bool:
+        """True while the last refresh failed less than the back-off delay ago."""
+        failures = self._meta("failures")
+        if not failures:
+            return False
+        delay = min(self.ttl, RETRY_MIN * 2 ** (failures - 1))
+        return time.time() < self._meta("last_attempt") + delay
+
+    def _record_attempt(self, ok: bool) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'last_attempt'", (time.time(),))
+            if ok:
+                conn.execute("UPDATE meta SET value = 0 WHERE key = 'failures'")
+            else:
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'failures'")
+
+    def _claim(self, lease: float) -> bool:
+        """Take the cross-worker refresh lease for ``lease`` seconds."""
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("UPDATE meta SET value = ? WHERE key = 'lease_until' AND value < ?",
+                               (now + lease, now))
+        return cur.rowcount == 1
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Scrape the source and replace the stored jobs; False if skipped or failed."""
+        if not self._refreshing.acquire(blocking=False):
+            return False
+        try:
+            if not force and not self._claim(lease=min(self.interval, 300)):
+                return False
+            try:
+                jobs = parse_jobs(self._fetch())
+            except Exception as e:          # keep serving the old feed
+                self.last_error = f"{type(e).__name__}: {e}"
+                self._record_attempt(ok=False)
+                return False
+            if not jobs:                    # bot check / markup change: not a real empty feed
+                self.last_error = "EmptyFeed: the source page had no listings"
+                self._record_attempt(ok=False)
+                return False
+            conn = self._conn()
+            with conn:
+                conn.execute("DELETE FROM jobs")
+                conn.executemany("INSERT INTO jobs (position, title, company, link) VALUES (?, ?, ?, ?)",
+                                 [(i, j["title"], j["company"], j["link"]) for i, j in enumerate(jobs)])
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'refreshed_at'", (time.time(),))
+            self.last_error = None
+            self._record_attempt(ok=True)
+            for callback in self._listeners:
+                try:
+                    callback(jobs)
+                except Exception as e:
+                    print(f"⚠️ Job feed listener failed: {type(e).__name__}: {e}")
+            return True
+        finally:
+            self._refreshing.release()
+
+    def on_refresh(self, callback: Callable[[List[Dict[str, str]]], Any]) -> None:
+        self._listeners.append(callback)
+
+    def refresh_async(self) -> None:
+        if self._refreshing.locked():
+            return
+        threading.Thread(target=self.refresh, name="job-feed-refresh", daemon=True).start()
+
+    def start(self) -> None:
+        """Refresh every ``interval`` seconds in a daemon thread."""
+        if self._thread is not None:
+            return
+
+        def _loop():
+            while not self._stop.is_set():
+                if self.age() >= self.interval and not self._backing_off():
+                    self.refresh()
+                self._stop.wait(self.interval / 4)
+
+        self._thread = threading.Thread(target=_loop, name="job-feed", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # -------- reading -------------------------------------------------
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def all(self) -> List[Dict[str, Any]]:
+        rows = self._conn().execute("SELECT title, company, link FROM jobs ORDER BY position").fetchall()
+        return [dict(r) for r in rows]
+
+    def _revalidate(self) -> None:
+        """Kick off a background refresh of a stale feed; never scrapes inline."""
+        if self.age() >= self.ttl and not self._backing_off():
+            self.refresh_async()
+
+    @staticmethod
+    def _where(q: str | None) -> Tuple[str, List[str]]:
+        where, args = "", []
+        for word in (q or "").split():
+            where += " AND (title LIKE ? ESCAPE '\\' OR company LIKE ? ESCAPE '\\')"
+            pattern = "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            args += [pattern, pattern]
+        return "WHERE 1=1" + where, args
+
+    def total(self, q: str | None = None) -> int:
+        """How many jobs match keyword ``q`` (read only; query() does the revalidation)."""
+        where, args = self._where(q)
+        return self._conn().execute(f"SELECT COUNT(*) FROM jobs {where}", args).fetchone()[0]
+
+    def query(self, q: str | None = None, *, page: int = 1,
+              per_page: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of jobs matching keyword ``q`` and the total match count."""
+        self._revalidate()
+        where, args = self._where(q)
+        conn = self._conn()
+        total = conn.execute(f"SELECT COUNT(*) FROM jobs {where}", args).fetchone()[0]
+        page = max(page, 1)
+        rows = conn.execute(f"SELECT title, company, link FROM jobs {where} ORDER BY position "
+                            f"LIMIT ? OFFSET ?", args + [per_page, (page - 1) * per_page]).fetchall()
+        return [dict(r) for r in rows], total
@@ -0,0 +1,118 @@
+# job_queue.py  – background jobs for long-running requests
+# -------------------------------------------------------------------
+# A job runs in a thread pool so the web worker can answer straight
+# away; CPU-heavy stages inside the job are pushed to a process pool via
+# ``job.run_cpu`` so they do not fight the GIL.  Both pools are sized
+# independently (JOB_WORKERS / JOB_CPU_WORKERS).
+
+import os
+import threading
+import time
+import uuid
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+__all__ = ["Job", "JobQueue", "QUEUED", "RUNNING", "DONE", "FAILED"]
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+@dataclass
+class Job:
+    id: str
+    status: str = QUEUED
+    stage: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    _queue: Any = field(default=None, repr=False)
+
+    def set_stage(self, name: str) -> None:
+        self.stage = name
+
+    def run_cpu(self, fn: Callable, *args):
+        """Run ``fn(*args)`` in the queue's process pool and wait for it."""
+        return self._queue.run_cpu(fn, *args)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class JobQueue:
+    """Thread pool for jobs + lazily created process pool for CPU stages."""
+
+    def __init__(self, workers: int | None = None, cpu_workers: int | None = None,
+                 ttl: float = 3600):
+        self.workers = workers or int(os.getenv("JOB_WORKERS", "4"))
+        self.cpu_workers = cpu_workers or int(os.getenv("JOB_CPU_WORKERS", str(os.cpu_count() or 1)))
+        self.ttl = ttl
+        self._threads = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+        self._cpu: ProcessPoolExecutor | None = None
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    # -------- pools ---------------------------------------------------
+
+    def _cpu_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._cpu is None:
+                self._cpu = ProcessPoolExecutor(max_workers=self.cpu_workers)
+            return self._cpu
+
+    def run_cpu(self, fn: Callable, *args):
+        return self._cpu_pool().submit(fn, *args).result()
+
+    # -------- jobs ----------------------------------------------------
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Job:
+        """Queue ``fn(job, *args, **kwargs)``; its return value becomes ``job.result``."""
+        job = Job(uuid.uuid4().hex, _queue=self)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._threads.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, fn: Callable, args, kwargs) -> None:
+        job.status = RUNNING
+        job.started = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status = DONE
+        except Exception as e:
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished = time.time()
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than ``ttl`` (caller holds the lock)."""
+        cutoff = time.time() - self.ttl
+        for job_id in [j.id for j in self._jobs.values() if j.done and j.finished < cutoff]:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._threads.shutdown(wait=wait)
+        if self._cpu is not None:
+            self._cpu.shutdown(wait=wait)
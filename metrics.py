@@ -0,0 +1,378 @@
+# metrics.py  – counters, gauges and latency histograms for /metrics
+# -------------------------------------------------------------------
+# Where does a generation spend its time, how slow is a GitHub push,
+# how often do the caches hit?  Every process keeps its own Registry:
+#
+#   hot path : each thread writes to its own shard (plain dicts), so
+#              inc() / observe() take no lock; the lock is only taken once
+#              per thread (shard creation) and by the collector
+#   workers  : with METRICS_DIR set, every process (gunicorn worker)
+#              writes its merged snapshot to <dir>/<pid>.json every
+#              METRICS_FLUSH seconds; /metrics in any worker sums them
+#   dead pids: counters and histograms of exited workers are kept (they
+#              are monotonic), their gauges are dropped
+#
+# render() produces the Prometheus text exposition format.  Empty
+# METRICS_DIR between deploys (snapshots of old pids are summed forever).
+
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+__all__ = ["BUCKETS", "Registry", "REGISTRY", "instrument_flask", "register_cache"]
+
+# seconds: covers a cached page (ms) up to a cold deep-scored generation (tens of s)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+Key = Tuple[str, Labels]
+
+HELP = {
+    "http_requests_total": "HTTP requests by route, method and status.",
+    "http_request_duration_seconds": "HTTP request latency by route.",
+    "http_requests_in_flight": "HTTP requests being handled.",
+    "http_request_errors_total": "Requests that raised an unhandled exception.",
+    "pipeline_stage_duration_seconds": "Time spent in each stage of a pipeline.",
+    "pipeline_runs_in_flight": "Pipelines currently running.",
+    "pipeline_errors_total": "Pipelines that raised, by the stage they were in.",
+    "job_feed_query_seconds": "Job board listing queries.",
+    "cache_hits_total": "Cache hits.",
+    "cache_misses_total": "Cache misses.",
+    "cache_evictions_total": "Cache evictions.",
+    "cache_entries": "Entries held in a cache.",
+    "cache_bytes": "Bytes held in a cache.",
+}
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class _Shard:
+    """One thread's metrics; only that thread writes to it."""
+    __slots__ = ("thread", "counters", "gauges", "hists")
+
+    def __init__(self, thread: threading.Thread | None):
+        self.thread = thread
+        self.counters: Dict[Key, float] = {}
+        self.gauges: Dict[Key, float] = {}
+        self.hists: Dict[Key, List[float]] = {}     # [bucket counts…, +Inf count, sum]
+
+
+class Registry:
+    def __init__(self, directory: str | None = None, *, flush_interval: float = 5.0,
+                 buckets: Tuple[float, ...] = BUCKETS):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.buckets = buckets
+        self._collectors: List[Tuple[Callable[[], List[Tuple[str, str, Dict[str, Any], float]]], bool]] = []
+        self._reset()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            atexit.register(self.flush)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)   # forked workers start empty
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._base = _Shard(None)                   # folded shards of finished threads
+        self._shards: List[_Shard] = []
+        self._flusher: threading.Thread | None = None
+
+    # -------- writing (no locks) ------------------------------------------
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._shards.append(shard)
+                if self.directory and self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+                    self._flusher.start()
+        return shard
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        counters = self._shard().counters
+        key = (name, _labels(labels))
+        counters[key] = counters.get(key, 0) + value
+
+    def gauge_add(self, name: str, delta: float, **labels) -> None:
+        gauges = self._shard().gauges
+        key = (name, _labels(labels))
+        gauges[key] = gauges.get(key, 0) + delta
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        hists = self._shard().hists
+        key = (name, _labels(labels))
+        h = hists.get(key)
+        if h is None:
+            h = hists[key] = [0.0] * (len(self.buckets) + 2)
+        h[bisect.bisect_left(self.buckets, value)] += 1
+        h[-1] += value
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0, **labels)
+
+    @contextmanager
+    def stages(self, pipeline: str, then: Callable[[str], None] | None = None) -> Iterator[Callable[[str], None]]:
+        """An ``on_stage`` callback that times each stage until the next one starts.
+
+        ``then`` is still called with every stage name (e.g. job.set_stage).
+        A pipeline that raises is counted against the stage it was in.
+        """
+        current: List[Any] = [None, 0.0]
+
+        def close():
+            if current[0] is not None:
+                self.observe("pipeline_stage_duration_seconds", time.perf_counter() - current[1],
+                             pipeline=pipeline, stage=current[0])
+
+        def on_stage(name: str) -> None:
+            close()
+            current[:] = [name, time.perf_counter()]
+            if then is not None:
+                then(name)
+
+        self.gauge_add("pipeline_runs_in_flight", 1, pipeline=pipeline)
+        try:
+            yield on_stage
+        except BaseException:
+            self.inc("pipeline_errors_total", pipeline=pipeline, stage=current[0] or "")
+            raise
+        finally:
+            close()
+            self.gauge_add("pipeline_runs_in_flight", -1, pipeline=pipeline)
+
+    def collector(self, fn: Callable[[], List[Tuple[str, str, Dict[str, Any], float]]], *,
+                  shared: bool = False) -> None:
+        """Register ``fn() → [(name, "counter"|"gauge", labels, value)]``.
+
+        Per-process sources are sampled into each worker's snapshot and
+        summed; ``shared`` sources (one SQLite file for all workers) are
+        read once, by the worker answering /metrics.
+        """
+        self._collectors.append((fn, shared))
+
+    # -------- collecting ----------------------------------------------------
+
+    def _sample(self, shared: bool) -> Tuple[Dict[Key, float], Dict[Key, float]]:
+        counters: Dict[Key, float] = {}
+        gauges: Dict[Key, float] = {}
+        for fn, is_shared in self._collectors:
+            if is_shared != shared:
+                continue
+            try:
+                rows = fn()
+            except Exception as e:                       # a broken source must not break /metrics
+                print(f"[metrics] collector {getattr(fn, '__name__', fn)} failed: {e}")
+                continue
+            for name, kind, labels, value in rows:
+                target = counters if kind == "counter" else gauges
+                key = (name, _labels(labels))
+                target[key] = target.get(key, 0) + value
+        return counters, gauges
+
+    def snapshot(self) -> Dict[str, Any]:
+        """This process's totals (all threads + per-process collectors), JSON-ready."""
+        counters: Dict[Key, float] = {}
+        gauges: Dict[Key, float] = {}
+        hists: Dict[Key, List[float]] = {}
+        with self._lock:
+            alive = []
+            for shard in self._shards:
+                if shard.thread is not None and not shard.thread.is_alive():
+                    _merge(self._base, shard)           # thread gone: fold, stop tracking
+                else:
+                    alive.append(shard)
+            self._shards = alive
+            for shard in [self._base] + alive:
+                _add(counters, dict(shard.counters))
+                _add(gauges, dict(shard.gauges))
+                for key, h in dict(shard.hists).items():
+                    _add_hist(hists, key, list(h))
+        c, g = self._sample(shared=False)
+        _add(counters, c)
+        _add(gauges, g)
+        return {"pid": self._pid, "buckets": list(self.buckets),
+                "counters": [[n, list(map(list, l)), v] for (n, l), v in counters.items()],
+                "gauges": [[n, list(map(list, l)), v] for (n, l), v in gauges.items()],
+                "hists": [[n, list(map(list, l)), h] for (n, l), h in hists.items()]}
+
+    def flush(self) -> None:
+        if not self.directory or os.getpid() != self._pid:
+            return
+        path = os.path.join(self.directory, f"{self._pid}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.snapshot(), fh, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[metrics] flush failed: {e}")
+
+    def _snapshots(self) -> List[Dict[str, Any]]:
+        if not self.directory:
+            return [self.snapshot()]
+        self.flush()
+        snaps = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding="utf-8") as fh:
+                    snap = json.load(fh)
+            except (OSError, ValueError):
+                continue
+            if snap["pid"] != self._pid and not _pid_alive(snap["pid"]):
+                snap["gauges"] = []
+            snaps.append(snap)
+        return snaps
+
+    def render(self) -> str:
+        """Prometheus text format of every worker's metrics."""
+        counters: Dict[Key, float] = {}
+        gauges: Dict[Key, float] = {}
+        hists: Dict[Key, List[float]] = {}
+        for snap in self._snapshots():
+            if tuple(snap["buckets"]) != self.buckets:
+                continue                                 # written by a differently configured build
+            for n, l, v in snap["counters"]:
+                _add(counters, {(n, tuple(map(tuple, l))): v})
+            for n, l, v in snap["gauges"]:
+                _add(gauges, {(n, tuple(map(tuple, l))): v})
+            for n, l, h in snap["hists"]:
+                _add_hist(hists, (n, tuple(map(tuple, l))), h)
+        c, g = self._sample(shared=True)
+        _add(counters, c)
+        _add(gauges, g)
+
+        out: List[str] = []
+        for kind, series in (("counter", counters), ("gauge", gauges)):
+            for name in sorted({n for n, _ in series}):
+                _header(out, name, kind)
+                for (n, labels), v in sorted(series.items()):
+                    if n == name:
+                        out.append(f"{name}{_fmt_labels(labels)} {_fmt(v)}")
+        for name in sorted({n for n, _ in hists}):
+            _header(out, name, "histogram")
+            for (n, labels), h in sorted(hists.items()):
+                if n != name:
+                    continue
+                cumulative = 0.0
+                for bound, count in zip(self.buckets + (float("inf"),), h[:-1]):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _fmt(bound)
+                    out.append(f"{name}_bucket{_fmt_labels(labels + (('le', le),))} {_fmt(cumulative)}")
+                out.append(f"{name}_sum{_fmt_labels(labels)} {_fmt(h[-1])}")
+                out.append(f"{name}_count{_fmt_labels(labels)} {_fmt(cumulative)}")
+        return "\n".join(out) + "\n"
+
+
+def _add(into: Dict[Key, float], src: Dict[Key, float]) -> None:
+    for key, v in src.items():
+        into[key] = into.get(key, 0) + v
+
+def _add_hist(into: Dict[Key, List[float]], key: Key, h: List[float]) -> None:
+    cur = into.get(key)
+    if cur is None:
+        into[key] = list(h)
+    else:
+        for i, v in enumerate(h):
+            cur[i] += v
+
+def _merge(base: _Shard, shard: _Shard) -> None:
+    _add(base.counters, shard.counters)
+    _add(base.gauges, shard.gauges)
+    for key, h in shard.hists.items():
+        _add_hist(base.hists, key, h)
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _header(out: List[str], name: str, kind: str) -> None:
+    if name in HELP:
+        out.append(f"# HELP {name} {HELP[name]}")
+    out.append(f"# TYPE {name} {kind}")
+
+def _fmt(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+def _fmt_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    body = ",".join('{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+                    for k, v in labels)
+    return "{" + body + "}"
+
+# -------- Integrations -----------------------------------------------------
+
+REGISTRY = Registry(os.getenv("METRICS_DIR") or None, flush_interval=float(os.getenv("METRICS_FLUSH", "5")))
+
+def register_cache(name: str, cache, *, shared: bool = False, registry: Registry = REGISTRY) -> None:
+    """Export a cache's ``stats()`` (hits / misses / evictions / entries / bytes)."""
+    def collect():
+        stats = cache.stats()
+        rows = [(f"cache_{field}_total", "counter", {"cache": name}, stats[field])
+                for field in ("hits", "misses", "evictions") if field in stats]
+        rows += [(f"cache_{field}", "gauge", {"cache": name}, stats[field])
+                 for field in ("entries", "bytes") if field in stats]
+        return rows
+    collect.__name__ = f"cache:{name}"
+    registry.collector(collect, shared=shared)
+
+def instrument_flask(app, registry: Registry = REGISTRY, *, path: str = "/metrics") -> None:
+    """Time every request by route and serve ``registry.render()`` at ``path``."""
+    from flask import Response, g, request
+
+    @app.before_request
+    def _metrics_start():
+        g._metrics_t0 = time.perf_counter()
+        registry.gauge_add("http_requests_in_flight", 1)
+
+    @app.after_request
+    def _metrics_status(resp):
+        g._metrics_status = resp.status_code
+        return resp
+
+    @app.teardown_request
+    def _metrics_end(exc):
+        t0 = g.pop("_metrics_t0", None)
+        if t0 is None:
+            return
+        registry.gauge_add("http_requests_in_flight", -1)
+        # the URL rule, not the path, so /portfolio/<path:filename> is one series
+        route = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+        status = g.pop("_metrics_status", 500)
+        if exc is not None:
+            registry.inc("http_request_errors_total", route=route)
+            status = 500
+        registry.inc("http_requests_total", route=route, method=request.method, status=status)
+        registry.observe("http_request_duration_seconds", time.perf_counter() - t0, route=route)
+
+    @app.route(path)
+    def metrics():
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,123 @@
+# parse_cache.py  – skip extraction + parsing for résumés we have seen
+# -------------------------------------------------------------------
+# Key   : SHA-256 of the uploaded PDF bytes + PARSER_VERSION
+# Value : (cleaned text, parsed dict) as JSON
+#
+# Stored in a local SQLite file so every gunicorn worker shares the same
+# entries and counters.  Entries are evicted least-recently-used first
+# once the stored values exceed ``max_bytes``.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from resume_parser import PARSER_VERSION
+
+__all__ = ["ParseCache", "file_digest"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries(last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats VALUES ('hits', 0), ('misses', 0), ('evictions', 0);
+"""
+
+
+def file_digest(path: str, chunk_size: int = 1 << 16) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ParseCache:
+    def __init__(self, path: str = "cache/parse_cache.sqlite3", *,
+                 max_bytes: int = 64 * 1024 * 1024, version: str = PARSER_VERSION):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def key_for(self, digest: str) -> str:
+        return f"{digest}:{self.version}"
+
+    # -------- lookups -------------------------------------------------
+
+    def get(self, digest: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        key = self.key_for(digest)
+        conn = self._conn()
+        with conn:
+            row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                conn.execute("UPDATE stats SET value = value + 1 WHERE name = 'misses'")
+                return None
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            conn.execute("UPDATE stats SET value = value + 1 WHERE name = 'hits'")
+        cleaned_text, data = json.loads(row[0])
+        return cleaned_text, data
+
+    def put(self, digest: str, cleaned_text: str, data: Dict[str, Any]) -> None:
+        value = json.dumps([cleaned_text, data])
+        conn = self._conn()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                         (self.key_for(digest), value, len(value), time.time()))
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        conn.execute("UPDATE stats SET value = value + ? WHERE name = 'evictions'", (evicted,))
+
+    # -------- introspection -------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._conn()
+        counters = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_ratio": counters["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "version": self.version,
+        }
+
+    def clear(self) -> None:
+        with self._conn() as conn:
+            conn.execute("DELETE FROM entries")
@@ -0,0 +1,143 @@
+# portfolio_pipeline.py  – upload → parsed data → static portfolio
+# -------------------------------------------------------------------
+# The stages used to live inline in app.generate.  They are plain
+# functions here so the same pipeline can run in the request thread or
+# inside a background job (see job_queue.py).  Stage functions that are
+# handed to ``run_cpu`` must stay top-level so they pickle into a
+# process pool.
+
+import os
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from pdf_extract       import iter_pdf_pages
+from resume_pipeline   import clean_and_parse
+from resume_pdf        import create_cleaned_resume_pdf
+from parse_cache       import file_digest
+from precompress       import is_sibling, precompress_tree
+from asset_optimizer   import optimize_site
+from image_pipeline    import ImageCache, process_photo
+
+__all__ = ["PAGES", "parse_resume_file", "generate_portfolio", "portfolio_entries"]
+
+PAGES = ["home", "skills", "projects", "experience", "education", "certificates", "languages"]
+
+
+def _inline(fn: Callable, *args):
+    return fn(*args)
+
+def _no_stage(name: str) -> None:
+    pass
+
+# -------- CPU-bound stages (process pool friendly) -------------------------
+
+def parse_resume_file(resume_path: str) -> Tuple[str, Dict[str, Any]]:
+    """PDF → (cleaned text, parsed dict), cleaning each page as it is decoded."""
+    return clean_and_parse(iter_pdf_pages(resume_path))
+
+# -------- Full pipeline ----------------------------------------------------
+
+def generate_portfolio(resume_path: str, theme: str, *, env, css: str = "",
+                       photo_path: str | None = None,
+                       image_cache: ImageCache | None = None,
+                       upload_folder: str, generated_folder: str,
+                       cache=None,
+                       render_cache=None,
+                       optimize: bool = True,
+                       run_cpu: Callable = _inline,
+                       on_stage: Callable[[str], None] = _no_stage) -> Dict[str, Any]:
+    """Run every generation stage and return a summary of the outputs.
+
+    ``run_cpu(fn, *args)`` executes a CPU-bound stage (inline by default,
+    a process pool when called from a job) and ``on_stage`` is told which
+    stage is about to start.  Rendering uses ``env`` so it must run where
+    the caller has set up whatever context the templates need.  With a
+    ``cache`` (parse_cache.ParseCache) a PDF seen before skips extraction
+    and parsing entirely, and with a ``render_cache``
+    (render_cache.RenderCache) unchanged pages are not re-rendered.
+    An uploaded ``photo_path`` is resized and re-encoded into the site
+    (see image_pipeline.py); PhotoError is a ValueError like a failed parse.
+    With ``optimize`` the exported pages are minified and their shared
+    CSS moved to one hashed file (see asset_optimizer.py).
+    """
+    on_stage("parse")
+    digest = file_digest(resume_path) if cache is not None else None
+    cached = cache.get(digest) if cache is not None else None
+    if cached is not None:
+        cleaned_text, data = cached
+    else:
+        cleaned_text, data = run_cpu(parse_resume_file, resume_path)
+        if data and cache is not None:
+            cache.put(digest, cleaned_text, data)
+    if not data:
+        raise ValueError("Resume parsing failed.")
+    data["photo"] = None
+    if photo_path:
+        on_stage("photo")
+        image_cache = image_cache or ImageCache()
+        data.update(run_cpu(process_photo, photo_path, generated_folder,
+                            image_cache.directory, image_cache.max_bytes))
+
+    on_stage("cleaned_resume")
+    txt_path = os.path.join(upload_folder, "cleaned_resume.txt")
+    with open(txt_path, "w", encoding="utf-8") as fh:
+        fh.write(cleaned_text)
+    pdf_path = os.path.join(upload_folder, "cleaned_resume.pdf")
+    run_cpu(create_cleaned_resume_pdf, cleaned_text, pdf_path)
+
+    on_stage("render")
+    ctx = {
+        "data": data,
+        "template": theme,
+        "year": datetime.now().year,
+        "css": css,
+        "is_static": True  # Flag for navbar.html
+    }
+    for page in PAGES:
+        name = f"{theme}/{page}.html"
+        if render_cache is not None:
+            rendered = render_cache.render(f"export:{name}", ctx,
+                                           lambda: env.get_template(name).render(**ctx))
+        else:
+            rendered = env.get_template(name).render(**ctx)
+        with open(os.path.join(generated_folder, f"{page}.html"), "w", encoding="utf-8") as f:
+            f.write(rendered)
+
+    optimized = None
+    if optimize:
+        on_stage("optimize")
+        optimized = run_cpu(optimize_site, generated_folder, [f"{page}.html" for page in PAGES])
+
+    on_stage("compress")
+    # .gz / .br siblings so previews are served pre-compressed (see precompress.py)
+    run_cpu(precompress_tree, generated_folder)
+
+    return {
+        "resume": os.path.basename(resume_path),
+        "theme": theme,
+        "data": data,
+        "folder": generated_folder,
+        "cleaned_txt": txt_path,
+        "cleaned_pdf": pdf_path,
+        "optimized": optimized,
+    }
+
+# -------- Export -----------------------------------------------------------
+
+def portfolio_entries(site_dir: str) -> List[Tuple[str, Path]]:
+    """``(arcname, path)`` for every file of a generated site, for ZIP / push.
+
+    The archive itself is no longer written at generation time; the
+    download route streams it from these entries (see zip_stream.py).
+    The precompressed .gz / .br siblings are for serving only and are
+    left out (the ZIP deflates on its own, GitHub Pages compresses).
+    """
+    entries = []
+    for root, _, files in os.walk(site_dir):
+        for name in sorted(files):
+            if is_sibling(name):
+                continue
+            path = Path(root, name)
+            entries.append((path.relative_to(site_dir).as_posix(), path))
+    return entries
@@ -0,0 +1,111 @@
+# precompress.py  – gzip / brotli siblings for static output
+# -------------------------------------------------------------------
+# Generated portfolio pages and theme assets are text and compress
+# 5-10x, but were sent raw.  Compressing per response would cost CPU on
+# every preview hit, so the export stage writes
+#
+#   page.html  →  page.html.gz  (always)
+#                 page.html.br  (``Brotli`` in requirements.txt)
+#
+# once, at maximum quality, and only keeps a sibling that is actually
+# smaller.  asset_cache.asset_response() picks the best sibling for the
+# request's Accept-Encoding.  A sibling older than its source is ignored,
+# so stale output is never served.
+
+import gzip
+import os
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import brotli
+except ImportError:          # a bare install without Brotli still serves gzip
+    brotli = None
+
+__all__ = ["COMPRESSIBLE", "SIBLING_SUFFIXES", "available_encodings", "precompress_file",
+           "precompress_tree", "is_sibling", "negotiate"]
+
+COMPRESSIBLE = {".html", ".htm", ".css", ".js", ".mjs", ".json", ".svg", ".txt", ".xml", ".map"}
+
+# encoding → file suffix, in order of preference
+SIBLING_SUFFIXES: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+
+def available_encodings() -> List[str]:
+    return [enc for enc in SIBLING_SUFFIXES if enc != "br" or brotli is not None]
+
+def is_sibling(name: str) -> bool:
+    return name.endswith(tuple(SIBLING_SUFFIXES.values()))
+
+def _compress(encoding: str, data: bytes) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def precompress_file(path: str, *, min_size: int = 256) -> Dict[str, int]:
+    """Write the compressed siblings of ``path``; returns ``{encoding: bytes}`` written."""
+    if os.path.splitext(path)[1].lower() not in COMPRESSIBLE or is_sibling(path):
+        return {}
+    st = os.stat(path)
+    if st.st_size < min_size:
+        return {}
+    with open(path, "rb") as fh:
+        data = fh.read()
+
+    written = {}
+    for encoding in available_encodings():
+        sibling = path + SIBLING_SUFFIXES[encoding]
+        try:
+            if os.stat(sibling).st_mtime >= st.st_mtime:
+                continue                               # already up to date
+        except FileNotFoundError:
+            pass
+        packed = _compress(encoding, data)
+        if len(packed) >= len(data):
+            continue
+        tmp = f"{sibling}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(packed)
+        os.replace(tmp, sibling)
+        written[encoding] = len(packed)
+    return written
+
+def precompress_tree(root: str, **kwargs) -> int:
+    """Precompress every compressible file under ``root``; returns files written."""
+    count = 0
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            count += len(precompress_file(os.path.join(dirpath, name), **kwargs))
+    return count
+
+# -------- Negotiation ----------------------------------------------------------
+
+def _parse_accept(header: str) -> Dict[str, float]:
+    prefs = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        if token == "x-gzip":
+            token = "gzip"
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        prefs[token] = q
+    return prefs
+
+def negotiate(accept_encoding: str | None, offered: Iterable[str]) -> str | None:
+    """The best of ``offered`` for an Accept-Encoding header (None → identity)."""
+    prefs = _parse_accept(accept_encoding or "")
+    best: Tuple[float, int] | None = None
+    choice = None
+    for rank, encoding in enumerate(offered):
+        q = prefs.get(encoding, prefs.get("*", 0.0))
+        if q > 0 and (best is None or (q, -rank) > best):
+            best, choice = (q, -rank), encoding
+    return choice
@@ -0,0 +1,77 @@
+# render_cache.py  – rendered portfolio pages, kept until the data changes
+# -------------------------------------------------------------------
+# The theme routes re-rendered the same template with the same parsed
+# résumé on every click.  Pages are now cached in memory under
+#
+#   (template name, fingerprint of the render context)
+#
+# where the context includes the parsed data, so a user whose data
+# changes simply stops hitting the old entries – no explicit
+# invalidation – and those age out least-recently-used first once the
+# cache holds more than ``max_bytes`` of HTML.  One cache is shared by
+# the theme routes, render_page() and the static export.
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+__all__ = ["fingerprint", "RenderCache"]
+
+Key = Tuple[str, str]
+
+
+def fingerprint(ctx: Dict[str, Any]) -> str:
+    """Stable hash of a JSON-like render context (key order does not matter)."""
+    blob = json.dumps(ctx, sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RenderCache:
+    def __init__(self, *, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: int = 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[Key, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def render(self, template_name: str, ctx: Dict[str, Any], render: Callable[[], str]) -> str:
+        """The cached page for ``(template_name, ctx)``, calling ``render()`` on a miss."""
+        key = (template_name, fingerprint(ctx))
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = render()
+        size = sys.getsizeof(html)
+        if size > self.max_entry_bytes:
+            return html
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= sys.getsizeof(old)
+            self._entries[key] = html
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= sys.getsizeof(evicted)
+                self.evictions += 1
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
@@ -0,0 +1,200 @@
+# comparator.py  – compare a stack of parsed résumés
+# -------------------------------------------------------------------
+# Every résumé is split into sections (skills, experience, projects,
+# education, summary); each section gets its own TF-IDF space (see
+# matcher.TfidfIndex) and the overall similarity is the weighted sum of
+# the per-section cosines, so every score comes with a breakdown.
+#
+#   against()      : rank all résumés against a job requirement
+#   iter_similar() : top-k most similar candidates for each résumé
+#   top_pairs()    : the k most similar pairs in the whole stack
+#
+# Pairwise work is done ``block`` rows at a time (one sparse product per
+# section per block), so memory is O(block × N), never the full N × N.
+#
+# CLI:  python -m resume_analyzer.comparator cohort.jsonl -r "python, sql" -k 10
+#       (cohort.jsonl as written by batch_ingest.py; results go to stdout
+#        as JSON Lines)
+
+import argparse
+import heapq
+import json
+import sys
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .matcher import TfidfIndex
+
+__all__ = ["SECTION_WEIGHTS", "section_texts", "Comparator"]
+
+SECTION_WEIGHTS = {
+    "skills": 0.4, "experience": 0.3, "projects": 0.15, "education": 0.1, "summary": 0.05,
+}
+
+
+def _entries(entries: Any, fields: Sequence[str]) -> str:
+    parts = []
+    for entry in entries or []:
+        if isinstance(entry, dict):
+            parts.extend(str(entry.get(f) or "") for f in fields)
+        else:
+            parts.append(str(entry))
+    return "\n".join(parts)
+
+def section_texts(data: Dict[str, Any]) -> Dict[str, str]:
+    """One text per comparison section of a parse_resume_text dict."""
+    return {
+        "skills": ", ".join(str(s) for s in data.get("skills") or []),
+        "experience": _entries(data.get("experience"), ("title", "company", "description")),
+        "projects": _entries(data.get("projects"), ("title", "description")),
+        "education": _entries(data.get("education"), ("degree", "institution")),
+        "summary": str(data.get("summary") or ""),
+    }
+
+
+class Comparator:
+    def __init__(self, resumes: Sequence[Dict[str, Any]], ids: Sequence[str] | None = None,
+                 *, weights: Dict[str, float] = SECTION_WEIGHTS):
+        self.ids = list(ids) if ids is not None else [str(i) for i in range(len(resumes))]
+        if len(self.ids) != len(resumes):
+            raise ValueError("ids and resumes differ in length")
+        self.weights = dict(weights)
+        texts = [section_texts(r) for r in resumes]
+        keys = [str(i) for i in range(len(resumes))]
+        self.indices: Dict[str, TfidfIndex] = {}
+        self.matrices = {}
+        for section in self.weights:
+            index = TfidfIndex()
+            index.add(keys, [t[section] for t in texts])
+            self.indices[section] = index
+            self.matrices[section] = index.weighted()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _result(self, j: int, score: float, parts: Dict[str, float]) -> Dict[str, Any]:
+        return {"index": j, "id": self.ids[j], "score": round(score, 4),
+                "sections": {s: round(v, 4) for s, v in parts.items()}}
+
+    # -------- against a requirement -----------------------------------
+
+    def against(self, requirement: str | Dict[str, str], k: int = 10) -> List[Dict[str, Any]]:
+        """Top-``k`` résumés for a requirement: plain text (matched against every
+        section) or ``{section: text}`` for only some sections."""
+        if isinstance(requirement, str):
+            requirement = {s: requirement for s in self.weights}
+        sections = [s for s in self.weights if requirement.get(s)]
+        if not sections or not self.ids or k <= 0:
+            return []
+        norm = sum(self.weights[s] for s in sections)
+        per_section = {}
+        for s in sections:
+            query = self.indices[s].vectorize([requirement[s]])
+            per_section[s] = (self.matrices[s] @ query.T).toarray().ravel() * (self.weights[s] / norm)
+        total = sum(per_section.values())
+
+        k = min(k, len(total))
+        top = np.argpartition(-total, k - 1)[:k]
+        top = top[np.argsort(-total[top], kind="stable")]
+        return [self._result(int(j), float(total[j]), {s: float(v[j]) for s, v in per_section.items()})
+                for j in top]
+
+    # -------- pairwise ------------------------------------------------
+
+    def _block(self, start: int, stop: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Weighted per-section and total similarity of rows start:stop to every résumé."""
+        per_section = {}
+        total = np.zeros((stop - start, len(self.ids)), dtype=np.float32)
+        for s, w in self.weights.items():
+            m = self.matrices[s]
+            sim = (m[start:stop] @ m.T).toarray()
+            sim *= np.float32(w)
+            total += sim
+            per_section[s] = sim
+        return total, per_section
+
+    def iter_similar(self, k: int = 10, *, block: int = 256) -> Iterator[Dict[str, Any]]:
+        """For each résumé in order, its ``k`` most similar other résumés."""
+        n = len(self.ids)
+        k = min(k, n - 1)
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            total, per_section = self._block(start, stop)
+            rows = np.arange(stop - start)
+            total[rows, rows + start] = -np.inf            # not similar to itself
+            if k <= 0:
+                top = np.zeros((stop - start, 0), dtype=np.int64)
+            else:
+                top = np.argpartition(-total, k - 1, axis=1)[:, :k]
+                order = np.argsort(-np.take_along_axis(total, top, axis=1), axis=1, kind="stable")
+                top = np.take_along_axis(top, order, axis=1)
+            for r in rows:
+                i = start + int(r)
+                yield {"index": i, "id": self.ids[i], "similar": [
+                    self._result(int(j), float(total[r, j]),
+                                 {s: float(v[r, j]) for s, v in per_section.items()})
+                    for j in top[r]]}
+
+    def top_pairs(self, k: int = 10, *, block: int = 256) -> List[Dict[str, Any]]:
+        """The ``k`` most similar distinct pairs ``(i < j)`` across the whole stack."""
+        n = len(self.ids)
+        heap: List[Tuple[float, int, int, Dict[str, float]]] = []
+        cols = np.arange(n)
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            total, per_section = self._block(start, stop)
+            total[cols[None, :] <= np.arange(start, stop)[:, None]] = -np.inf   # upper triangle only
+            flat = total.ravel()
+            m = min(k, int(np.isfinite(flat).sum()))
+            if m <= 0:
+                continue
+            for idx in np.argpartition(-flat, m - 1)[:m]:
+                r, j = divmod(int(idx), n)
+                score = float(flat[idx])
+                if len(heap) < k or score > heap[0][0]:
+                    parts = {s: float(v[r, j]) for s, v in per_section.items()}
+                    item = (score, start + r, j, parts)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    else:
+                        heapq.heapreplace(heap, item)
+        pairs = sorted(heap, key=lambda item: (-item[0], item[1], item[2]))
+        return [{"a": {"index": i, "id": self.ids[i]}, "b": {"index": j, "id": self.ids[j]},
+                 "score": round(score, 4), "sections": {s: round(v, 4) for s, v in parts.items()}}
+                for score, i, j, parts in pairs]
+
+
+# -------- CLI ----------------------------------------------------------------
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Compare parsed résumés (JSON Lines from batch_ingest.py).")
+    ap.add_argument("path", help="JSON Lines file with a 'data' object per résumé")
+    ap.add_argument("-r", "--requirement", help="rank candidates against this job requirement")
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--pairs", action="store_true", help="print the k most similar pairs instead")
+    ap.add_argument("--block", type=int, default=256, help="rows per pairwise block")
+    args = ap.parse_args(argv)
+
+    ids, resumes = [], []
+    with open(args.path, encoding="utf-8") as fh:
+        for line in fh:
+            record = json.loads(line)
+            if "data" in record:
+                ids.append(record.get("source", str(len(ids))))
+                resumes.append(record["data"])
+
+    comparator = Comparator(resumes, ids)
+    out = sys.stdout
+    if args.requirement:
+        rows = comparator.against(args.requirement, args.k)
+    elif args.pairs:
+        rows = comparator.top_pairs(args.k, block=args.block)
+    else:
+        rows = comparator.iter_similar(args.k, block=args.block)
+    for row in rows:
+        out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
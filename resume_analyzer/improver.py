@@ -1,22 +1,138 @@
+# improver.py  – improved résumé as DOCX, rebuilt section by section
+# -------------------------------------------------------------------
+# Building a fresh Document() means reading python-docx's default
+# template from disk and styling every paragraph again on every call.
+# Instead:
+#
+#   * the base document (styles applied, empty body) is built – or read
+#     from IMPROVER_TEMPLATE – once per process and kept as bytes; each
+#     request opens its own copy from memory
+#   * every section's body XML is returned with a content hash; when the
+#     same user runs the analyzer again, sections whose data did not
+#     change are pasted back from that XML instead of being regenerated
+#   * output can go to a path or to an in-memory buffer for streaming
+
+import hashlib
+import io
+import json
+import os
+from typing import Any, Callable, Dict, List, Tuple
+
 from docx import Document
+from docx.oxml import parse_xml
+from docx.shared import Pt
+from lxml import etree
+
+__all__ = ["SECTIONS", "build_improved", "improve_resume"]
+
+IMPROVER_VERSION = "1"   # bump when a section builder changes
+
+TEMPLATE_PATH = os.getenv("IMPROVER_TEMPLATE", os.path.join("templates", "resume_base.docx"))
+
+# section name → [content hash, XML of each body element it produced]
+SectionState = Dict[str, List[str]]
+
+_base: bytes | None = None
+
+
+def _base_bytes() -> bytes:
+    """The base document, built (or loaded) on first use."""
+    global _base
+    if _base is None:
+        if os.path.exists(TEMPLATE_PATH):
+            with open(TEMPLATE_PATH, "rb") as fh:
+                _base = fh.read()
+        else:
+            doc = Document()
+            normal = doc.styles["Normal"]
+            normal.font.name = "Calibri"
+            normal.font.size = Pt(11)
+            buf = io.BytesIO()
+            doc.save(buf)
+            _base = buf.getvalue()
+    return _base
+
+def _entry_text(entry):
+    # pyresparser gives strings, resume_parser gives dicts of fields
+    if isinstance(entry, dict):
+        return " – ".join(str(v) for v in entry.values() if v)
+    return str(entry)
 
-def improve_resume(file_path, output_path, extracted_data):
-    doc = Document()
-    doc.add_heading(extracted_data.get('name', 'Name Unknown'), level=0)
+# -------- Sections -----------------------------------------------------------
 
+def _header(doc, data):
+    doc.add_heading(data.get('name', 'Name Unknown'), level=0)
+
+def _contact(doc, data):
     doc.add_heading('Contact Info', level=1)
-    doc.add_paragraph(f"Email: {extracted_data.get('email')}")
-    doc.add_paragraph(f"Phone: {extracted_data.get('phone')}")
+    doc.add_paragraph(f"Email: {data.get('email')}")
+    doc.add_paragraph(f"Phone: {data.get('phone')}")
 
+def _skills(doc, data):
     doc.add_heading('Skills', level=1)
-    doc.add_paragraph(", ".join(extracted_data.get('skills', [])))
+    doc.add_paragraph(", ".join(data.get('skills') or []))
 
+def _experience(doc, data):
     doc.add_heading('Experience', level=1)
-    for exp in extracted_data.get('experience', []):
-        doc.add_paragraph(exp)
+    for exp in data.get('experience') or []:
+        doc.add_paragraph(_entry_text(exp))
 
+def _education(doc, data):
     doc.add_heading('Education', level=1)
-    for edu in extracted_data.get('education', []):
-        doc.add_paragraph(edu)
+    for edu in data.get('education') or []:
+        doc.add_paragraph(_entry_text(edu))
+
+# name, builder, the data fields it reads
+SECTIONS: Tuple[Tuple[str, Callable, Tuple[str, ...]], ...] = (
+    ("header",     _header,     ("name",)),
+    ("contact",    _contact,    ("email", "phone")),
+    ("skills",     _skills,     ("skills",)),
+    ("experience", _experience, ("experience",)),
+    ("education",  _education,  ("education",)),
+)
+
+def _digest(data: Dict[str, Any], fields: Tuple[str, ...]) -> str:
+    blob = json.dumps([IMPROVER_VERSION] + [data.get(f) for f in fields], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+# -------- Building -----------------------------------------------------------
+
+def _content_len(body) -> int:
+    # python-docx keeps <w:sectPr> as the body's last child and inserts before it
+    return len(body) - (1 if body.sectPr is not None else 0)
+
+def _append(body, el) -> None:
+    if body.sectPr is not None:
+        body.sectPr.addprevious(el)
+    else:
+        body.append(el)
+
+def build_improved(extracted_data: Dict[str, Any], previous: SectionState | None = None):
+    """``(Document, section state)``; pass the state back in as ``previous``
+    next time to reuse the sections whose data did not change."""
+    doc = Document(io.BytesIO(_base_bytes()))
+    body = doc.element.body
+    previous = previous or {}
+    state: SectionState = {}
+
+    for name, build, fields in SECTIONS:
+        digest = _digest(extracted_data, fields)
+        cached = previous.get(name)
+        if cached and cached[0] == digest:
+            for xml in cached[1:]:
+                _append(body, parse_xml(xml))
+            state[name] = cached
+            continue
+
+        start = _content_len(body)
+        build(doc, extracted_data)
+        added = body[start:_content_len(body)]
+        state[name] = [digest] + [etree.tostring(el, encoding="unicode") for el in added]
+    return doc, state
 
+def improve_resume(file_path, output_path, extracted_data, previous=None):
+    """Write the improved résumé to ``output_path`` (a path or a writable
+    buffer such as BytesIO); returns the section state for next time."""
+    doc, state = build_improved(extracted_data, previous)
     doc.save(output_path)
+    return state
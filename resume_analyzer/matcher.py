@@ -0,0 +1,323 @@
+# matcher.py  – TF-IDF matching of résumés against job descriptions
+# -------------------------------------------------------------------
+# Documents are turned into sparse term-count rows (SciPy CSR); TF-IDF
+# weighting and L2 normalisation are applied in bulk, so ranking every
+# indexed document against a query – or a block of queries – is one
+# sparse matrix product followed by a top-k partition.
+#
+#   TfidfIndex  : the index itself – incremental add/remove/sync, search,
+#                 save/load (arrays memory-mapped on load)
+#   JobMatcher  : a TfidfIndex of job-board listings kept on disk under
+#                 cache/job_index/ and re-synced after every JobFeed
+#                 refresh; other workers pick up new generations lazily
+#   rank_resumes: the reverse direction – many résumés against one job
+#
+# On disk an index is a generation directory of .npy arrays plus JSON,
+# and a CURRENT file naming the live generation (swapped atomically);
+# saves are serialised across processes by an flock on LOCK.
+
+import fcntl
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+__all__ = ["tokenize", "resume_text", "job_text", "job_key", "TfidfIndex", "JobMatcher", "rank_resumes"]
+
+TOKEN_RX = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or our that the their
+    this to was we were will with you your
+""".split())
+
+Match = Tuple[str, float]
+
+# -------- Text -------------------------------------------------------------
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN_RX.findall(text.lower()) if t not in STOPWORDS]
+
+def resume_text(data: Dict[str, Any]) -> str:
+    """The parts of a parse_resume_text dict that say what the person does."""
+    parts = [data.get("title") or "", data.get("summary") or ""]
+    parts.extend(str(s) for s in data.get("skills") or [])
+    for key in ("experience", "projects"):
+        for entry in data.get(key) or []:
+            if isinstance(entry, dict):
+                parts.append(entry.get("title", ""))
+                parts.append(entry.get("description", ""))
+            else:
+                parts.append(str(entry))
+    return "\n".join(parts)
+
+def job_text(job: Dict[str, Any]) -> str:
+    return "\n".join(str(job.get(k) or "") for k in ("title", "company", "description", "tags"))
+
+def job_key(job: Dict[str, Any]) -> str:
+    link = job.get("link")
+    return link if link and link != "#" else f"{job.get('title')}@{job.get('company')}"
+
+# -------- Index ------------------------------------------------------------
+
+class TfidfIndex:
+    def __init__(self):
+        self.vocab: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.meta: List[Any] = []
+        self._row: Dict[str, int] = {}
+        self.counts = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.df = np.zeros(0, dtype=np.int64)
+        self._weighted: sparse.csr_matrix | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._row
+
+    def meta_for(self, doc_id: str) -> Any:
+        return self.meta[self._row[doc_id]]
+
+    # -------- building ------------------------------------------------
+
+    def _count_rows(self, texts: Iterable[str], *, grow: bool) -> sparse.csr_matrix:
+        data, indices, indptr = [], [], [0]
+        for text in texts:
+            counts = Counter(tokenize(text))
+            for term, n in counts.items():
+                col = self.vocab.get(term)
+                if col is None:
+                    if not grow:
+                        continue
+                    col = self.vocab[term] = len(self.vocab)
+                indices.append(col)
+                data.append(n)
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.vocab)))
+
+    def add(self, ids: Sequence[str], texts: Sequence[str], meta: Sequence[Any] | None = None) -> int:
+        """Append documents (ids already indexed are skipped); returns how many were added."""
+        fresh = [i for i, doc_id in enumerate(ids) if doc_id not in self._row]
+        if not fresh:
+            return 0
+        rows = self._count_rows((texts[i] for i in fresh), grow=True)
+        width = len(self.vocab)
+        old = self.counts
+        old = sparse.csr_matrix((old.data, old.indices, old.indptr), shape=(old.shape[0], width))
+        self.counts = sparse.vstack([old, rows], format="csr")
+        self.df = np.concatenate([self.df, np.zeros(width - len(self.df), dtype=np.int64)])
+        self.df += np.bincount(rows.indices, minlength=width)
+        for i in fresh:
+            self._row[ids[i]] = len(self.ids)
+            self.ids.append(ids[i])
+            self.meta.append(meta[i] if meta is not None else None)
+        self._weighted = None
+        return len(fresh)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Drop documents by id; returns how many were removed."""
+        drop = {self._row[i] for i in ids if i in self._row}
+        if not drop:
+            return 0
+        keep = np.array([r for r in range(len(self.ids)) if r not in drop], dtype=np.int64)
+        gone = self.counts[sorted(drop)]
+        self.df -= np.bincount(gone.indices, minlength=len(self.df))
+        self.counts = self.counts[keep]
+        self.ids = [self.ids[r] for r in keep]
+        self.meta = [self.meta[r] for r in keep]
+        self._row = {doc_id: r for r, doc_id in enumerate(self.ids)}
+        self._weighted = None
+        return len(drop)
+
+    def sync(self, docs: Dict[str, Tuple[str, Any]]) -> Tuple[int, int]:
+        """Make the index hold exactly ``docs`` (id → (text, meta)); returns (added, removed)."""
+        removed = self.remove([doc_id for doc_id in self.ids if doc_id not in docs])
+        new = [doc_id for doc_id in docs if doc_id not in self._row]
+        added = self.add(new, [docs[d][0] for d in new], [docs[d][1] for d in new])
+        return added, removed
+
+    # -------- weighting -----------------------------------------------
+
+    def idf(self) -> np.ndarray:
+        n = len(self.ids)
+        return (np.log((1.0 + n) / (1.0 + self.df)) + 1.0).astype(np.float32)
+
+    def _tfidf(self, counts: sparse.csr_matrix) -> sparse.csr_matrix:
+        """Sublinear TF × IDF, rows L2-normalised."""
+        idf = self.idf()
+        out = counts.astype(np.float32, copy=True)
+        out.data = (1.0 + np.log(out.data)) * idf[out.indices]
+        row_of = np.repeat(np.arange(out.shape[0]), np.diff(out.indptr))
+        norms = np.sqrt(np.bincount(row_of, weights=out.data ** 2, minlength=out.shape[0]))
+        norms[norms == 0] = 1.0
+        out.data /= norms[row_of].astype(np.float32)
+        return out
+
+    def weighted(self) -> sparse.csr_matrix:
+        if self._weighted is None:
+            self._weighted = self._tfidf(self.counts)
+        return self._weighted
+
+    def vectorize(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """TF-IDF rows for ``texts`` in this index's vocabulary (unknown terms dropped)."""
+        return self._tfidf(self._count_rows(texts, grow=False))
+
+    # -------- querying ------------------------------------------------
+
+    def _top(self, scores: np.ndarray, k: int) -> List[Match]:
+        k = min(k, scores.shape[0])
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.ids[i], float(scores[i])) for i in top if scores[i] > 0]
+
+    def search(self, text: str, k: int = 10) -> List[Match]:
+        return next(self.search_many([text], k))
+
+    def search_many(self, texts: Sequence[str], k: int = 10, *, block: int = 256) -> Iterator[List[Match]]:
+        """Top-``k`` ``(id, cosine)`` per query, scoring ``block`` queries per product."""
+        if not self.ids:
+            for _ in texts:
+                yield []
+            return
+        docs_t = self.weighted().T          # CSC view, no copy
+        for start in range(0, len(texts), block):
+            queries = self.vectorize(texts[start:start + block])
+            scores = (queries @ docs_t).toarray()
+            for row in scores:
+                yield self._top(row, k)
+
+    # -------- persistence ---------------------------------------------
+
+    def save(self, directory: str) -> str:
+        """Write a new generation under ``directory`` and make it current.
+
+        Holds an exclusive lock on ``directory``/LOCK throughout, so two
+        workers saving at once never delete each other's generation.
+        """
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "LOCK"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                return self._save_locked(directory)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _save_locked(self, directory: str) -> str:
+        gen = uuid.uuid4().hex[:12]
+        path = os.path.join(directory, gen)
+        os.makedirs(path)
+        counts = self.counts
+        for name, arr in (("data", counts.data), ("indices", counts.indices),
+                          ("indptr", counts.indptr), ("df", self.df)):
+            np.save(os.path.join(path, f"{name}.npy"), arr)
+        terms = sorted(self.vocab, key=self.vocab.__getitem__)
+        with open(os.path.join(path, "index.json"), "w", encoding="utf-8") as fh:
+            json.dump({"terms": terms, "ids": self.ids, "meta": self.meta,
+                       "shape": list(counts.shape)}, fh, ensure_ascii=False)
+
+        tmp = os.path.join(directory, f"CURRENT.{os.getpid()}.tmp")
+        with open(tmp, "w") as fh:
+            fh.write(gen)
+        os.replace(tmp, os.path.join(directory, "CURRENT"))
+
+        # older generations stay readable for anyone who has them mapped;
+        # never remove whatever CURRENT names now, nor the one just written
+        with open(os.path.join(directory, "CURRENT")) as fh:
+            keep = {fh.read().strip(), gen}
+        for entry in os.scandir(directory):
+            if entry.is_dir() and entry.name not in keep:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        return gen
+
+    @classmethod
+    def load(cls, directory: str) -> "TfidfIndex":
+        """The current generation under ``directory`` (arrays memory-mapped, read-only)."""
+        with open(os.path.join(directory, "CURRENT")) as fh:
+            path = os.path.join(directory, fh.read().strip())
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+                  for name in ("data", "indices", "indptr", "df")}
+        with open(os.path.join(path, "index.json"), encoding="utf-8") as fh:
+            info = json.load(fh)
+
+        index = cls()
+        index.vocab = {term: i for i, term in enumerate(info["terms"])}
+        index.ids = info["ids"]
+        index.meta = info["meta"]
+        index._row = {doc_id: r for r, doc_id in enumerate(index.ids)}
+        index.counts = sparse.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]),
+                                         shape=tuple(info["shape"]), copy=False)
+        index.df = np.array(arrays["df"])     # small, and updated in place by add/remove
+        return index
+
+
+# -------- Job board --------------------------------------------------------
+
+class JobMatcher:
+    """Job-board listings indexed for résumé matching, shared through ``directory``."""
+
+    def __init__(self, directory: str = "cache/job_index"):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._gen: str | None = None
+        self.index = TfidfIndex()
+        self._reload()
+
+    def _current(self) -> str | None:
+        try:
+            with open(os.path.join(self.directory, "CURRENT")) as fh:
+                return fh.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def _reload(self) -> None:
+        gen = self._current()
+        if gen is None or gen == self._gen:
+            return
+        try:
+            self.index = TfidfIndex.load(self.directory)
+            self._gen = gen
+        except FileNotFoundError:       # replaced while we were reading; next call retries
+            pass
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def sync(self, jobs: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Index exactly ``jobs`` (e.g. after a JobFeed refresh) and publish it to disk."""
+        docs = {job_key(j): (job_text(j), j) for j in jobs}
+        with self._lock:
+            self._reload()
+            added, removed = self.index.sync(docs)
+            if added or removed or self._gen is None:
+                self._gen = self.index.save(self.directory)
+        return added, removed
+
+    def match(self, data: Dict[str, Any], k: int = 10) -> List[Dict[str, Any]]:
+        """The ``k`` listings closest to a parsed résumé, each with a ``score``."""
+        with self._lock:
+            self._reload()
+            index = self.index
+        return [{**index.meta_for(doc_id), "score": round(score, 4)}
+                for doc_id, score in index.search(resume_text(data), k)]
+
+
+def rank_resumes(job: Dict[str, Any] | str, resumes: Sequence[Dict[str, Any]],
+                 k: int = 10) -> List[Tuple[int, float]]:
+    """Top-``k`` ``(position in resumes, cosine)`` for one job description."""
+    index = TfidfIndex()
+    index.add([str(i) for i in range(len(resumes))], [resume_text(r) for r in resumes])
+    text = job if isinstance(job, str) else job_text(job)
+    return [(int(doc_id), score) for doc_id, score in index.search(text, k)]
@@ -0,0 +1,140 @@
+# rule_scorer.py  – fast résumé scoring from parse_resume_text output
+# -------------------------------------------------------------------
+# The pyresparser scorer needs spaCy + NLTK just to award fixed points
+# for fields that resume_parser.parse_resume_text already extracts.
+# This scorer works on that dict and is driven by the RULES table below:
+#
+#   present  : field is filled in (parser placeholders don't count)
+#   count    : number of entries, mapped through ``bands``
+#   density  : words matching ``keywords`` / ``pattern`` per 100 words
+#              of the descriptive text
+#   length   : word count of that same text
+#
+# ``bands`` are ``(lower bound, fraction of weight)`` pairs in ascending
+# order; the last band whose bound the measurement reaches applies.
+# Weights add up to 100.  The pyresparser path stays available as the
+# "deep" mode in scorer.py.
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+__all__ = ["Rule", "RULES", "score_parsed", "score_many_parsed"]
+
+# Values parse_resume_text fills in when it found nothing
+PLACEHOLDERS = {
+    "", "Not Available", "Your Name", "Professional",
+    "Experienced professional with a passion for excellence.",
+}
+
+DEGREE_RX = re.compile(
+    r"\b(b\.?\s?tech|m\.?\s?tech|b\.?\s?e|m\.?\s?e|b\.?\s?sc|m\.?\s?sc|b\.?\s?com|m\.?\s?com|"
+    r"bca|mca|mba|ph\.?\s?d|bachelor|master|diploma|degree)\b", re.I)
+
+ACTION_VERBS = frozenset("""
+    achieved analyzed automated built created delivered deployed designed developed
+    drove implemented improved increased launched led managed migrated optimized
+    reduced refactored resolved scaled shipped streamlined
+""".split())
+
+WORD_RX = re.compile(r"[A-Za-z][A-Za-z+#.'-]*|\d[\d.,]*%?")
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    weight: float
+    kind: str                    # "present" | "count" | "density" | "length"
+    field: str = ""
+    bands: Tuple[Tuple[float, float], ...] = ()
+    keywords: frozenset = frozenset()
+    pattern: str = ""            # regex a whole word must match (density)
+
+
+RULES: Tuple[Rule, ...] = (
+    Rule("skills",      15, "present", "skills"),
+    Rule("experience",  15, "present", "experience"),
+    Rule("education",   10, "present", "education"),
+    Rule("email",       10, "present", "email"),
+    Rule("phone",       10, "present", "phone"),
+    Rule("designation",  5, "present", "title"),
+    Rule("degree",       5, "present", "degree"),
+    Rule("summary",      5, "present", "summary"),
+    Rule("skill_count", 10, "count",   "skills",   bands=((3, 0.5), (8, 1.0))),
+    Rule("projects",     5, "count",   "projects", bands=((1, 0.5), (2, 1.0))),
+    Rule("action_verbs", 5, "density", bands=((1, 0.5), (3, 1.0)), keywords=ACTION_VERBS),
+    Rule("metrics",      5, "density", bands=((0.5, 0.5), (1.5, 1.0)), pattern=r"\d[\d.,]*%?"),
+    Rule("length",       5, "length",  bands=((150, 0.5), (300, 1.0), (1200, 0.5))),
+)
+
+# -------- Measurements -----------------------------------------------------
+
+def _degrees(data: Dict[str, Any]) -> List[str]:
+    return [e["degree"] for e in data.get("education") or []
+            if isinstance(e, dict) and DEGREE_RX.search(e.get("degree", ""))]
+
+# Fields that are derived rather than read straight from the dict
+DERIVED: Dict[str, Callable[[Dict[str, Any]], Any]] = {"degree": _degrees}
+
+def _value(data: Dict[str, Any], field: str) -> Any:
+    derive = DERIVED.get(field)
+    return derive(data) if derive else data.get(field)
+
+def _filled(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip() not in PLACEHOLDERS
+    return bool(value)
+
+def _prose(data: Dict[str, Any]) -> List[str]:
+    """Words of the summary and every experience/project description."""
+    parts = [data.get("summary") or ""]
+    for key in ("experience", "projects"):
+        for entry in data.get(key) or []:
+            if isinstance(entry, dict):
+                parts.append(entry.get("title", ""))
+                parts.append(entry.get("description", ""))
+            else:
+                parts.append(str(entry))
+    parts.extend(str(s) for s in data.get("skills") or [])
+    return WORD_RX.findall(" ".join(parts))
+
+def _band(value: float, bands: Tuple[Tuple[float, float], ...]) -> float:
+    fraction = 0.0
+    for bound, frac in bands:
+        if value < bound:
+            break
+        fraction = frac
+    return fraction
+
+# -------- Scoring ----------------------------------------------------------
+
+def score_parsed(data: Dict[str, Any] | None, rules: Tuple[Rule, ...] = RULES) -> Tuple[int, Dict[str, float]]:
+    """``(score out of 100, points per rule)`` for a parse_resume_text dict."""
+    if not data:
+        return 0, {}
+    words = None
+    breakdown: Dict[str, float] = {}
+    for rule in rules:
+        if rule.kind == "present":
+            fraction = 1.0 if _filled(_value(data, rule.field)) else 0.0
+        elif rule.kind == "count":
+            value = _value(data, rule.field)
+            fraction = _band(len(value) if isinstance(value, (list, tuple)) else 0, rule.bands)
+        else:
+            if words is None:
+                words = _prose(data)
+            if rule.kind == "length":
+                fraction = _band(len(words), rule.bands)
+            elif rule.kind == "density":
+                rx = re.compile(rule.pattern) if rule.pattern else None
+                hits = sum(1 for w in words
+                           if w.lower() in rule.keywords or (rx is not None and rx.fullmatch(w)))
+                fraction = _band(100 * hits / len(words) if words else 0.0, rule.bands)
+            else:
+                raise ValueError(f"unknown rule kind {rule.kind!r} in {rule.name}")
+        breakdown[rule.name] = rule.weight * fraction
+    return min(round(sum(breakdown.values())), 100), breakdown
+
+def score_many_parsed(records: List[Dict[str, Any]], rules: Tuple[Rule, ...] = RULES) -> List[int]:
+    """Scores only, for bulk use."""
+    return [score_parsed(data, rules)[0] for data in records]
@@ -1,25 +1,49 @@
-from pyresparser import ResumeParser
 import os
 
-def score_resume(file_path):
-    data = ResumeParser(file_path).get_extracted_data()
-    score = 0
-    if data is None:
-        return 0, "Resume could not be parsed"
+from parse_cache import ParseCache, file_digest
+from pdf_extract import iter_pdf_pages
+from resume_pipeline import clean_and_parse
+from .rule_scorer import score_parsed
+from .scoring_service import SCORER_VERSION, ScoringService
 
-    if data.get('skills'):
-        score += 20
-    if data.get('experience'):
-        score += 20
-    if data.get('education'):
-        score += 20
-    if data.get('email'):
-        score += 10
-    if data.get('phone'):
-        score += 10
-    if data.get('designation'):
-        score += 10
-    if data.get('degree'):
-        score += 10
+# "fast": rule table over resume_parser output, no NLP models (default)
+# "deep": pyresparser/spaCy extraction, see scoring_service.py
+MODES = ("fast", "deep")
+DEFAULT_MODE = os.getenv("ANALYZER_MODE", "fast")
 
-    return min(score, 100), data
+# One service per process: spaCy models stay loaded and scores are cached
+# by file hash across requests and workers.
+_service = None
+
+def get_service():
+    global _service
+    if _service is None:
+        _service = ScoringService(ParseCache(os.path.join("cache", "score_cache.sqlite3"),
+                                             version=SCORER_VERSION))
+    return _service
+
+def parse_resume(file_path, cache=None):
+    """resume_parser dict for a PDF, through ``cache`` (a ParseCache) when given."""
+    digest = file_digest(file_path) if cache is not None else None
+    hit = cache.get(digest) if digest else None
+    if hit is not None:
+        return hit[1]
+    cleaned_text, data = clean_and_parse(iter_pdf_pages(file_path))
+    if digest:
+        cache.put(digest, cleaned_text, data)
+    return data
+
+def score_resume(file_path, mode=None, cache=None):
+    """``(score, data)``; ``cache`` is a ParseCache for the fast mode's parse step."""
+    mode = mode or DEFAULT_MODE
+    if mode == "deep":
+        return get_service().score_file(file_path)
+    if mode != "fast":
+        raise ValueError(f"unknown analyzer mode {mode!r} (expected one of {MODES})")
+    data = parse_resume(file_path, cache)
+    return score_parsed(data)[0], data
+
+def score_many(file_paths, mode=None, cache=None):
+    if (mode or DEFAULT_MODE) == "deep":
+        return get_service().score_many(file_paths)
+    return [score_resume(path, "fast", cache) for path in file_paths]
@@ -0,0 +1,140 @@
+# scoring_service.py  – long-lived pyresparser scoring
+# -------------------------------------------------------------------
+# ResumeParser() calls spacy.load() twice in its constructor (the stock
+# en_core_web_sm pipeline and pyresparser's own NER model), so every
+# /resume-analyzer request paid a full model cold start.  This module:
+#
+#   * memoises spacy.load inside pyresparser → models load once per process
+#   * caches scores by PDF hash (shared SQLite file, see parse_cache.py)
+#   * scores batches, fanning cache misses out to a process pool whose
+#     workers each load the models once at start-up
+#
+# score_many() is the bulk API; score_file() is the one-off path used by
+# the Flask worker, which keeps its models warm between requests.
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+from parse_cache import ParseCache, file_digest
+
+__all__ = ["SCORER_VERSION", "load_models", "points_for", "extract", "ScoringService"]
+
+SCORER_VERSION = "pyresparser-1"
+
+# field → points, awarded when pyresparser found a non-empty value
+POINTS = {
+    "skills": 20, "experience": 20, "education": 20,
+    "email": 10, "phone": 10, "designation": 10, "degree": 10,
+}
+
+Result = Tuple[int, Any]
+
+
+class _CachedSpacy:
+    """Stands in for the ``spacy`` module inside pyresparser; load() is memoised."""
+
+    def __init__(self, spacy):
+        self._spacy = spacy
+        self.load = functools.lru_cache(maxsize=None)(spacy.load)
+
+    def __getattr__(self, name):
+        return getattr(self._spacy, name)
+
+
+@functools.lru_cache(maxsize=None)
+def load_models():
+    """Patch pyresparser to reuse its spaCy models and load them now; returns ResumeParser."""
+    from pyresparser import resume_parser
+
+    if not isinstance(resume_parser.spacy, _CachedSpacy):
+        resume_parser.spacy = _CachedSpacy(resume_parser.spacy)
+    resume_parser.spacy.load("en_core_web_sm")
+    resume_parser.spacy.load(os.path.dirname(os.path.abspath(resume_parser.__file__)))
+    return resume_parser.ResumeParser
+
+
+def points_for(data: Dict[str, Any] | None) -> int:
+    if data is None:
+        return 0
+    return min(sum(pts for field, pts in POINTS.items() if data.get(field)), 100)
+
+
+def extract(path: str) -> Dict[str, Any] | None:
+    """pyresparser's extracted data for ``path`` (None if it could not be parsed)."""
+    return load_models()(path).get_extracted_data()
+
+
+def _score_path(path: str) -> Result:
+    data = extract(path)
+    if data is None:
+        return 0, "Resume could not be parsed"
+    return points_for(data), data
+
+
+def _init_worker() -> None:
+    load_models()
+
+
+class ScoringService:
+    def __init__(self, cache: ParseCache | None = None, *, workers: int | None = None):
+        self.cache = cache
+        self.workers = workers or int(os.getenv("SCORING_WORKERS", "0")) or os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _cached(self, digest: str) -> Result | None:
+        hit = self.cache.get(digest) if self.cache is not None else None
+        if hit is None:
+            return None
+        _, data = hit
+        return (points_for(data), data) if data is not None else (0, "Resume could not be parsed")
+
+    def _store(self, digest: str, result: Result) -> None:
+        if self.cache is not None:
+            data = result[1]
+            # the cache's text slot is unused here; only the extracted dict is kept
+            self.cache.put(digest, "", data if isinstance(data, dict) else None)
+
+    def score_file(self, path: str) -> Result:
+        """``(score, data)`` for one résumé, in this process."""
+        digest = file_digest(path)
+        result = self._cached(digest)
+        if result is None:
+            result = _score_path(path)
+            self._store(digest, result)
+        return result
+
+    def score_many(self, paths: Iterable[str]) -> List[Result]:
+        """``(score, data)`` per path, in order; cache misses are scored in parallel."""
+        paths = list(paths)
+        digests = [file_digest(p) for p in paths]
+        results: List[Result | None] = [self._cached(d) for d in digests]
+
+        # identical files are scored once
+        pending: Dict[str, str] = {}
+        for path, digest, result in zip(paths, digests, results):
+            if result is None:
+                pending.setdefault(digest, path)
+
+        if len(pending) > 1 and self.workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            fresh = dict(zip(pending, self._pool.map(_score_path, pending.values())))
+        else:
+            fresh = {digest: _score_path(path) for digest, path in pending.items()}
+
+        for digest, result in fresh.items():
+            self._store(digest, result)
+        return [r if r is not None else fresh[d] for r, d in zip(results, digests)]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
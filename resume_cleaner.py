@@ -2,32 +2,21 @@
 import re
 from urllib.parse import urlparse
 
-__all__ = ["standardize_resume_text"]
+from section_headings import match_heading
 
-# ------------------------------------------------------------------
-# Canonical section map  (add aliases if you like)
-# ------------------------------------------------------------------
-SECTION_MAP = {
-    "SUMMARY":      ["summary", "profile", "objective", "about"],
-    "CONTACT":      ["contact", "contact info", "contact information"],
-    "SKILLS":       ["skills", "technical skills", "competencies"],
-    "EXPERIENCE":   ["experience", "work experience", "professional experience",
-                     "employment", "employment history", "work history"],
-    "PROJECTS":     ["projects", "project experience"],
-    "EDUCATION":    ["education", "academic", "academics"],
-    "CERTIFICATES": ["certificates", "certifications", "licenses"],
-    "LANGUAGES":    ["languages", "language proficiency"],
-}
+__all__ = ["standardize_resume_text"]
 
 BULLET = re.compile(r"^[\s\u2022\u2023\u25E6\u2043\u2219•·●\-]+")
 MULTI_SPACE = re.compile(r"\s{2,}")
 URL_RX = re.compile(r"(https?://[^\s]+|www\.[^\s]+)", re.I)
 
+# Field labels rather than sections – left as ordinary lines here
+_NOT_SECTIONS = {"name", "title"}
+
 def _canonical_heading(line: str) -> str | None:
-    txt = line.lower().rstrip(":")
-    for canon, aliases in SECTION_MAP.items():
-        if txt in aliases:
-            return canon
+    canon = match_heading(line)
+    if canon and canon not in _NOT_SECTIONS:
+        return canon.upper()
     return None
 
 def _clean_line(line: str) -> str:
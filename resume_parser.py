@@ -5,62 +5,64 @@ import re
 from pathlib import Path
 from typing import List, Dict, Any
 
+from section_headings import match_heading
+
+# Bump whenever the cleaner/parser output changes so cached parses
+# (parse_cache.py) from an older version are not reused.
+PARSER_VERSION = "2"
+
 # -------- Regex helpers ---------------------------------------------------
 EMAIL_RX  = re.compile(r"[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}")
 PHONE_RX  = re.compile(r"(\+?\d[\d\s\-.]{7,}\d)")
 URL_RX    = re.compile(r"(https?://\S+|www\.\S+)")
 BULLET_RX = re.compile(r"^[•\-\u2022\d.\s]+")
 
-# -------- Canonical section names & aliases -------------------------------
-
-SECTION_MAP = {
-    "summary": [
-        "summary", "objective", "profile", "professional summary"
-    ],
-    "skills": [
-        "skills", "technical skills", "key skills", "expertise"
-    ],
-    "projects": [
-        "projects", "project", "personal projects", "notable projects"
-    ],
-    "experience": [
-        "experience", "work experience", "professional experience",
-        "employment history", "work history"
-    ],
-    "education": [
-        "education", "academic", "qualifications", "academic background"
-    ],
-    "certificates": [
-        "certificates", "certificate", "certifications", "certification",
-        "awards", "award", "achievements", "recognitions", "certifications & awards"
-    ],
-    "languages": [
-        "languages", "language", "spoken languages"
-    ],
-    "links": [
-        "links", "contact", "social", "profiles", "online presence"
-    ]
-}
-
-HEADER_LOOKUP = {alias: canon for canon, aliases in SECTION_MAP.items() for alias in aliases}
+# -------- Sections ---------------------------------------------------------
+# Heading aliases live in section_headings.py (shared with the cleaners);
+# these are the buckets the parser fills.  "contact" blocks count as links.
 
-# -------- Public API -------------------------------------------------------
+SECTIONS = [
+    "summary", "skills", "projects", "experience",
+    "education", "certificates", "languages", "links",
+]
 
-def parse_resume_text(raw_text: str) -> Dict[str, Any]:
-    lines = _preprocess(raw_text)
+_BUCKET_FOR = {name: name for name in SECTIONS}
+_BUCKET_FOR["contact"] = "links"
 
-    # containers
-    buckets: Dict[str, List[str]] = {k: [] for k in SECTION_MAP}
-    misc: List[str] = []
+def _section_key(line: str) -> str | None:
+    return _BUCKET_FOR.get(match_heading(line))
 
-    current = None
+# -------- Public API -------------------------------------------------------
 
-    for line in lines:
-        key = HEADER_LOOKUP.get(line.lower().rstrip(':'))
+def parse_resume_text(raw_text: str) -> Dict[str, Any]:
+    sections = SectionCollector()
+    for line in _preprocess(raw_text):
+        sections.feed(line)
+    return sections.build(raw_text)
+
+class SectionCollector:
+    """Fills the section buckets one preprocessed line at a time.
+
+    ``parse_resume_text`` feeds it the lines of a whole string;
+    resume_pipeline.py feeds it while cleaning, so both share one
+    implementation of the bucketing rules.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: Dict[str, List[str]] = {k: [] for k in SECTIONS}
+        self.misc: List[str] = []
+        self.current: str | None = None
+
+    def feed(self, line: str, key: str | None = ...) -> None:
+        """Add one line; pass ``key`` when the heading lookup is already known."""
+        if key is ...:
+            key = _section_key(line)
         if key:
-            current = key
-            continue
+            self.current = key
+            return
 
+        buckets = self.buckets
+        current = self.current
         if current:
             if current == "certificates":
                 cleaned_line = line.strip("•*-· \t").strip()
@@ -69,34 +71,38 @@ def parse_resume_text(raw_text: str) -> Dict[str, Any]:
             else:
                 buckets[current].append(line)
         else:
-            misc.append(line)
+            self.misc.append(line)
 
-        if URL_RX.search(line):
-            url = URL_RX.search(line).group(0).rstrip(".,)")
+        m = URL_RX.search(line)
+        if m:
+            url = m.group(0).rstrip(".,)")
             if url not in buckets["links"]:
                 buckets["links"].append(url)
 
-    data: Dict[str, Any] = {
-        "name"       : _guess_name(misc + buckets["summary"]),
-        "title"      : _guess_title(misc + buckets["summary"]),
-        "email"      : _first_match(EMAIL_RX, raw_text, default="Not Available"),
-        "phone"      : _first_match(PHONE_RX,  raw_text, default="Not Available"),
-        "summary"    : " ".join(buckets["summary"]).strip(),
-        "skills"     : _split_skills(buckets["skills"]),
-        "projects"   : _structure_projects(buckets["projects"]),
-        "experience" : _structure_experience(buckets["experience"]),
-        "education"  : _structure_education(buckets["education"]),
-        "certificates": [{"title": l} for l in buckets["certificates"]],
-        "languages"  : _split_simple(buckets["languages"]),
-        "links"      : buckets["links"],
-        "photo"      : None,
-        "misc"       : misc
-    }
-
-    if not data["summary"]:
-        data["summary"] = "Experienced professional with a passion for excellence."
-
-    return data
+    def build(self, raw_text: str) -> Dict[str, Any]:
+        """Structure the buckets; ``raw_text`` is searched for email/phone."""
+        buckets, misc = self.buckets, self.misc
+        data: Dict[str, Any] = {
+            "name"       : _guess_name(misc + buckets["summary"]),
+            "title"      : _guess_title(misc + buckets["summary"]),
+            "email"      : _first_match(EMAIL_RX, raw_text, default="Not Available"),
+            "phone"      : _first_match(PHONE_RX,  raw_text, default="Not Available"),
+            "summary"    : " ".join(buckets["summary"]).strip(),
+            "skills"     : _split_skills(buckets["skills"]),
+            "projects"   : _structure_projects(buckets["projects"]),
+            "experience" : _structure_experience(buckets["experience"]),
+            "education"  : _structure_education(buckets["education"]),
+            "certificates": [{"title": l} for l in buckets["certificates"]],
+            "languages"  : _split_simple(buckets["languages"]),
+            "links"      : buckets["links"],
+            "photo"      : None,
+            "misc"       : misc
+        }
+
+        if not data["summary"]:
+            data["summary"] = "Experienced professional with a passion for excellence."
+
+        return data
 
 # -------- Helper functions -------------------------------------------------
 
@@ -193,5 +199,6 @@ def _structure_education(lines: List[str]) -> List[Dict[str, str]]:
     return edu
 
 def extract_text_from_pdf(pdf_path: str) -> str:
-    from pdfminer.high_level import extract_text
-    return extract_text(pdf_path)
+    # PyMuPDF with pdfminer fallback, page + size guards – see pdf_extract.py
+    from pdf_extract import extract_pdf_text
+    return extract_pdf_text(pdf_path)
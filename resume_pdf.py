@@ -0,0 +1,211 @@
+# resume_pdf.py  – cleaned résumé → PDF with clickable links
+# -------------------------------------------------------------------
+# PdfLayout lays out the cleaned text (see resume_precleaner.py):
+#
+#   SKILLS:        → bold section heading with a rule underneath
+#   - item         → bullet with a hanging indent
+#   <https://…>    → blue, underlined, clickable link
+#
+# Lines are word-wrapped to the page width (over-long words are broken)
+# instead of running off the page.  Glyph widths come from a per-font
+# table filled once per character, so measuring a line is a dict lookup
+# per character rather than a stringWidth() call per segment.  Output
+# goes to a path or any writable buffer; render_many() reuses one
+# layout (and its width tables) for a whole batch.
+
+import functools
+import io
+import re
+from typing import Iterable, List, Tuple, Union
+
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfmetrics
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+
+__all__ = ["URL_RX", "PdfLayout", "create_cleaned_resume_pdf", "render_pdf_bytes"]
+
+# Regex for hyperlinks in cleaner + PDF builder
+URL_RX = re.compile(r"(https?://[^\s]+|www\.[^\s]+)", re.I)
+
+HEADING_RX = re.compile(r"^[A-Z][A-Z0-9 &/+'-]*:$")
+LINK_WORD_RX = re.compile(r"<?((?:https?://|www\.)[^\s<>]+)>?", re.I)
+
+Output = Union[str, io.IOBase]
+Word = Tuple[str, str | None]          # (text to draw, link target or None)
+
+
+class _Widths(dict):
+    """char → advance width at size 1000, measured on first use."""
+
+    def __init__(self, font: str):
+        super().__init__()
+        self.font = font
+
+    def __missing__(self, ch: str) -> float:
+        w = self[ch] = pdfmetrics.stringWidth(ch, self.font, 1000)
+        return w
+
+@functools.lru_cache(maxsize=None)
+def glyph_widths(font: str) -> _Widths:
+    return _Widths(font)
+
+
+class PdfLayout:
+    def __init__(self, *, font: str = "Helvetica", bold_font: str = "Helvetica-Bold",
+                 size: float = 10, heading_size: float = 12, leading: float = 14,
+                 margin: float = 40, bullet_indent: float = 12, pagesize=A4):
+        self.font = font
+        self.bold_font = bold_font
+        self.size = size
+        self.heading_size = heading_size
+        self.leading = leading
+        self.margin = margin
+        self.bullet_indent = bullet_indent
+        self.pagesize = pagesize
+        self.space = self.width(" ")
+
+    # -------- measuring / wrapping ------------------------------------
+
+    def width(self, text: str, font: str | None = None, size: float | None = None) -> float:
+        table = glyph_widths(font or self.font)
+        return sum(map(table.__getitem__, text)) * (size or self.size) / 1000
+
+    def _split_long(self, word: str, max_width: float) -> List[str]:
+        table = glyph_widths(self.font)
+        limit = max_width * 1000 / self.size
+        pieces, start, used = [], 0, 0.0
+        for i, ch in enumerate(word):
+            w = table[ch]
+            if used + w > limit and i > start:
+                pieces.append(word[start:i])
+                start, used = i, 0.0
+            used += w
+        pieces.append(word[start:])
+        return pieces
+
+    def _words(self, line: str, max_width: float) -> Iterable[Word]:
+        for token in line.split():
+            m = LINK_WORD_RX.fullmatch(token)
+            url = None
+            if m:
+                token = m.group(1)
+                url = token if token.lower().startswith("http") else f"https://{token}"
+            if self.width(token) > max_width:
+                for piece in self._split_long(token, max_width):
+                    yield piece, url
+            else:
+                yield token, url
+
+    def wrap(self, line: str, max_width: float) -> List[List[Word]]:
+        """Greedy word wrap of ``line`` into rows no wider than ``max_width``."""
+        rows: List[List[Word]] = []
+        row: List[Word] = []
+        used = 0.0
+        for word, url in self._words(line, max_width):
+            w = self.width(word)
+            if row and used + self.space + w > max_width:
+                rows.append(row)
+                row, used = [], 0.0
+            used += (self.space if row else 0.0) + w
+            row.append((word, url))
+        if row:
+            rows.append(row)
+        return rows
+
+    # -------- drawing -------------------------------------------------
+
+    def _draw_row(self, c: canvas.Canvas, x: float, y: float, row: List[Word]) -> None:
+        run: List[str] = []
+        for word, url in row:
+            if url is None:
+                run.append(word)
+                continue
+            if run:
+                text = " ".join(run) + " "
+                c.drawString(x, y, text)
+                x += self.width(text)
+                run = []
+            w = self.width(word)
+            c.setFillColor(colors.blue)
+            c.setStrokeColor(colors.blue)
+            c.drawString(x, y, word)
+            c.line(x, y - 1, x + w, y - 1)
+            c.linkURL(url, (x, y - 1, x + w, y + self.size - 1))
+            c.setFillColor(colors.black)
+            c.setStrokeColor(colors.black)
+            x += w + self.space
+        if run:
+            c.drawString(x, y, " ".join(run))
+
+    def render(self, text: str, out: Output) -> int:
+        """Lay out ``text`` into ``out`` (path or writable buffer); returns the page count."""
+        page_w, page_h = self.pagesize
+        left, right = self.margin, page_w - self.margin
+        top, bottom = page_h - self.margin, self.margin
+
+        c = canvas.Canvas(out, pagesize=self.pagesize)
+        c.setFont(self.font, self.size)
+        y = top
+
+        def new_page():
+            c.showPage()
+            c.setFont(self.font, self.size)
+            return top
+
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line:
+                y -= self.leading / 2
+                continue
+
+            if HEADING_RX.match(line):
+                if y < top:
+                    y -= self.leading / 2
+                if y - 2 * self.leading < bottom:      # keep a heading with its first line
+                    y = new_page()
+                c.setFont(self.bold_font, self.heading_size)
+                c.drawString(left, y, line[:-1])
+                c.setLineWidth(0.5)
+                c.line(left, y - 3, right, y - 3)
+                c.setFont(self.font, self.size)
+                y -= self.leading * 1.3
+                continue
+
+            indent = 0.0
+            bullet = line.startswith("- ")
+            if bullet:
+                line, indent = line[2:], self.bullet_indent
+            for i, row in enumerate(self.wrap(line, right - left - indent)):
+                if y < bottom:
+                    y = new_page()
+                if bullet and i == 0:
+                    c.drawString(left, y, "•")
+                self._draw_row(c, left + indent, y, row)
+                y -= self.leading
+
+        pages = c.getPageNumber()
+        c.save()
+        return pages
+
+    def render_many(self, jobs: Iterable[Tuple[str, Output]]) -> List[int]:
+        """Render ``(text, out)`` pairs in turn, sharing this layout; returns page counts."""
+        return [self.render(text, out) for text, out in jobs]
+
+
+_default: PdfLayout | None = None
+
+def default_layout() -> PdfLayout:
+    global _default
+    if _default is None:
+        _default = PdfLayout()
+    return _default
+
+def create_cleaned_resume_pdf(text: str, pdf_path: Output) -> None:
+    """Write cleaned text to PDF and embed clickable hyperlinks."""
+    default_layout().render(text, pdf_path)
+
+def render_pdf_bytes(text: str) -> bytes:
+    buf = io.BytesIO()
+    default_layout().render(text, buf)
+    return buf.getvalue()
@@ -0,0 +1,88 @@
+# resume_pipeline.py  – fused clean + parse in a single pass
+# -------------------------------------------------------------------
+# standardize_resume_text() joins everything into one big string, runs a
+# regex over it, and parse_resume_text() immediately splits it again and
+# re-strips the bullets it just added.  clean_and_parse() walks the raw
+# lines once instead: each line is cleaned, classified and dropped into
+# its section bucket straight away, and the cleaned-text artifact is
+# joined once at the end as a side output.
+#
+#   clean_and_parse(text) == (standardize_resume_text(text),
+#                             parse_resume_text(standardize_resume_text(text)))
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from resume_precleaner import HYPERLINK_REGEX, _clean_line, _standard_section
+from resume_parser     import BULLET_RX, SectionCollector, _section_key
+
+__all__ = ["iter_raw_lines", "clean_and_parse"]
+
+# Characters str.splitlines() breaks on besides \n / \r
+_ODD_BREAKS = re.compile("[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+# First characters BULLET_RX would strip after the "- " prefix
+_BULLET_START = frozenset("•-\u2022.0123456789")
+
+
+def _wrap_url(m) -> str:
+    return f"<{m.group('url')}>"
+
+def iter_raw_lines(source: str | Iterable[str]) -> Iterator[str]:
+    """Yield stripped, non-empty lines from a string or an iterable of chunks.
+
+    Chunks (e.g. the pages from pdf_extract.iter_pdf_pages) are consumed
+    lazily, so cleaning starts as soon as the first page is decoded.
+    """
+    chunks = (source,) if isinstance(source, str) else source
+    for chunk in chunks:
+        for ln in chunk.replace("\r", "\n").split("\n"):
+            ln = ln.strip()
+            if ln:
+                yield ln
+
+def clean_and_parse(source: str | Iterable[str]) -> Tuple[str, Dict[str, Any]]:
+    """Return ``(cleaned_text, parsed_dict)`` from raw résumé text or pages."""
+    output: List[str] = []
+    sections = SectionCollector()
+    in_section = False
+
+    for raw in iter_raw_lines(source):
+        line = _clean_line(raw)
+
+        canon = _standard_section(line)
+        if canon:
+            in_section = True
+            heading = f"{canon}:"
+            output.append("\n" + heading)
+            sections.feed(heading, _section_key(heading))
+            continue
+
+        if not in_section:
+            # Anything before the first recognised section is SUMMARY
+            in_section = True
+            output.append("\nSUMMARY:")
+            sections.feed("SUMMARY:", "summary")
+
+        wrapped = HYPERLINK_REGEX.sub(_wrap_url, line) if "http" in line else line
+        cleaned = f"- {wrapped}"
+        output.append(cleaned)
+
+        # What parse_resume_text would see for this line of cleaned text.
+        # Common case: the parser just strips our "- " again.
+        if wrapped and wrapped[0] not in _BULLET_START and not _ODD_BREAKS.search(wrapped):
+            # an unchanged line was already classified as content above
+            sections.feed(wrapped, None if wrapped is line else ...)
+            continue
+        for part in cleaned.splitlines():
+            parsed = BULLET_RX.sub("", part).strip()
+            if not parsed:
+                continue
+            if parsed == line:
+                # Unchanged by URL wrapping / bullet stripping – the cleaner
+                # already classified it as content.
+                sections.feed(parsed, None)
+            else:
+                sections.feed(parsed)
+
+    cleaned_text = "\n".join(output).strip()
+    return cleaned_text, sections.build(cleaned_text)
@@ -1,24 +1,13 @@
 import re
 from urllib.parse import urlparse
 
-__all__ = ["standardize_resume_text"]
+from section_headings import match_heading
 
-SECTION_ALIASES = {
-    "name": ["name"],
-    "title": ["title", "profile", "designation", "objective"],
-    "summary": ["summary", "career summary", "professional summary", "about me", "objective"],
-    "contact": ["contact", "contact information", "contact info", "personal info"],
-    "skills": ["skills", "technical skills", "core competencies"],
-    "experience": ["experience", "work experience", "professional experience", "employment", "employment history", "work history"],
-    "projects": ["projects", "project experience", "personal projects", "professional projects"],
-    "education": ["education", "academic", "education background", "academic qualifications"],
-    "certificates": ["certificates", "certifications", "licenses"],
-    "languages": ["languages", "language proficiency"],
-    "links": ["links", "profiles", "social", "social links", "social profiles"],
-}
+__all__ = ["standardize_resume_text"]
 
 BULLET_REGEX = re.compile(r"^[\s\u2022\u2023\u25E6\u2043\u2219\-]+")
 HYPERLINK_REGEX = re.compile(r"(?P<url>https?://[\w./#?&:=+-]+)")
+MULTI_SPACE_REGEX = re.compile(r"\s{2,}")
 
 
 # ---------------------------------------------------------------------------
@@ -30,7 +19,7 @@ def _clean_line(line: str) -> str:
     # Remove leading bullet characters and whitespace
     line = BULLET_REGEX.sub("", line)
     # Collapse multiple spaces
-    line = re.sub(r"\s{2,}", " ", line)
+    line = MULTI_SPACE_REGEX.sub(" ", line)
     return line.strip()
 
 
@@ -40,11 +29,8 @@ def _clean_line(line: str) -> str:
 
 def _standard_section(line: str) -> str | None:
     """Return canonical section name if line matches an alias."""
-    lower = line.lower().rstrip(":")
-    for canonical, aliases in SECTION_ALIASES.items():
-        if any(lower == a for a in aliases):
-            return canonical.upper()
-    return None
+    canonical = match_heading(line)
+    return canonical.upper() if canonical else None
 
 
 # ---------------------------------------------------------------------------
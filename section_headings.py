@@ -0,0 +1,83 @@
+# section_headings.py  – one heading index for the cleaners and the parser
+# -------------------------------------------------------------------
+# resume_precleaner, resume_cleaner and resume_parser used to keep three
+# slightly different alias tables and loop over them for every line.
+# They now share this table, compiled once into a dict, so classifying
+# a line costs one normalisation plus one (rarely two) hash lookups.
+#
+#   exact tier : "Work Experience:", "WORK EXPERIENCE —"  → "experience"
+#   fuzzy tier : "Skills & Tools", "Education and Training" → first part
+#
+# The fuzzy tier only applies to short, heading-looking lines (title
+# case / upper case / trailing colon, no digits) so ordinary bullets such
+# as "Education and training programs for staff" stay content.
+
+import re
+from typing import Dict
+
+__all__ = ["SECTION_ALIASES", "HEADING_INDEX", "normalize_heading", "match_heading"]
+
+# ------------------------------------------------------------------
+# Canonical section → aliases  (add aliases here, nowhere else)
+# ------------------------------------------------------------------
+SECTION_ALIASES = {
+    "name":         ["name"],
+    "title":        ["title", "designation"],
+    "summary":      ["summary", "career summary", "professional summary", "about",
+                     "about me", "profile", "objective", "career objective"],
+    "contact":      ["contact", "contact info", "contact information", "personal info"],
+    "skills":       ["skills", "technical skills", "key skills", "core competencies",
+                     "competencies", "expertise"],
+    "experience":   ["experience", "work experience", "professional experience",
+                     "employment", "employment history", "work history"],
+    "projects":     ["projects", "project", "project experience", "personal projects",
+                     "professional projects", "notable projects"],
+    "education":    ["education", "academic", "academics", "academic background",
+                     "education background", "academic qualifications", "qualifications"],
+    "certificates": ["certificates", "certificate", "certifications", "certification",
+                     "licenses", "awards", "award", "achievements", "recognitions",
+                     "certifications & awards"],
+    "languages":    ["languages", "language", "language proficiency", "spoken languages"],
+    "links":        ["links", "profiles", "social", "social links", "social profiles",
+                     "online presence"],
+}
+
+HEADING_INDEX: Dict[str, str] = {
+    alias: canon for canon, aliases in SECTION_ALIASES.items() for alias in aliases
+}
+
+_TRAILING = " \t:;.-–—|"
+_SPACES_RX = re.compile(r"\s+")
+_SPLIT_RX = re.compile(r"\s*(?:&|/|\||,|\+|\band\b|\s[-–—]\s)\s*")
+_SMALL_WORDS = {"and", "of", "&", "/", "|", "+", "-", "–", "—"}
+_MAX_FUZZY_WORDS = 5
+
+
+def normalize_heading(line: str) -> str:
+    """Lower-case, collapse spaces and drop trailing ':' / dashes."""
+    key = line.strip().rstrip(_TRAILING).lower()
+    if "  " in key or "\t" in key:
+        key = _SPACES_RX.sub(" ", key)
+    return key
+
+
+def _looks_like_heading(line: str) -> bool:
+    text = line.strip()
+    if any(ch.isdigit() or ch == "@" for ch in text):
+        return False
+    if text.endswith(":") or text.isupper():
+        return True
+    return all(w[0].isupper() or not w[0].isalpha() or w.lower() in _SMALL_WORDS
+               for w in text.split())
+
+
+def match_heading(line: str) -> str | None:
+    """Return the canonical section name if ``line`` is a heading."""
+    key = normalize_heading(line)
+    canon = HEADING_INDEX.get(key)
+    if canon or not key or key.count(" ") >= _MAX_FUZZY_WORDS:
+        return canon
+    sep = _SPLIT_RX.search(key)
+    if sep and sep.start() and _looks_like_heading(line):
+        return HEADING_INDEX.get(key[:sep.start()])
+    return None
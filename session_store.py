@@ -0,0 +1,116 @@
+# session_store.py  – server-side per-session data
+# -------------------------------------------------------------------
+# The parsed résumé used to ride in Flask's signed cookie, i.e. it was
+# serialised, signed and uploaded on *every* request and a long résumé
+# blew the 4 KB cookie limit.  The cookie now only carries a random
+# ``sid``; the data itself lives here, in a local SQLite file shared by
+# all gunicorn workers.
+#
+#   key     : (sid, name)
+#   value   : JSON
+#   expiry  : sliding ``ttl`` – refreshed on read once half of it is used
+#
+# Expired rows are ignored on read and swept every ``gc_interval``.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict
+
+__all__ = ["SessionStore", "new_sid", "valid_sid"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_data (
+    sid     TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    value   TEXT NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (sid, name)
+);
+CREATE INDEX IF NOT EXISTS session_data_expiry ON session_data(expires);
+"""
+
+
+def new_sid() -> str:
+    return uuid.uuid4().hex
+
+def valid_sid(sid: Any) -> bool:
+    return isinstance(sid, str) and len(sid) == 32 and all(c in "0123456789abcdef" for c in sid)
+
+
+class SessionStore:
+    def __init__(self, path: str = "cache/sessions.sqlite3", *,
+                 ttl: float = 7 * 24 * 3600, gc_interval: float = 600):
+        self.path = path
+        self.ttl = ttl
+        self.gc_interval = gc_interval
+        self._last_gc = 0.0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -------- access --------------------------------------------------
+
+    def get(self, sid: str | None, name: str, default: Any = None) -> Any:
+        if not sid:
+            return default
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute("SELECT value, expires FROM session_data WHERE sid = ? AND name = ?",
+                           (sid, name)).fetchone()
+        if row is None or row[1] <= now:
+            return default
+        if row[1] - now < self.ttl / 2:     # sliding expiry, at most one write per ttl/2
+            with conn:
+                conn.execute("UPDATE session_data SET expires = ? WHERE sid = ?", (now + self.ttl, sid))
+        return json.loads(row[0])
+
+    def set(self, sid: str, name: str, value: Any) -> None:
+        self.maybe_gc()
+        conn = self._conn()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO session_data (sid, name, value, expires) VALUES (?, ?, ?, ?)",
+                         (sid, name, json.dumps(value, ensure_ascii=False), time.time() + self.ttl))
+
+    def delete(self, sid: str | None, name: str | None = None) -> None:
+        """Drop one value, or everything stored for ``sid`` when ``name`` is None."""
+        if not sid:
+            return
+        conn = self._conn()
+        with conn:
+            if name is None:
+                conn.execute("DELETE FROM session_data WHERE sid = ?", (sid,))
+            else:
+                conn.execute("DELETE FROM session_data WHERE sid = ? AND name = ?", (sid, name))
+
+    # -------- expiry --------------------------------------------------
+
+    def maybe_gc(self) -> None:
+        if time.time() - self._last_gc >= self.gc_interval:
+            self.gc()
+
+    def gc(self) -> int:
+        """Remove expired rows; returns how many were dropped."""
+        self._last_gc = time.time()
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM session_data WHERE expires <= ?", (self._last_gc,)).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        sessions, rows, size = self._conn().execute(
+            "SELECT COUNT(DISTINCT sid), COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM session_data"
+        ).fetchone()
+        return {"sessions": sessions, "values": rows, "bytes": size}
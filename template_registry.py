@@ -0,0 +1,87 @@
+# template_registry.py  – compile the theme templates once per process
+# -------------------------------------------------------------------
+# html_generator used to build a fresh Environment on every call and the
+# static export looked up seven templates per request, so the first hit
+# on each worker paid for parsing + compiling every page.  This module
+# owns one shared Environment and compiles every template_0X/*.html at
+# startup.  With a bytecode cache on disk, workers forked later (or the
+# next deploy) load compiled code instead of re-parsing the sources.
+#
+# Production: auto_reload off, bytecode cache in cache/jinja/.
+# Dev mode  : KRIVI_DEV=1 or FLASK_DEBUG=1 → templates reload on change.
+
+import os
+import time
+from typing import Dict, Iterable, List
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateError
+
+__all__ = ["TEMPLATES_FOLDER", "dev_mode", "theme_templates", "create_environment",
+           "get_environment", "warm_up", "configure_flask"]
+
+TEMPLATES_FOLDER = "templates"
+BYTECODE_FOLDER  = os.path.join("cache", "jinja")
+
+_shared: Environment | None = None
+
+
+def dev_mode() -> bool:
+    return any(os.getenv(var, "").lower() in ("1", "true", "yes") for var in ("KRIVI_DEV", "FLASK_DEBUG"))
+
+def _bytecode_cache(name: str) -> FileSystemBytecodeCache | None:
+    if dev_mode():
+        return None
+    folder = os.path.join(BYTECODE_FOLDER, name)
+    os.makedirs(folder, exist_ok=True)
+    return FileSystemBytecodeCache(folder)
+
+def theme_templates(folder: str = TEMPLATES_FOLDER) -> List[str]:
+    """Every ``template_XX/<page>.html`` under ``folder``."""
+    names = []
+    for theme in sorted(os.listdir(folder)):
+        theme_dir = os.path.join(folder, theme)
+        if theme.startswith("template_") and os.path.isdir(theme_dir):
+            names.extend(f"{theme}/{f}" for f in sorted(os.listdir(theme_dir)) if f.endswith(".html"))
+    return names
+
+def create_environment(folder: str = TEMPLATES_FOLDER) -> Environment:
+    return Environment(
+        loader=FileSystemLoader(folder),
+        auto_reload=dev_mode(),
+        bytecode_cache=_bytecode_cache("static"),
+        cache_size=-1,  # never evict compiled templates
+    )
+
+def get_environment() -> Environment:
+    """The process-wide Environment used for static exports."""
+    global _shared
+    if _shared is None:
+        _shared = create_environment()
+    return _shared
+
+def warm_up(env: Environment, names: Iterable[str] | None = None) -> Dict[str, float]:
+    """Compile ``names`` (default: all theme pages) and return seconds per template.
+
+    A template that fails to compile is reported and skipped so one bad
+    page does not stop the app from booting; it will fail again on use.
+    """
+    timings = {}
+    for name in names if names is not None else theme_templates():
+        t0 = time.perf_counter()
+        try:
+            env.get_template(name)
+        except TemplateError as e:
+            print(f"⚠️ Template warm-up skipped {name}: {e}")
+            continue
+        timings[name] = time.perf_counter() - t0
+    return timings
+
+def configure_flask(app) -> None:
+    """Give Flask's own jinja_env the same reload / bytecode-cache policy.
+
+    Must run before the first ``render_template`` (jinja_env is created
+    lazily from ``jinja_options``).
+    """
+    app.config["TEMPLATES_AUTO_RELOAD"] = dev_mode()
+    app.jinja_options = {**app.jinja_options, "cache_size": -1,
+                         "bytecode_cache": _bytecode_cache("flask")}
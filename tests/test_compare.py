@@ -0,0 +1,49 @@
+# test_compare.py  – /compare keeps going when one upload is unreadable
+# -------------------------------------------------------------------
+# Runs against the real app and PDF stack; skipped where those are not
+# installed.
+
+import io
+import os
+
+import pytest
+
+for _mod in ("flask", "flask_mail", "dotenv", "requests", "numpy", "scipy", "reportlab"):
+    pytest.importorskip(_mod)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("KRIVI_DEV", "1")             # no template warm-up / precompress at import
+    monkeypatch.setenv("JOB_FEED_FIXTURE", os.path.join(ROOT, "fixtures", "remoteok_jobs.html"))
+    monkeypatch.chdir(tmp_path)                      # cache/, uploads/ … land in the temp dir
+    import app as app_module
+    app_module.app.config["TESTING"] = True
+    return app_module.app.test_client()
+
+
+def _pdf(text: str) -> io.BytesIO:
+    from resume_pdf import render_pdf_bytes
+    return io.BytesIO(render_pdf_bytes(text))
+
+
+def test_compare_reports_corrupt_upload_and_ranks_the_rest(client):
+    from pdf_extract import available_backends
+    if not available_backends():
+        pytest.skip("no PDF backend installed")
+
+    resumes = [
+        (_pdf("Jane Doe\nSKILLS:\n- Python, Flask, SQL\nEXPERIENCE:\n- Backend developer at Acme"), "jane.pdf"),
+        (_pdf("John Roe\nSKILLS:\n- Python, Django, SQL\nEXPERIENCE:\n- Web developer at Initech"), "john.pdf"),
+        (io.BytesIO(b"%PDF-1.4\nthis is not really a pdf\n"), "broken.pdf"),
+    ]
+    resp = client.post("/compare", data={"resumes": resumes, "requirement": "python sql", "k": "5"},
+                       content_type="multipart/form-data")
+
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert [f["file"] for f in body["failed"]] == ["broken.pdf"]
+    assert {r["id"] for r in body["ranking"]} == {"jane.pdf", "john.pdf"}
+    assert len(body["similar_pairs"]) == 1
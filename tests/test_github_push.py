@@ -0,0 +1,185 @@
+# test_github_push.py  – GitHubPusher against a local fake GitHub
+# -------------------------------------------------------------------
+# A tiny http.server stands in for api.github.com (see GITHUB_API_URL in
+# github_push.py) and records every call, so the tests check the exact
+# request sequence: repo creation, blob uploads (with a 429 to retry),
+# then one tree + one commit + one ref update.
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")
+
+from github_push import GitHubError, GitHubPusher  # noqa: E402
+
+
+class FakeGitHub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.calls = []                  # (method, path)
+        self.repos = set()
+        self.blobs = {}                  # sha → base64 content
+        self.lock = threading.Lock()
+        # failure injection
+        self.blob_429s = 0               # answer the next N blob uploads with 429
+        self.create_fails_after_commit = 0   # create the repo, then answer 502 N times
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def paths(self, method: str, prefix: str = "") -> list:
+        return [p for m, p in self.calls if m == method and p.startswith(prefix)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeGitHub
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body=None, headers=None):
+        payload = json.dumps(body if body is not None else {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _repo(self, name):
+        return {"name": name, "owner": {"login": "octo"}, "default_branch": "main",
+                "html_url": f"https://github.com/octo/{name}"}
+
+    def _handle(self):
+        srv, path, method = self.server, self.path, self.command
+        body = self._body() if method in ("POST", "PATCH") else None
+        with srv.lock:
+            srv.calls.append((method, path))
+
+            if method == "POST" and path == "/user/repos":
+                name = body["name"]
+                if name in srv.repos:
+                    return self._send(422, {"message": "name already exists on this account"})
+                srv.repos.add(name)
+                if srv.create_fails_after_commit:
+                    srv.create_fails_after_commit -= 1
+                    return self._send(502, {"message": "Bad Gateway"})
+                return self._send(201, self._repo(name))
+            if method == "GET" and path == "/user":
+                return self._send(200, {"login": "octo"})
+            if method == "GET" and path.startswith("/repos/octo/") and path.count("/") == 3:
+                name = path.rsplit("/", 1)[1]
+                return self._send(200, self._repo(name)) if name in srv.repos else self._send(404)
+            if method == "GET" and path.endswith("/git/ref/heads/main"):
+                return self._send(200, {"object": {"sha": "parent0"}})
+            if method == "GET" and path.endswith("/git/commits/parent0"):
+                return self._send(200, {"tree": {"sha": "tree0"}})
+            if method == "POST" and path.endswith("/git/blobs"):
+                if srv.blob_429s:
+                    srv.blob_429s -= 1
+                    return self._send(429, {"message": "slow down"}, {"Retry-After": "0"})
+                sha = f"blob{len(srv.blobs)}"
+                srv.blobs[sha] = body["content"]
+                return self._send(201, {"sha": sha})
+            if method == "POST" and path.endswith("/git/trees"):
+                return self._send(201, {"sha": "tree1"})
+            if method == "POST" and path.endswith("/git/commits"):
+                return self._send(201, {"sha": "commit1"})
+            if method == "PATCH" and path.endswith("/git/refs/heads/main"):
+                return self._send(200, {"object": {"sha": body["sha"]}})
+            return self._send(404, {"message": f"unexpected {method} {path}"})
+
+    do_GET = do_POST = do_PATCH = _handle
+
+
+@pytest.fixture
+def github():
+    srv = FakeGitHub()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _pusher(srv: FakeGitHub, **kwargs) -> GitHubPusher:
+    return GitHubPusher("token", api_url=srv.url, backoff=0.01, max_sleep=0.05, timeout=5, **kwargs)
+
+
+def _entries(tmp_path: Path):
+    page = tmp_path / "index.html"
+    page.write_text("<h1>hi</h1>", encoding="utf-8")
+    return [("index.html", page), ("assets/site.css", "body{}"), ("profile.jpg", b"\xff\xd8\xff")]
+
+
+def test_publish_creates_repo_and_pushes_one_commit(github, tmp_path):
+    with _pusher(github) as pusher:
+        result = pusher.publish("portfolio-1", _entries(tmp_path))
+
+    assert result == {"html_url": "https://github.com/octo/portfolio-1", "owner": "octo",
+                      "name": "portfolio-1", "commit": "commit1"}
+    assert github.paths("POST", "/user/repos") == ["/user/repos"]
+    assert len(github.paths("POST", "/repos/octo/portfolio-1/git/blobs")) == 3
+    assert github.paths("POST", "/repos/octo/portfolio-1/git/trees") == ["/repos/octo/portfolio-1/git/trees"]
+    assert github.paths("POST", "/repos/octo/portfolio-1/git/commits") == ["/repos/octo/portfolio-1/git/commits"]
+    assert github.paths("PATCH") == ["/repos/octo/portfolio-1/git/refs/heads/main"]
+    # the ref moves last, after every blob
+    assert github.calls[-1] == ("PATCH", "/repos/octo/portfolio-1/git/refs/heads/main")
+
+
+def test_blob_upload_retries_429_with_retry_after(github, tmp_path):
+    github.blob_429s = 2
+    with _pusher(github, max_workers=1) as pusher:
+        result = pusher.publish("portfolio-2", _entries(tmp_path))
+
+    assert result["commit"] == "commit1"
+    assert len(github.paths("POST", "/repos/octo/portfolio-2/git/blobs")) == 3 + 2
+    assert len(github.blobs) == 3
+
+
+def test_retry_after_accepts_http_dates(github, tmp_path):
+    from github_push import _retry_after
+    assert _retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0      # in the past → no wait
+    assert _retry_after("not a date") is None                          # → exponential backoff
+    github.blob_429s = 1
+    with _pusher(github) as pusher:
+        # the 429 below carries delta-seconds; an HTTP-date one must not raise either
+        assert pusher._delay(0, _FakeResp(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+        assert pusher.publish("portfolio-4", _entries(tmp_path))["commit"] == "commit1"
+
+
+class _FakeResp:
+    def __init__(self, status, headers):
+        self.status_code = status
+        self.headers = headers
+        self.text = ""
+
+
+def test_create_repo_recovers_when_a_retried_attempt_gets_422(github, tmp_path):
+    github.create_fails_after_commit = 1      # created on GitHub's side, but we saw a 502
+    with _pusher(github) as pusher:
+        result = pusher.publish("portfolio-3", _entries(tmp_path))
+
+    assert result["name"] == "portfolio-3"
+    assert github.paths("POST", "/user/repos") == ["/user/repos", "/user/repos"]
+    assert ("GET", "/repos/octo/portfolio-3") in github.calls
+
+
+def test_create_repo_422_on_first_attempt_is_an_error(github):
+    github.repos.add("taken")
+    with _pusher(github) as pusher, pytest.raises(GitHubError) as err:
+        pusher.create_repo("taken")
+    assert err.value.status == 422
+    assert ("GET", "/user") not in github.calls
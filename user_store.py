@@ -0,0 +1,172 @@
+# user_store.py  – SQLite-backed user accounts (replaces users.json)
+# -------------------------------------------------------------------
+# load_users()/save_users() re-read and rewrite the whole JSON file on
+# every login, register and GitHub callback, without locking.  Here every
+# operation is one indexed statement in its own transaction:
+#
+#   users   (email PRIMARY KEY, name, password, role, extra JSON)
+#   resumes (id, email → users, entry JSON)   indexed on email
+#
+# The database runs in WAL mode so readers never block the writer and
+# several gunicorn workers can share it.  The first time it is opened
+# next to an existing users.json, that file is imported once.
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+__all__ = ["UserStore"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    email    TEXT PRIMARY KEY,
+    name     TEXT,
+    password TEXT,
+    role     TEXT NOT NULL DEFAULT 'user',
+    extra    TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS resumes (
+    id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL REFERENCES users(email) ON DELETE CASCADE,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resumes_by_email ON resumes(email);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_COLUMNS = ("name", "password", "role")
+
+
+class UserStore:
+    def __init__(self, path: str = "users.sqlite3", *, legacy_json: str | None = None):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = self._conn()
+        with conn:
+            conn.executescript(_SCHEMA)
+        if legacy_json:
+            self.migrate_from_json(legacy_json)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    # -------- reads ---------------------------------------------------
+
+    def _row_to_user(self, row: sqlite3.Row, resumes: List[dict]) -> Dict[str, Any]:
+        user = json.loads(row["extra"])
+        user.update({k: row[k] for k in _COLUMNS})
+        user["resumes"] = resumes
+        return user
+
+    def get(self, email: str) -> Optional[Dict[str, Any]]:
+        """The user as it used to look in users.json, or None."""
+        conn = self._conn()
+        row = conn.execute("SELECT * FROM users WHERE email = ?", (email,)).fetchone()
+        if row is None:
+            return None
+        return self._row_to_user(row, self.resumes(email))
+
+    def exists(self, email: str) -> bool:
+        return self._conn().execute("SELECT 1 FROM users WHERE email = ?", (email,)).fetchone() is not None
+
+    def check_password(self, email: str, password: str) -> bool:
+        row = self._conn().execute("SELECT password FROM users WHERE email = ?", (email,)).fetchone()
+        return row is not None and row["password"] is not None and row["password"] == password
+
+    def resumes(self, email: str) -> List[dict]:
+        rows = self._conn().execute(
+            "SELECT entry FROM resumes WHERE email = ? ORDER BY id", (email,)).fetchall()
+        return [json.loads(r["entry"]) for r in rows]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Every user (with ``email``) – for the admin pages."""
+        for row in self._conn().execute("SELECT * FROM users ORDER BY email").fetchall():
+            yield {"email": row["email"], **self._row_to_user(row, self.resumes(row["email"]))}
+
+    # -------- writes --------------------------------------------------
+
+    def create(self, email: str, *, name: str | None = None, password: str | None = None,
+               role: str = "user", **extra) -> bool:
+        """Insert a new user; False if the email is already registered."""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO users (email, name, password, role, extra) VALUES (?, ?, ?, ?, ?)",
+                (email, name, password, role, json.dumps(extra)))
+        return cur.rowcount == 1
+
+    def update(self, email: str, **fields) -> bool:
+        cols = {k: v for k, v in fields.items() if k in _COLUMNS}
+        extra = {k: v for k, v in fields.items() if k not in _COLUMNS and k != "resumes"}
+        conn = self._conn()
+        with conn:
+            if cols:
+                assignments = ", ".join(f"{k} = ?" for k in cols)
+                cur = conn.execute(f"UPDATE users SET {assignments} WHERE email = ?",
+                                   (*cols.values(), email))
+                if cur.rowcount == 0:
+                    return False
+            if extra:
+                cur = conn.execute("UPDATE users SET extra = json_patch(extra, ?) WHERE email = ?",
+                                   (json.dumps(extra), email))
+                if cur.rowcount == 0:
+                    return False
+        return True
+
+    def add_resume(self, email: str, entry: Dict[str, Any]) -> bool:
+        """Append to the user's résumé list without touching anything else."""
+        conn = self._conn()
+        try:
+            with conn:
+                conn.execute("INSERT INTO resumes (email, entry) VALUES (?, ?)",
+                             (email, json.dumps(entry)))
+        except sqlite3.IntegrityError:  # unknown user
+            return False
+        return True
+
+    def delete(self, email: str) -> bool:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("DELETE FROM users WHERE email = ?", (email,))
+        return cur.rowcount == 1
+
+    # -------- migration -----------------------------------------------
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """Import a users.json once; returns the number of users imported."""
+        if not os.path.exists(json_path):
+            return 0
+        conn = self._conn()
+        with conn:
+            # BEGIN IMMEDIATE so only one worker performs the import
+            conn.execute("BEGIN IMMEDIATE")
+            done = conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_from'").fetchone()
+            if done:
+                return 0
+            with open(json_path, "r") as fh:
+                users = json.load(fh)
+            for email, info in users.items():
+                info = dict(info)
+                resumes = info.pop("resumes", []) or []
+                cols = {k: info.pop(k, None) for k in _COLUMNS}
+                conn.execute(
+                    "INSERT OR IGNORE INTO users (email, name, password, role, extra) VALUES (?, ?, ?, ?, ?)",
+                    (email, cols["name"], cols["password"], cols["role"] or "user", json.dumps(info)))
+                conn.executemany("INSERT INTO resumes (email, entry) VALUES (?, ?)",
+                                 [(email, json.dumps(r)) for r in resumes])
+            conn.execute("INSERT INTO meta VALUES ('migrated_from', ?)", (os.path.abspath(json_path),))
+        return len(users)
@@ -0,0 +1,125 @@
+# workspace.py  – one private output directory per generation
+# -------------------------------------------------------------------
+# Every /generate call gets its own ``workspaces/<uuid>/`` tree instead
+# of the shared uploads/, generated_portfolio/ and zips/ files, so two
+# users (or two gunicorn workers) can never overwrite each other.
+#
+#   workspaces/<id>/uploads/   original PDF + cleaned_resume.txt/.pdf
+#   workspaces/<id>/site/      rendered pages + profile photo
+#
+# (portfolio.zip is streamed from site/ on download, never stored.)
+#
+# Old workspaces are garbage-collected by age first and then, oldest
+# first, until the whole tree fits the size quota.
+
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+__all__ = ["Workspace", "WorkspaceManager"]
+
+_ID_RX = re.compile(r"^[0-9a-f]{32}$")
+
+
+@dataclass(frozen=True)
+class Workspace:
+    id: str
+    root: str
+
+    @property
+    def upload_dir(self) -> str:
+        return os.path.join(self.root, "uploads")
+
+    @property
+    def site_dir(self) -> str:
+        return os.path.join(self.root, "site")
+
+    @property
+    def cleaned_txt(self) -> str:
+        return os.path.join(self.upload_dir, "cleaned_resume.txt")
+
+    @property
+    def cleaned_pdf(self) -> str:
+        return os.path.join(self.upload_dir, "cleaned_resume.pdf")
+
+    def folders(self) -> dict:
+        """Keyword arguments for portfolio_pipeline.generate_portfolio."""
+        return {"upload_folder": self.upload_dir, "generated_folder": self.site_dir}
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            total += _tree_size(entry.path)
+        else:
+            total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+class WorkspaceManager:
+    def __init__(self, root: str = "workspaces", *, max_age: float = 24 * 3600,
+                 max_bytes: int = 512 * 1024 * 1024, gc_interval: float = 300):
+        self.root = root
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.gc_interval = gc_interval
+        self._last_gc = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def create(self) -> Workspace:
+        self.maybe_gc()
+        ws_id = uuid.uuid4().hex
+        ws = Workspace(ws_id, os.path.join(self.root, ws_id))
+        os.makedirs(ws.upload_dir)
+        os.makedirs(ws.site_dir)
+        return ws
+
+    def get(self, ws_id: str | None) -> Workspace | None:
+        """Look up a workspace by id (as stored in the session) and mark it as used."""
+        if not ws_id or not _ID_RX.match(ws_id):
+            return None
+        root = os.path.join(self.root, ws_id)
+        if not os.path.isdir(root):
+            return None
+        os.utime(root)
+        return Workspace(ws_id, root)
+
+    # -------- garbage collection --------------------------------------
+
+    def maybe_gc(self) -> None:
+        if time.time() - self._last_gc >= self.gc_interval:
+            self.gc()
+
+    def gc(self) -> int:
+        """Remove expired workspaces, then the oldest ones until under quota."""
+        with self._lock:
+            self._last_gc = now = time.time()
+            entries = []
+            for entry in os.scandir(self.root):
+                if entry.is_dir() and _ID_RX.match(entry.name):
+                    entries.append((entry.stat().st_mtime, entry.path))
+            entries.sort()
+
+            removed = 0
+            keep = []
+            for mtime, path in entries:
+                if now - mtime > self.max_age:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+                else:
+                    keep.append((path, _tree_size(path)))
+
+            total = sum(size for _, size in keep)
+            for path, size in keep:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+                removed += 1
+            return removed
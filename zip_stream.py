@@ -0,0 +1,101 @@
+# zip_stream.py  – build ZIP archives straight from memory
+# -------------------------------------------------------------------
+# iter_zip() yields the archive in chunks while it is being written, so
+# an HTTP response can start sending before the last entry is
+# compressed and nothing is staged on disk.  spool_zip() is the variant
+# for callers that need a seekable file (e.g. a Content-Length): small
+# archives stay in memory, larger ones roll over to a temp file.
+#
+# Entries are ``(arcname, data)`` where data is bytes, str or a
+# filesystem path (os.PathLike).  Already-compressed formats are stored,
+# everything else is deflated.
+
+import io
+import os
+import tempfile
+import time
+import zipfile
+from typing import Iterable, Iterator, Tuple, Union
+
+__all__ = ["compression_for", "iter_zip", "spool_zip", "write_zip"]
+
+EntryData = Union[bytes, str, os.PathLike]
+
+STORED_EXTENSIONS = {
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif",
+    ".zip", ".gz", ".br", ".pdf", ".woff", ".woff2", ".mp4",
+}
+
+
+def compression_for(arcname: str) -> int:
+    """ZIP_STORED for formats that are already compressed, else ZIP_DEFLATED."""
+    ext = os.path.splitext(arcname)[1].lower()
+    return zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable buffer that zipfile streams into."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts: list[bytes] = []
+        self.pending = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._parts.append(bytes(b))
+        self.pending += len(b)
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        self.pending = 0
+        return data
+
+
+def _add(zf: zipfile.ZipFile, arcname: str, data: EntryData) -> None:
+    compress = compression_for(arcname)
+    if isinstance(data, os.PathLike):
+        zf.write(os.fspath(data), arcname, compress_type=compress)
+        return
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    info.compress_type = compress
+    info.external_attr = 0o644 << 16
+    zf.writestr(info, data)
+
+
+def _write_all(fileobj, entries: Iterable[Tuple[str, EntryData]]) -> None:
+    with zipfile.ZipFile(fileobj, "w") as zf:
+        for arcname, data in entries:
+            _add(zf, arcname, data)
+
+
+def iter_zip(entries: Iterable[Tuple[str, EntryData]], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the ZIP archive of ``entries`` in chunks of roughly ``chunk_size``."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w") as zf:
+        for arcname, data in entries:
+            _add(zf, arcname, data)
+            if sink.pending >= chunk_size:
+                yield sink.drain()
+    tail = sink.drain()     # central directory, written on close
+    if tail:
+        yield tail
+
+
+def spool_zip(entries: Iterable[Tuple[str, EntryData]], max_memory: int = 8 * 1024 * 1024):
+    """Build the archive into a SpooledTemporaryFile, rewound and ready to read."""
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    _write_all(spool, entries)
+    spool.seek(0)
+    return spool
+
+
+def write_zip(path: str, entries: Iterable[Tuple[str, EntryData]]) -> str:
+    """Write the archive of ``entries`` to ``path`` in one pass."""
+    with open(path, "wb") as fh:
+        _write_all(fh, entries)
+    return path